@@ -0,0 +1,88 @@
+""" convex_hull_benchmark.py file
+    compare ConvexHull methods on random points
+
+    usage: python benchmarks/convex_hull_benchmark.py [max_size]
+"""
+import random
+import sys
+import time
+
+from pyrusgeom.convex_hull import ConvexHull, MethodType
+from pyrusgeom.vector_2d import Vector2D
+
+METHODS = [MethodType.WRAPPING_METHOD, MethodType.GRAHAN_SCAN, MethodType.MONOTONE_CHAIN,
+           MethodType.AKL_TOUSSAINT]
+TIME_LIMIT = 10.0  # a method slower than this is skipped for larger sizes
+
+
+def random_points(size: int, seed: int = 0) -> list:
+    """create random points in the pitch
+
+    Args:
+        size (int): number of points
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        list: list of Vector2D
+    """
+    rng = random.Random(seed)
+    return [Vector2D(rng.uniform(-52.5, 52.5), rng.uniform(-34.0, 34.0)) for _ in range(size)]
+
+
+def noisy_points(size: int, seed: int = 0) -> list:
+    """create normally distributed points around a predicted position
+
+    Args:
+        size (int): number of points
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        list: list of Vector2D
+    """
+    rng = random.Random(seed)
+    return [Vector2D(rng.gauss(10.0, 3.0), rng.gauss(-5.0, 1.5)) for _ in range(size)]
+
+
+def measure(points: list, m_type: MethodType) -> tuple:
+    """compute the hull and measure the elapsed time
+
+    Args:
+        points (list): input points. copied before every run
+        m_type (MethodType): the specified method id
+
+    Returns:
+        tuple: (elapsed seconds, number of hull vertices)
+    """
+    hull = ConvexHull(list(points))
+    start = time.perf_counter()
+    hull.compute(m_type)
+    return time.perf_counter() - start, len(hull.vertices())
+
+
+def main(max_size: int = 100000) -> None:
+    """run the benchmark and print a table
+
+    Args:
+        max_size (int, optional): largest number of points. Defaults to 100000.
+    """
+    sizes = [size for size in (100, 1000, 10000, 100000, 1000000) if size <= max_size]
+    for name, generator in (('uniform', random_points), ('noisy', noisy_points)):
+        skipped = set()
+        print(name)
+        print(f"{'points':>8} " + " ".join(f"{m_type.name:>16}" for m_type in METHODS))
+        for size in sizes:
+            points = generator(size)
+            row = []
+            for m_type in METHODS:
+                if m_type in skipped:
+                    row.append(f"{'skipped':>16}")
+                    continue
+                elapsed, _ = measure(points, m_type)
+                if elapsed > TIME_LIMIT:
+                    skipped.add(m_type)
+                row.append(f"{elapsed:>15.4f}s")
+            print(f"{size:>8} " + " ".join(row))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
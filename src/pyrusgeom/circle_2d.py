@@ -334,3 +334,35 @@ def quadratic_f(qf_a: float, qf_b: float, qf_c: float) -> list[float]:
         sol1 = (-qf_b + delta) / (2.0 * qf_a)
         sol2 = (-qf_b - delta) / (2.0 * qf_a)
         return [sol1, sol2]
+
+
+def in_circum_circle(p_x: float, p_y: float, a_x: float, a_y: float,
+                     b_x: float, b_y: float, c_x: float, c_y: float) -> float:
+    """in-circle determinant of point (p_x, p_y) and triangle a-b-c
+
+    same test as Circle2D.circum_circle_contains without creating any
+    Vector2D and without the thin triangle threshold.
+
+    Args:
+        p_x (float): point x
+        p_y (float): point y
+        a_x (float): triangle's 1st vertex x
+        a_y (float): triangle's 1st vertex y
+        b_x (float): triangle's 2nd vertex x
+        b_y (float): triangle's 2nd vertex y
+        c_x (float): triangle's 3rd vertex x
+        c_y (float): triangle's 3rd vertex y
+
+    Returns:
+        float: positive if the point is inside the circum circle of the counter
+            clockwise triangle, negative if outside, 0 if on the circle
+    """
+    ad_x = a_x - p_x
+    ad_y = a_y - p_y
+    bd_x = b_x - p_x
+    bd_y = b_y - p_y
+    cd_x = c_x - p_x
+    cd_y = c_y - p_y
+    return ((ad_x * ad_x + ad_y * ad_y) * (bd_x * cd_y - cd_x * bd_y)
+            + (bd_x * bd_x + bd_y * bd_y) * (cd_x * ad_y - ad_x * cd_y)
+            + (cd_x * cd_x + cd_y * cd_y) * (ad_x * bd_y - bd_x * ad_y))
@@ -1,16 +1,23 @@
 """ convex_hull.py file
     ConvexHull: class name
+    IncrementalConvexHull: class name
+    Convex hull of a point set, rebuilt in O(n log n) (ConvexHull) or
+    updated point by point (IncrementalConvexHull: O(log h) rejection of
+    interior points, O(h) worst case for a hull changing insertion)
 """
 from __future__ import annotations
 from enum import Enum, unique, auto
+import bisect
 import functools
 import math
 
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.size_2d import Size2D
 from pyrusgeom.triangle_2d import Triangle2D
 from pyrusgeom.polygon_2d import Polygon2D
-from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.vector_2d import Vector2D, to_coords, unique_points
 from pyrusgeom.segment_2d import Segment2D
-from pyrusgeom.math_values import EPSILON
+from pyrusgeom.math_values import EPSILON, RAD2DEG
 
 
 @unique
@@ -20,26 +27,42 @@ class MethodType(Enum):
             DIRECT_METHOD: don't use it need fixing
             WRAPPING_METHOD
             GRAHAN_SCAN
+            MONOTONE_CHAIN: Andrew's monotone chain, O(n log n)
+            AKL_TOUSSAINT: extreme point octagon filter + monotone chain
     """
     DIRECT_METHOD = auto()
     WRAPPING_METHOD = auto()
     GRAHAN_SCAN = auto()
+    MONOTONE_CHAIN = auto()
+    AKL_TOUSSAINT = auto()
 
 
 def list2set(list_: list) -> list:
     """function to convert a list to a set with unique values
 
+    hashable items are checked by a hash set in linear time. other items
+    fall back to the linear search.
+    use vector_2d.unique_points() for tolerant equality of points.
+
     Args:
         list_ (list): list with duplicate items
 
     Returns:
-        list: a set with unique values
+        list: a set with unique values, in the input order
     """
     sub = []
+    seen = set()
+    unhashable = []
     for item in list_:
-        # check if exists in sub or not
-        if item not in sub:
-            sub.append(item)
+        try:
+            if item in seen:
+                continue
+            seen.add(item)
+        except TypeError:
+            if item in unhashable:
+                continue
+            unhashable.append(item)
+        sub.append(item)
     return sub
 
 # Base for angle_sort_predicate
@@ -118,11 +141,208 @@ def is_clockwise(point0: Vector2D, point1: Vector2D, point2: Vector2D) -> bool:
     return area < 0.0 or (area < EPSILON and point0.dist2(point1) > point0.dist2(point2))
 
 
+def monotone_chain_indices(coords: list[tuple]) -> list[int]:
+    """Andrew's monotone chain method on a coordinate list
+
+    the input is not modified; only an index list is sorted.
+
+    Args:
+        coords (list[tuple]): list of (x, y)
+
+    Returns:
+        list[int]: indices of the hull vertices in counter clockwise order
+            starting from the minimum coordinate point. collinear points are not included.
+    """
+    point_size = len(coords)
+    if point_size < 3:
+        return []
+
+    order = sorted(range(point_size), key=coords.__getitem__)
+
+    lower = []
+    upper = []
+    for i in order:
+        p_x, p_y = coords[i]
+        while len(lower) >= 2:
+            a_x, a_y = coords[lower[-2]]
+            b_x, b_y = coords[lower[-1]]
+            if (b_x - a_x) * (p_y - a_y) - (b_y - a_y) * (p_x - a_x) > 0.0:
+                break
+            lower.pop()
+        lower.append(i)
+        while len(upper) >= 2:
+            a_x, a_y = coords[upper[-2]]
+            b_x, b_y = coords[upper[-1]]
+            if (b_x - a_x) * (p_y - a_y) - (b_y - a_y) * (p_x - a_x) < 0.0:
+                break
+            upper.pop()
+        upper.append(i)
+
+    hull = lower[:-1] + upper[:0:-1]
+    if len(hull) == 2 and coords[hull[0]] == coords[hull[1]]:
+        hull.pop()
+    return hull
+
+
+def graham_scan_indices(coords: list[tuple]) -> list[int]:
+    """Graham scan method on a coordinate list
+
+    the input is not modified; an index list is sorted by angle around
+    the minimum coordinate point.
+
+    Args:
+        coords (list[tuple]): list of (x, y)
+
+    Returns:
+        list[int]: indices of the hull vertices in counter clockwise order
+            starting from the minimum coordinate point. collinear points are not included.
+    """
+    point_size = len(coords)
+    if point_size < 3:
+        return []
+
+    base = min(range(point_size), key=coords.__getitem__)
+    b_x, b_y = coords[base]
+
+    def compare(i: int, j: int) -> int:
+        i_x = coords[i][0] - b_x
+        i_y = coords[i][1] - b_y
+        j_x = coords[j][0] - b_x
+        j_y = coords[j][1] - b_y
+        area = i_x * j_y - i_y * j_x
+        if area > 0.0:
+            return -1
+        if area < 0.0:
+            return 1
+        d_i = i_x * i_x + i_y * i_y
+        d_j = j_x * j_x + j_y * j_y
+        return -1 if d_i < d_j else 1 if d_i > d_j else 0
+
+    order = [i for i in range(point_size) if coords[i] != coords[base]]
+    order.sort(key=functools.cmp_to_key(compare))
+
+    hull = [base]
+    for i in order:
+        p_x, p_y = coords[i]
+        while len(hull) >= 2:
+            a_x, a_y = coords[hull[-2]]
+            b_x, b_y = coords[hull[-1]]
+            if (b_x - a_x) * (p_y - a_y) - (b_y - a_y) * (p_x - a_x) > 0.0:
+                break
+            hull.pop()
+        hull.append(i)
+    if len(hull) == 1:
+        return []
+    return hull
+
+
+def akl_toussaint_indices(coords: list[tuple]) -> list[int]:
+    """Akl-Toussaint heuristic on a coordinate list
+
+    the extreme points in x, y, x + y and x - y make an octagon inside the
+    hull. points strictly inside it are dropped in one pass, and only the
+    remaining points are sorted by the monotone chain method. for dense
+    point clouds almost all points are dropped before sorting.
+
+    Args:
+        coords (list[tuple]): list of (x, y)
+
+    Returns:
+        list[int]: indices of the hull vertices in counter clockwise order
+            starting from the minimum coordinate point. collinear points are not included.
+    """
+    point_size = len(coords)
+    if point_size < 3:
+        return []
+
+    extremes = [0] * 8  # min x, min x+y, min y, max x-y, max x, max x+y, max y, min x-y
+    values = [math.inf, math.inf, math.inf, -math.inf, -math.inf, -math.inf, -math.inf, math.inf]
+    for i, (p_x, p_y) in enumerate(coords):
+        if p_x < values[0]:
+            values[0] = p_x
+            extremes[0] = i
+        if p_x > values[4]:
+            values[4] = p_x
+            extremes[4] = i
+        if p_y < values[2]:
+            values[2] = p_y
+            extremes[2] = i
+        if p_y > values[6]:
+            values[6] = p_y
+            extremes[6] = i
+        p_s = p_x + p_y
+        if p_s < values[1]:
+            values[1] = p_s
+            extremes[1] = i
+        if p_s > values[5]:
+            values[5] = p_s
+            extremes[5] = i
+        p_d = p_x - p_y
+        if p_d > values[3]:
+            values[3] = p_d
+            extremes[3] = i
+        if p_d < values[7]:
+            values[7] = p_d
+            extremes[7] = i
+
+    octagon = []
+    for i in extremes:
+        if not octagon or (coords[i] != octagon[-1] and coords[i] != octagon[0]):
+            octagon.append(coords[i])
+    if len(octagon) < 3:
+        return monotone_chain_indices(coords)
+
+    # (origin x, origin y, edge x, edge y) of each edge, padded to 8 edges
+    edges = []
+    for i, (a_x, a_y) in enumerate(octagon):
+        b_x, b_y = octagon[(i + 1) % len(octagon)]
+        edges.append((a_x, a_y, b_x - a_x, b_y - a_y))
+    edges += [edges[0]] * (8 - len(edges))
+    ((a0x, a0y, e0x, e0y), (a1x, a1y, e1x, e1y), (a2x, a2y, e2x, e2y), (a3x, a3y, e3x, e3y),
+     (a4x, a4y, e4x, e4y), (a5x, a5y, e5x, e5y), (a6x, a6y, e6x, e6y), (a7x, a7y, e7x, e7y)) = edges
+
+    candidates = [i for i, (p_x, p_y) in enumerate(coords)
+                  if not (e0x * (p_y - a0y) - e0y * (p_x - a0x) > 0.0
+                          and e1x * (p_y - a1y) - e1y * (p_x - a1x) > 0.0
+                          and e2x * (p_y - a2y) - e2y * (p_x - a2x) > 0.0
+                          and e3x * (p_y - a3y) - e3y * (p_x - a3x) > 0.0
+                          and e4x * (p_y - a4y) - e4y * (p_x - a4x) > 0.0
+                          and e5x * (p_y - a5y) - e5y * (p_x - a5x) > 0.0
+                          and e6x * (p_y - a6y) - e6y * (p_x - a6x) > 0.0
+                          and e7x * (p_y - a7y) - e7y * (p_x - a7x) > 0.0)]
+
+    hull = monotone_chain_indices([coords[i] for i in candidates])
+    return [candidates[i] for i in hull]
+
+
+def convex_hull_indices(points, m_type: MethodType = MethodType.MONOTONE_CHAIN) -> list[int]:
+    """compute convex hull vertex indices without creating any Vector2D
+
+    Args:
+        points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+        m_type (MethodType): GRAHAN_SCAN, MONOTONE_CHAIN or AKL_TOUSSAINT.
+            Defaults to MONOTONE_CHAIN.
+
+    Returns:
+        list[int]: indices of the hull vertices in counter clockwise order
+            starting from the minimum coordinate point
+    """
+    coords = to_coords(points)
+    if m_type == MethodType.GRAHAN_SCAN:
+        return graham_scan_indices(coords)
+    if m_type == MethodType.MONOTONE_CHAIN:
+        return monotone_chain_indices(coords)
+    if m_type == MethodType.AKL_TOUSSAINT:
+        return akl_toussaint_indices(coords)
+    raise Exception(f"convex_hull_indices: unsupported method {m_type}")
+
+
 class ConvexHull:
     """ handling the Convex Hull in SS2D
     Attributes:
         _input_points: input points
         _vertices: vertices of convex hull [counter clockwise order]
+        _vertex_indices: indices of _vertices in _input_points
         _edges: edges of convex hull
     """
 
@@ -139,6 +359,7 @@ class ConvexHull:
         """
         self._input_points = point_list
         self._vertices = []
+        self._vertex_indices = []
         self._edges = []
 
     def clear(self) -> None:
@@ -151,6 +372,7 @@ class ConvexHull:
         """clear result variables.
         """
         self._vertices.clear()
+        self._vertex_indices.clear()
         self._edges.clear()
 
     def add_point(self, point: Vector2D) -> None:
@@ -170,11 +392,28 @@ class ConvexHull:
         for point in points:
             self._input_points.append(point)
 
+    def remove_duplicate_points(self, tolerance: float = 0.0) -> ConvexHull:
+        """remove duplicated input points in linear time and returns a reference to itself
+
+        the input point container is replaced by a new list, so the list
+        given by the caller is not modified.
+
+        Args:
+            tolerance (float, optional): snapping distance. Defaults to 0.0 (exact equality).
+
+        Returns:
+            ConvexHull: return itself
+        """
+        self._input_points = unique_points(self._input_points, tolerance)
+        return self
+
     def compute(self, m_type: MethodType = MethodType.WRAPPING_METHOD) -> None:
         """generate convex hull by specified method
             DIRECT_METHOD: don't use it need fixing
             WRAPPING_METHOD
             GRAHAN_SCAN
+            MONOTONE_CHAIN
+            AKL_TOUSSAINT
         Args:
             m_type(MethodType):the specified method id
 
@@ -185,6 +424,10 @@ class ConvexHull:
             self.compute_graham_scan()
         elif m_type == MethodType.WRAPPING_METHOD:
             self.compute_wrapping_method()
+        elif m_type == MethodType.MONOTONE_CHAIN:
+            self.compute_monotone_chain()
+        elif m_type == MethodType.AKL_TOUSSAINT:
+            self.compute_akl_toussaint()
 
     def input_points(self) -> list:
         """get a copy list from the input point container
@@ -220,6 +463,24 @@ class ConvexHull:
         """
         return self._vertices
 
+    def vertex_indices(self) -> list[int]:
+        """get a copy list of the input point indices of the vertices
+
+        not available for DIRECT_METHOD.
+
+        Returns:
+            list[int]: index in the input points of each vertex
+        """
+        return self._vertex_indices.copy()
+
+    def vertex_indices_(self) -> list[int]:
+        """ get the reference and og list to the vertex index container
+
+        Returns:
+            list[int]: a reference to the vertex index container
+        """
+        return self._vertex_indices
+
     def edges(self) -> list:
         """get a copy list from the edge container
 
@@ -316,9 +577,10 @@ class ConvexHull:
         if point_size < 3 or min_index == -1:
             return
 
-        vertices_index = []  # temporal set for checking already used vertices.
+        vertices_index = set()  # temporal set for checking already used vertices.
 
         self._vertices.append(self._input_points[min_index])
+        self._vertex_indices.append(min_index)
 
         current_index = min_index
         current_point:Vector2D = self._input_points[min_index]
@@ -348,8 +610,9 @@ class ConvexHull:
                     candidate = i
             current_index = candidate
             current_point = self._input_points[current_index]
-            vertices_index.append(current_index)
+            vertices_index.add(current_index)
             self._vertices.append(current_point)
+            self._vertex_indices.append(current_index)
 
             if current_index == min_index:
                 break
@@ -359,42 +622,57 @@ class ConvexHull:
                     Segment2D(self._vertices[i], self._vertices[i + 1]))
 
         self._vertices.pop()
+        self._vertex_indices.pop()
 
     def compute_graham_scan(self):
         """Graham scan method
+
+        an index list is sorted instead of the input points, so the input
+        order is kept.
         """
         self.clear_results()
 
-        point_size = len(self._input_points)
-        min_index = self.get_min_point_index()
+        coords = [(point.x(), point.y()) for point in self._input_points]
+        self.set_vertices_by_indices(graham_scan_indices(coords))
 
-        if point_size < 3 or min_index == -1:
-            return
+    def compute_monotone_chain(self):
+        """Andrew's monotone chain method
 
-        self.sort_points_angle_from(min_index)
+        points are sorted once by a plain (x, y) tuple key, and the lower and
+        upper chains are built in the same pass. collinear points are not
+        included. vertices start from the minimum coordinate point in
+        counterclockwise order, same as the wrapping method.
+        """
+        self.clear_results()
 
-        self._vertices = self._input_points
+        coords = [(point.x(), point.y()) for point in self._input_points]
+        self.set_vertices_by_indices(monotone_chain_indices(coords))
 
-        top = 1
-        for i in range(2, point_size):
-            while not is_clockwise(self._vertices[top - 1],
-                self._vertices[top], self._input_points[i]):
-                top -= 1
+    def compute_akl_toussaint(self):
+        """Akl-Toussaint method
 
-            top += 1
-            tmp = self._vertices[top]
-            self._vertices[top] = self._vertices[i]
-            self._vertices[i] = tmp
+        points inside the extreme point octagon are dropped before the
+        monotone chain method. the result is the same as MONOTONE_CHAIN.
+        """
+        self.clear_results()
 
-        top += 1
+        coords = [(point.x(), point.y()) for point in self._input_points]
+        self.set_vertices_by_indices(akl_toussaint_indices(coords))
 
-        del self._vertices[top:len(self._vertices)]
+    def set_vertices_by_indices(self, indices: list[int]) -> None:
+        """set vertices and edges from hull vertex indices
 
-        for i in range(len(self._vertices)):
-            if self._vertices[i] != self._vertices[-1]:
-                self._edges.append(
-                    Segment2D(self._vertices[i], self._vertices[i + 1]))
-        self._edges.append(Segment2D(self._vertices[0], self._vertices[-1]))
+        Args:
+            indices (list[int]): input point indices in counter clockwise order
+        """
+        self._vertex_indices = indices
+        self._vertices = [self._input_points[i] for i in indices]
+        self._edges = []
+        vertex_size = len(self._vertices)
+        if vertex_size > 1:
+            for i in range(vertex_size):
+                self._edges.append(Segment2D(self._vertices[i],
+                                             self._vertices[(i + 1) % vertex_size]))
 
     def get_min_point_index(self) -> int:
         """get the index of minimum coordinate point
@@ -441,6 +719,177 @@ class ConvexHull:
         """
         return Polygon2D(self._vertices)
 
+    def diameter(self) -> Segment2D:
+        """get the farthest vertex pair by rotating calipers in O(h)
+
+        compute() must be called before.
+
+        Returns:
+            Segment2D: segment between the farthest vertices.
+                invalid segment if there are less than 2 vertices
+        """
+        vertices = self._vertices
+        size = len(vertices)
+        if size == 0:
+            return Segment2D()
+        if size == 1:
+            return Segment2D(vertices[0], vertices[0])
+
+        coords = [(v.x(), v.y()) for v in vertices]
+        best = -1.0
+        best_pair = (0, 0)
+        j = 1
+        for i in range(size):
+            a_x, a_y = coords[i]
+            n_i = (i + 1) % size
+            e_x = coords[n_i][0] - a_x
+            e_y = coords[n_i][1] - a_y
+            while True:
+                n_j = (j + 1) % size
+                if (e_x * (coords[n_j][1] - a_y) - e_y * (coords[n_j][0] - a_x)
+                        <= e_x * (coords[j][1] - a_y) - e_y * (coords[j][0] - a_x)):
+                    break
+                j = n_j
+            for k in (i, n_i):
+                d_x = coords[j][0] - coords[k][0]
+                d_y = coords[j][1] - coords[k][1]
+                dist2 = d_x * d_x + d_y * d_y
+                if dist2 > best:
+                    best = dist2
+                    best_pair = (k, j)
+        return Segment2D(vertices[best_pair[0]], vertices[best_pair[1]])
+
+    def min_width(self) -> Segment2D:
+        """get the minimum width of the hull by rotating calipers in O(h)
+
+        compute() must be called before.
+
+        Returns:
+            Segment2D: segment from the foot point on the supporting edge line
+                to the farthest vertex from that edge. its length is the width.
+                invalid segment if there are less than 3 vertices
+        """
+        vertices = self._vertices
+        size = len(vertices)
+        if size == 0:
+            return Segment2D()
+        if size < 3:
+            return Segment2D(vertices[0], vertices[0])
+
+        coords = [(v.x(), v.y()) for v in vertices]
+        best = -1.0
+        best_pair = (0, 0)
+        j = 1
+        for i in range(size):
+            a_x, a_y = coords[i]
+            n_i = (i + 1) % size
+            e_x = coords[n_i][0] - a_x
+            e_y = coords[n_i][1] - a_y
+            while True:
+                n_j = (j + 1) % size
+                if (e_x * (coords[n_j][1] - a_y) - e_y * (coords[n_j][0] - a_x)
+                        <= e_x * (coords[j][1] - a_y) - e_y * (coords[j][0] - a_x)):
+                    break
+                j = n_j
+            width = ((e_x * (coords[j][1] - a_y) - e_y * (coords[j][0] - a_x))
+                     / math.sqrt(e_x * e_x + e_y * e_y))
+            if best < 0.0 or width < best:
+                best = width
+                best_pair = (i, j)
+
+        i, j = best_pair
+        a_x, a_y = coords[i]
+        e_x = coords[(i + 1) % size][0] - a_x
+        e_y = coords[(i + 1) % size][1] - a_y
+        p_x, p_y = coords[j]
+        rate = ((p_x - a_x) * e_x + (p_y - a_y) * e_y) / (e_x * e_x + e_y * e_y)
+        return Segment2D(Vector2D(a_x + e_x * rate, a_y + e_y * rate), vertices[j])
+
+    def min_area_rect(self) -> tuple[Vector2D, Size2D, AngleDeg]:
+        """get the minimum area enclosing rectangle by rotating calipers in O(h)
+
+        compute() must be called before.
+
+        Returns:
+            tuple[Vector2D, Size2D, AngleDeg]: center, size and rotation of the rectangle.
+                length of the size is measured along the rotation angle.
+        """
+        return self.min_enclosing_rect(False)
+
+    def min_perimeter_rect(self) -> tuple[Vector2D, Size2D, AngleDeg]:
+        """get the minimum perimeter enclosing rectangle by rotating calipers in O(h)
+
+        compute() must be called before.
+
+        Returns:
+            tuple[Vector2D, Size2D, AngleDeg]: center, size and rotation of the rectangle.
+                length of the size is measured along the rotation angle.
+        """
+        return self.min_enclosing_rect(True)
+
+    def min_enclosing_rect(self, perimeter: bool) -> tuple[Vector2D, Size2D, AngleDeg]:
+        """get the minimum enclosing rectangle having one side on a hull edge
+
+        Args:
+            perimeter (bool): minimize the perimeter if True, else the area
+
+        Returns:
+            tuple[Vector2D, Size2D, AngleDeg]: center, size and rotation of the rectangle
+        """
+        vertices = self._vertices
+        size = len(vertices)
+        if size == 0:
+            return Vector2D.invalid(), Size2D(), AngleDeg()
+        if size == 1:
+            return vertices[0].copy(), Size2D(), AngleDeg()
+
+        coords = [(v.x(), v.y()) for v in vertices]
+        best = -1.0
+        result = None
+        right = 1
+        top = 1
+        left = 1
+        for i in range(size):
+            a_x, a_y = coords[i]
+            n_i = (i + 1) % size
+            u_x = coords[n_i][0] - a_x
+            u_y = coords[n_i][1] - a_y
+            length = math.sqrt(u_x * u_x + u_y * u_y)
+            u_x /= length
+            u_y /= length
+
+            def along(k: int) -> float:
+                return (coords[k][0] - a_x) * u_x + (coords[k][1] - a_y) * u_y
+
+            def normal(k: int) -> float:
+                return (coords[k][1] - a_y) * u_x - (coords[k][0] - a_x) * u_y
+
+            while along((right + 1) % size) > along(right):
+                right = (right + 1) % size
+            if i == 0:
+                top = right
+            while normal((top + 1) % size) > normal(top):
+                top = (top + 1) % size
+            if i == 0:
+                left = top
+            while along((left + 1) % size) < along(left):
+                left = (left + 1) % size
+
+            max_u = along(right)
+            min_u = along(left)
+            height = normal(top)
+            width = max_u - min_u
+            value = width + height if perimeter else width * height
+            if best < 0.0 or value < best:
+                best = value
+                center_u = (max_u + min_u) * 0.5
+                center_n = height * 0.5
+                result = (Vector2D(a_x + u_x * center_u - u_y * center_n,
+                                   a_y + u_y * center_u + u_x * center_n),
+                          Size2D(width, height),
+                          AngleDeg(math.atan2(u_y, u_x) * RAD2DEG))
+        return result
+
     def __repr__(self) -> str:
         """represent the convex hull as a string
 
@@ -450,6 +899,211 @@ class ConvexHull:
         return f"({self._vertices} , {self._edges})"
 
 
+class IncrementalConvexHull:
+    """ handling a convex hull updated point by point in SS2D
+
+    the hull is kept as lower and upper monotone chains sorted by (x, y).
+    a new point is located on both chains by binary search; an interior
+    point is rejected in O(log h) without touching the hull (h: number of
+    hull vertices). a hull point finds the chain vertices it hides in
+    amortized O(1) each, and replaces them by one slice assignment of the
+    python list. the slice assignment moves the following items, so a hull
+    changing insertion is O(h) in the worst case, with a small constant
+    because h is usually much smaller than the number of points.
+
+    Attributes:
+        _lower: lower chain, list of (x, y) sorted by (x, y)
+        _upper: upper chain, list of (x, y) sorted by (x, y)
+        _point_size: number of added points
+        _vertices: cached vertices [counter clockwise order] or None
+        _edges: cached edges or None
+    """
+
+    def __init__(self, point_list: list = None):
+        """This is the class init function and creates the convex hull.
+
+        Defualt:
+            create empty convex hull
+        OR
+            create convex hull with given points
+        Args:
+            point_list (list, optional): array of input points. Defaults to None.
+        """
+        self._lower = []
+        self._upper = []
+        self._point_size = 0
+        self._vertices = None
+        self._edges = None
+        if point_list is not None:
+            self.add_points(point_list)
+
+    def clear(self) -> None:
+        """clear all.
+        """
+        self._lower = []
+        self._upper = []
+        self._point_size = 0
+        self._vertices = None
+        self._edges = None
+
+    def add_point(self, point: Vector2D) -> bool:
+        """add a point and update the hull
+
+        Args:
+            point (Vector2D): point to add
+
+        Returns:
+            bool: True if the hull is changed
+        """
+        self._point_size += 1
+        coord = (point.x(), point.y())
+        changed_lower = IncrementalConvexHull.insert_chain(self._lower, coord, 1.0)
+        changed_upper = IncrementalConvexHull.insert_chain(self._upper, coord, -1.0)
+        if changed_lower or changed_upper:
+            self._vertices = None
+            self._edges = None
+            return True
+        return False
+
+    def add_points(self, points: list) -> None:
+        """add a point list and update the hull
+
+        Args:
+            points (list): points to add
+        """
+        for point in points:
+            self.add_point(point)
+
+    def point_size(self) -> int:
+        """get the number of added points
+
+        Returns:
+            int: number of added points
+        """
+        return self._point_size
+
+    def contains(self, point: Vector2D) -> bool:
+        """check if the point is inside or on the hull in O(log h)
+
+        Args:
+            point (Vector2D): considered point
+
+        Returns:
+            bool: True if contains
+        """
+        coord = (point.x(), point.y())
+        return (IncrementalConvexHull.chain_side(self._lower, coord, 1.0) and
+                IncrementalConvexHull.chain_side(self._upper, coord, -1.0))
+
+    def vertices(self) -> list[Vector2D]:
+        """get the hull vertices
+
+        Returns:
+            list[Vector2D]: vertices in counter clockwise order starting
+                from the minimum coordinate point
+        """
+        if self._vertices is None:
+            if len(self._lower) == 1:
+                coords = self._lower
+            else:
+                coords = self._lower[:-1] + self._upper[:0:-1]
+            self._vertices = [Vector2D(p_x, p_y) for p_x, p_y in coords]
+        return self._vertices.copy()
+
+    def edges(self) -> list[Segment2D]:
+        """get the hull edges
+
+        Returns:
+            list[Segment2D]: edges in counter clockwise order
+        """
+        if self._edges is None:
+            vertices = self.vertices()
+            size = len(vertices)
+            self._edges = []
+            if size > 1:
+                for i in range(size):
+                    self._edges.append(Segment2D(vertices[i], vertices[(i + 1) % size]))
+        return self._edges.copy()
+
+    def to_polygon(self) -> Polygon2D:
+        """create and get the convex hull polygon
+
+        Returs:
+            Polygon2D: a ploygon from the convex hull vertices
+        """
+        return Polygon2D(self.vertices())
+
+    @staticmethod
+    def insert_chain(chain: list, coord: tuple, sign: float) -> bool:
+        """insert a point into a monotone chain if it is a chain vertex
+
+        Args:
+            chain (list): chain of (x, y) sorted by (x, y)
+            coord (tuple): (x, y) of the new point
+            sign (float): 1.0 for the lower chain, -1.0 for the upper chain
+
+        Returns:
+            bool: True if the chain is changed
+        """
+        pos = bisect.bisect_left(chain, coord)
+        size = len(chain)
+        if pos < size and chain[pos] == coord:
+            return False
+        p_x, p_y = coord
+        if 0 < pos < size:
+            a_x, a_y = chain[pos - 1]
+            b_x, b_y = chain[pos]
+            if sign * ((b_x - a_x) * (p_y - a_y) - (b_y - a_y) * (p_x - a_x)) >= 0.0:
+                return False
+
+        # hidden vertices are chain[first:last]
+        first = pos
+        while first >= 2:
+            a_x, a_y = chain[first - 2]
+            b_x, b_y = chain[first - 1]
+            if sign * ((b_x - a_x) * (p_y - a_y) - (b_y - a_y) * (p_x - a_x)) > 0.0:
+                break
+            first -= 1
+        last = pos
+        while last + 1 < size:
+            b_x, b_y = chain[last]
+            c_x, c_y = chain[last + 1]
+            if sign * ((b_x - p_x) * (c_y - p_y) - (b_y - p_y) * (c_x - p_x)) > 0.0:
+                break
+            last += 1
+        chain[first:last] = [coord]
+        return True
+
+    @staticmethod
+    def chain_side(chain: list, coord: tuple, sign: float) -> bool:
+        """check if the point is on the inner side of a monotone chain
+
+        Args:
+            chain (list): chain of (x, y) sorted by (x, y)
+            coord (tuple): (x, y) of the point
+            sign (float): 1.0 for the lower chain, -1.0 for the upper chain
+
+        Returns:
+            bool: True if on the chain or on the inner side of it
+        """
+        pos = bisect.bisect_left(chain, coord)
+        if pos < len(chain) and chain[pos] == coord:
+            return True
+        if pos == 0 or pos == len(chain):
+            return False
+        a_x, a_y = chain[pos - 1]
+        b_x, b_y = chain[pos]
+        p_x, p_y = coord
+        return sign * ((b_x - a_x) * (p_y - a_y) - (b_y - a_y) * (p_x - a_x)) >= 0.0
+
+    def __repr__(self) -> str:
+        """represent the convex hull as a string
+
+        Returns:
+            str: contains vertices
+        """
+        return f"({self.vertices()})"
+
 # def test():
 #     point_list = [Vector2D(), Vector2D(1, 1), Vector2D(0, 1)]
 #     c = ConvexHull(point_list)
@@ -0,0 +1,161 @@
+""" decay_table.py file
+    DecayTable: class name
+    Cached powers and geometric series sums of a decay parameter
+"""
+from __future__ import annotations
+import math
+
+
+class DecayTable:
+    """ handling precomputed decay values
+
+    decay^n and the geometric series sum (1 - decay^n) / (1 - decay) are
+    kept for n = 0, 1, 2, ... and the table is extended when a larger step is
+    requested. the values are calculated by the same expressions as the
+    functions in soccer_math, so the results are exactly same.
+    use DecayTable.instance(decay) to share one table per decay parameter
+    (e.g. the ball decay and the decay of each player type).
+    the decay must be positive. if it is 1, the sum is n.
+
+    Attributes:
+        _decay: decay parameter
+        _pows: decay^n for each step n
+        _sums: (1 - decay^n) / (1 - decay) for each step n (n if decay is 1)
+        _log_decay: log(decay)
+    """
+    _instances: dict[float, DecayTable] = {}
+
+    def __init__(self, decay: float, max_step: int = 50):
+        """This is the class init function and creates the table.
+
+        Args:
+            decay (float): decay parameter. must be positive
+            max_step (int, optional): initial max step of the table. Defaults to 50.
+
+        Raises:
+            ValueError: decay is 0 or negative
+        """
+        if decay <= 0.0:
+            raise ValueError(f"DecayTable: decay must be positive, but {decay} is given")
+        self._decay = decay
+        self._pows: list[float] = []
+        self._sums: list[float] = []
+        self._log_decay = math.log(decay)
+        self.extend(max_step)
+
+    @staticmethod
+    def instance(decay: float) -> DecayTable:
+        """get the shared table of the decay parameter
+
+        Args:
+            decay (float): decay parameter
+
+        Returns:
+            DecayTable: cached table object
+        """
+        table = DecayTable._instances.get(decay)
+        if table is None:
+            table = DecayTable(decay)
+            DecayTable._instances[decay] = table
+        return table
+
+    @staticmethod
+    def clear_instances() -> None:
+        """drop all shared tables
+        """
+        DecayTable._instances.clear()
+
+    def extend(self, max_step: int) -> None:
+        """extend the table to max_step
+
+        Args:
+            max_step (int): new max step
+        """
+        decay = self._decay
+        for n_step in range(len(self._pows), max_step + 1):
+            decay_pow = math.pow(decay, n_step)
+            self._pows.append(decay_pow)
+            self._sums.append(float(n_step) if decay == 1.0
+                              else (1.0 - decay_pow) / (1.0 - decay))
+
+    def decay(self) -> float:
+        """get the decay parameter
+
+        Returns:
+            float: decay parameter
+        """
+        return self._decay
+
+    def max_step(self) -> int:
+        """get the current max step of the table
+
+        Returns:
+            int: max step
+        """
+        return len(self._pows) - 1
+
+    def pow(self, n_step: int) -> float:
+        """get decay^n_step
+
+        Args:
+            n_step (int): number of steps
+
+        Returns:
+            float: decay^n_step
+        """
+        pows = self._pows
+        if isinstance(n_step, int) and n_step >= 0:
+            if n_step >= len(pows):
+                self.extend(n_step)
+            return pows[n_step]
+        return math.pow(self._decay, n_step)
+
+    def sum(self, n_step: int) -> float:
+        """get the geometric series sum (1 - decay^n_step) / (1 - decay)
+
+        Args:
+            n_step (int): number of steps
+
+        Returns:
+            float: sum of decay^0 ... decay^(n_step - 1), n_step if decay is 1
+        """
+        sums = self._sums
+        if isinstance(n_step, int) and n_step >= 0:
+            if n_step >= len(sums):
+                self.extend(n_step)
+            return sums[n_step]
+        if self._decay == 1.0:
+            return float(n_step)
+        return (1.0 - math.pow(self._decay, n_step)) / (1.0 - self._decay)
+
+    def pows_(self) -> list[float]:
+        """get the reference to the power table
+
+        Returns:
+            list[float]: decay^n for n = 0 ... max_step
+        """
+        return self._pows
+
+    def sums_(self) -> list[float]:
+        """get the reference to the sum table
+
+        Returns:
+            list[float]: (1 - decay^n) / (1 - decay) for n = 0 ... max_step
+        """
+        return self._sums
+
+    def log_decay(self) -> float:
+        """get log(decay)
+
+        Returns:
+            float: log(decay)
+        """
+        return self._log_decay
+
+    def __repr__(self) -> str:
+        """represent the table as a string
+
+        Returns:
+            str: contains the decay and the max step
+        """
+        return f"(decay: {self._decay}, max_step: {self.max_step()})"
@@ -0,0 +1,660 @@
+""" delaunay_triangulation.py file
+    DelaunayTriangulation: class name
+    Incremental Delaunay triangulation of Vector2D sets
+"""
+from __future__ import annotations
+import math
+import random
+
+from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.circle_2d import in_circum_circle
+
+SUPER_SCALE = 1000.0  # distance of the super triangle vertices / size of the covered area
+MORTON_BITS = 10
+
+
+def morton_spread_table(bits: int) -> list[int]:
+    """create a table that spreads the bits of an integer to the even bits
+
+    Args:
+        bits (int): number of bits
+
+    Returns:
+        list[int]: spread value of each integer in [0, 2^bits)
+    """
+    table = []
+    for value in range(1 << bits):
+        spread = 0
+        for bit in range(bits):
+            if value & (1 << bit):
+                spread |= 1 << (2 * bit)
+        table.append(spread)
+    return table
+
+
+MORTON_SPREAD = morton_spread_table(MORTON_BITS)
+
+
+class DelaunayTriangulation:
+    """ handling an incremental Delaunay triangulation in SS2D
+
+    new vertices are located by walking from the last created triangle and
+    inserted by the Bowyer-Watson method: the triangles whose circum circle
+    contains the new vertex are removed through the triangle adjacency, and
+    the hole is filled with triangles sharing the new vertex.
+    add_vertices() inserts a batch in a biased randomized order sorted along
+    a Morton curve in each round, so the walks are short and the expected
+    time is O(n log n).
+
+    all vertices are inside a super triangle whose vertices are treated as
+    infinitely far points in the circum circle test, so the finite triangles
+    always cover the convex hull of the vertices.
+
+    vertex indices are the order of the added vertices. the super triangle
+    vertices have the indices -3, -2 and -1.
+
+    Attributes:
+        _vertices: added vertices
+        _index_map: (x, y) -> vertex index, to skip duplicated vertices
+        _xs: x coordinates of the super triangle vertices and the added vertices
+        _ys: y coordinates of the super triangle vertices and the added vertices
+        _tri_v: 3 vertex ids of each triangle in counter clockwise order
+        _tri_n: 3 neighbor triangle ids of each triangle. neighbor j is across
+            the edge opposite to vertex j, -1 if there is no neighbor
+        _tri_alive: True if the triangle is used
+        _free: removed triangle ids to reuse
+        _vertex_tri: a triangle id that uses each vertex
+        _last: last created triangle id, the start of the next walk
+        _bound: (min_x, min_y, max_x, max_y) covered by the super triangle or None
+        _super_dir: direction of each super triangle vertex
+    """
+
+    def __init__(self, points: list[Vector2D] = None):
+        """This is the class init function and creates the triangulation.
+
+        Defualt:
+            create an empty triangulation
+        OR
+            create a triangulation of given points
+        Args:
+            points (list[Vector2D], optional): vertices to add. Defaults to None.
+        """
+        self._vertices: list[Vector2D] = []
+        self._index_map: dict = {}
+        self._xs: list[float] = []
+        self._ys: list[float] = []
+        self._tri_v: list[int] = []
+        self._tri_n: list[int] = []
+        self._tri_alive: list[bool] = []
+        self._free: list[int] = []
+        self._vertex_tri: list[int] = []
+        self._last = -1
+        self._bound = None
+        self._super_dir = [(math.cos(angle), math.sin(angle))
+                           for angle in (math.pi * 0.5, math.pi * 7.0 / 6.0, math.pi * 11.0 / 6.0)]
+        if points is not None:
+            self.add_vertices(points)
+
+    def clear(self) -> None:
+        """clear all.
+        """
+        self._vertices = []
+        self._index_map = {}
+        self.clear_triangles()
+        self._bound = None
+
+    def clear_triangles(self) -> None:
+        """clear all triangles and the super triangle.
+        """
+        self._xs = []
+        self._ys = []
+        self._tri_v = []
+        self._tri_n = []
+        self._tri_alive = []
+        self._free = []
+        self._vertex_tri = []
+        self._last = -1
+
+    def add_vertex(self, point: Vector2D) -> int:
+        """add a vertex and update the triangulation
+
+        Args:
+            point (Vector2D): new vertex
+
+        Returns:
+            int: index of the vertex. index of the existing vertex if same point is already added
+        """
+        key = (point.x(), point.y())
+        index = self._index_map.get(key)
+        if index is not None:
+            return index
+
+        index = len(self._vertices)
+        self._vertices.append(point)
+        self._index_map[key] = index
+        if self._bound is None or not self.in_bound(key[0], key[1]):
+            self.rebuild()
+        else:
+            self._xs.append(key[0])
+            self._ys.append(key[1])
+            self._vertex_tri.append(-1)
+            self.insert(index + 3)
+        return index
+
+    def add_vertices(self, points: list[Vector2D]) -> list[int]:
+        """add vertices and update the triangulation
+
+        Args:
+            points (list[Vector2D]): new vertices
+
+        Returns:
+            list[int]: index of each vertex. index of the existing vertex for a duplicated point
+        """
+        result = []
+        new_ids = []
+        rebuild = self._bound is None
+        for point in points:
+            key = (point.x(), point.y())
+            index = self._index_map.get(key)
+            if index is None:
+                index = len(self._vertices)
+                self._vertices.append(point)
+                self._index_map[key] = index
+                new_ids.append(index + 3)
+                if not rebuild and not self.in_bound(key[0], key[1]):
+                    rebuild = True
+            result.append(index)
+
+        if rebuild:
+            self.rebuild()
+        else:
+            for vid in new_ids:
+                point = self._vertices[vid - 3]
+                self._xs.append(point.x())
+                self._ys.append(point.y())
+                self._vertex_tri.append(-1)
+            for vid in self.insertion_order(new_ids):
+                self.insert(vid)
+        return result
+
+    def vertices(self) -> list[Vector2D]:
+        """get a copy list of the vertices
+
+        Returns:
+            list[Vector2D]: vertices in the order of the indices
+        """
+        return self._vertices.copy()
+
+    def vertices_(self) -> list[Vector2D]:
+        """get the reference to the vertex container
+
+        Returns:
+            list[Vector2D]: vertices in the order of the indices
+        """
+        return self._vertices
+
+    def vertex_size(self) -> int:
+        """get the number of vertices
+
+        Returns:
+            int: number of vertices
+        """
+        return len(self._vertices)
+
+    def triangles(self) -> list[tuple[int, int, int]]:
+        """get the Delaunay triangles
+
+        Returns:
+            list[tuple[int, int, int]]: vertex indices of each triangle in counter clockwise order
+        """
+        result = []
+        tri_v = self._tri_v
+        for t, alive in enumerate(self._tri_alive):
+            if alive and tri_v[3 * t] >= 3 and tri_v[3 * t + 1] >= 3 and tri_v[3 * t + 2] >= 3:
+                result.append((tri_v[3 * t] - 3, tri_v[3 * t + 1] - 3, tri_v[3 * t + 2] - 3))
+        return result
+
+    def edges(self) -> list[tuple[int, int]]:
+        """get the Delaunay edges
+
+        Returns:
+            list[tuple[int, int]]: vertex index pairs (smaller index first)
+        """
+        result = []
+        tri_v = self._tri_v
+        tri_n = self._tri_n
+        for t, alive in enumerate(self._tri_alive):
+            if not alive:
+                continue
+            for j in range(3):
+                v_a = tri_v[3 * t + (j + 1) % 3]
+                v_b = tri_v[3 * t + (j + 2) % 3]
+                if v_a < 3 or v_b < 3:
+                    continue
+                # each edge is reported by the triangle with the smaller id
+                if tri_n[3 * t + j] == -1 or tri_n[3 * t + j] > t:
+                    result.append((min(v_a, v_b) - 3, max(v_a, v_b) - 3))
+        return result
+
+    def locate(self, point: Vector2D, hint: int = -1) -> int:
+        """find the triangle that contains the point by walking from the hint triangle
+
+        Args:
+            point (Vector2D): considered point
+            hint (int, optional): start triangle id. Defaults to -1 (last created triangle).
+
+        Returns:
+            int: triangle id that may use super triangle vertices. -1 if there is no triangle
+        """
+        if self._bound is None:
+            return -1
+        p_x = point.x()
+        p_y = point.y()
+        if not self.in_super_triangle(p_x, p_y):
+            return -1
+        return self.walk(p_x, p_y, hint)
+
+    def triangle(self, tri_id: int) -> tuple[int, int, int]:
+        """get vertex indices of a triangle id
+
+        Args:
+            tri_id (int): triangle id given by locate()
+
+        Returns:
+            tuple[int, int, int]: vertex indices in counter clockwise order.
+                negative values are super triangle vertices
+        """
+        base = 3 * tri_id
+        return (self._tri_v[base] - 3, self._tri_v[base + 1] - 3, self._tri_v[base + 2] - 3)
+
+    def find_triangle_contains(self, point: Vector2D) -> tuple:
+        """find the Delaunay triangle that contains the point
+
+        Args:
+            point (Vector2D): considered point
+
+        Returns:
+            tuple: vertex indices in counter clockwise order, None if the point is
+                outside the convex hull of the vertices
+        """
+        tri_id = self.locate(point)
+        if tri_id == -1:
+            return None
+        result = self.triangle(tri_id)
+        if result[0] < 0 or result[1] < 0 or result[2] < 0:
+            return None
+        return result
+
+    def find_nearest_vertex(self, point: Vector2D) -> int:
+        """find the nearest vertex by a greedy walk on the Delaunay edges
+
+        Args:
+            point (Vector2D): considered point
+
+        Returns:
+            int: vertex index. -1 if there is no vertex
+        """
+        if len(self._vertices) == 0:
+            return -1
+        p_x = point.x()
+        p_y = point.y()
+        xs = self._xs
+        ys = self._ys
+
+        if self.in_super_triangle(p_x, p_y):
+            tri_id = self.walk(p_x, p_y, -1)
+            candidates = [v for v in self._tri_v[3 * tri_id:3 * tri_id + 3] if v >= 3]
+        else:
+            candidates = [3]
+        best = -1
+        best_d2 = math.inf
+        for v in candidates:
+            d2 = (xs[v] - p_x) ** 2 + (ys[v] - p_y) ** 2
+            if d2 < best_d2:
+                best = v
+                best_d2 = d2
+
+        improved = True
+        while improved:
+            improved = False
+            for v in self.ring(best):
+                if v < 3:
+                    continue
+                d2 = (xs[v] - p_x) ** 2 + (ys[v] - p_y) ** 2
+                if d2 < best_d2:
+                    best = v
+                    best_d2 = d2
+                    improved = True
+                    break
+        return best - 3
+
+    def neighbor_vertices(self, index: int) -> list[int]:
+        """get vertices connected to a vertex by Delaunay edges
+
+        Args:
+            index (int): vertex index
+
+        Returns:
+            list[int]: neighbor vertex indices in counter clockwise order
+        """
+        return [v - 3 for v in self.ring(index + 3) if v >= 3]
+
+    def in_bound(self, p_x: float, p_y: float) -> bool:
+        """check if the point is in the area covered by the super triangle
+
+        Args:
+            p_x (float): point x
+            p_y (float): point y
+
+        Returns:
+            bool: True if in the area
+        """
+        min_x, min_y, max_x, max_y = self._bound
+        return min_x <= p_x <= max_x and min_y <= p_y <= max_y
+
+    def in_super_triangle(self, p_x: float, p_y: float) -> bool:
+        """check if the point is inside the super triangle
+
+        Args:
+            p_x (float): point x
+            p_y (float): point y
+
+        Returns:
+            bool: True if inside
+        """
+        xs = self._xs
+        ys = self._ys
+        for i in range(3):
+            j = (i + 1) % 3
+            if (xs[j] - xs[i]) * (p_y - ys[i]) - (ys[j] - ys[i]) * (p_x - xs[i]) < 0.0:
+                return False
+        return True
+
+    def rebuild(self) -> None:
+        """create a new super triangle covering all vertices and insert all vertices again
+        """
+        self.clear_triangles()
+        if len(self._vertices) == 0:
+            self._bound = None
+            return
+
+        min_x = min(point.x() for point in self._vertices)
+        max_x = max(point.x() for point in self._vertices)
+        min_y = min(point.y() for point in self._vertices)
+        max_y = max(point.y() for point in self._vertices)
+        if self._bound is not None:
+            min_x = min(min_x, self._bound[0])
+            min_y = min(min_y, self._bound[1])
+            max_x = max(max_x, self._bound[2])
+            max_y = max(max_y, self._bound[3])
+        # grow the covered area, so points added later rarely need another rebuild
+        half = max(max_x - min_x, max_y - min_y, 1.0)
+        center_x = (min_x + max_x) * 0.5
+        center_y = (min_y + max_y) * 0.5
+        self._bound = (center_x - half, center_y - half, center_x + half, center_y + half)
+
+        radius = half * SUPER_SCALE
+        xs = [center_x + radius * d_x for d_x, _ in self._super_dir]
+        ys = [center_y + radius * d_y for _, d_y in self._super_dir]
+        for point in self._vertices:
+            xs.append(point.x())
+            ys.append(point.y())
+        self._xs = xs
+        self._ys = ys
+        self._vertex_tri = [0] * 3 + [-1] * len(self._vertices)
+        self._tri_v = [0, 1, 2]
+        self._tri_n = [-1, -1, -1]
+        self._tri_alive = [True]
+        self._last = 0
+
+        for vid in self.insertion_order(list(range(3, len(xs)))):
+            self.insert(vid)
+
+    def insertion_order(self, vids: list[int]) -> list[int]:
+        """get the biased randomized insertion order
+
+        vertices are shuffled and split into rounds of doubling size, and each
+        round is sorted along a Morton curve.
+
+        Args:
+            vids (list[int]): vertex ids to insert
+
+        Returns:
+            list[int]: vertex ids in the insertion order
+        """
+        size = len(vids)
+        if size < 8:
+            return vids
+        order = vids.copy()
+        random.Random(size).shuffle(order)
+
+        xs = self._xs
+        ys = self._ys
+        min_x = min(xs[v] for v in order)
+        min_y = min(ys[v] for v in order)
+        scale = ((1 << MORTON_BITS) - 1) / max(max(xs[v] for v in order) - min_x,
+                                               max(ys[v] for v in order) - min_y, 1.0e-10)
+
+        def morton(v: int) -> int:
+            return (MORTON_SPREAD[int((xs[v] - min_x) * scale)]
+                    | (MORTON_SPREAD[int((ys[v] - min_y) * scale)] << 1))
+
+        result = []
+        first = 0
+        last = 1
+        while first < size:
+            result.extend(sorted(order[first:last], key=morton))
+            first = last
+            last = min(size, last * 2)
+        return result
+
+    def walk(self, p_x: float, p_y: float, hint: int) -> int:
+        """find the triangle that contains the point by the visibility walk
+
+        Args:
+            p_x (float): point x
+            p_y (float): point y
+            hint (int): start triangle id. -1 for the last created triangle
+
+        Returns:
+            int: triangle id
+        """
+        tri_v = self._tri_v
+        tri_n = self._tri_n
+        xs = self._xs
+        ys = self._ys
+        t = hint if 0 <= hint < len(self._tri_alive) and self._tri_alive[hint] else self._last
+        max_steps = len(self._tri_alive) + 3
+        step = 0
+        while step < max_steps:
+            base = 3 * t
+            next_t = -1
+            for k in range(3):
+                j = (k + step) % 3
+                v_a = tri_v[base + (j + 1) % 3]
+                v_b = tri_v[base + (j + 2) % 3]
+                if ((xs[v_b] - xs[v_a]) * (p_y - ys[v_a])
+                        - (ys[v_b] - ys[v_a]) * (p_x - xs[v_a]) < 0.0):
+                    next_t = tri_n[base + j]
+                    break
+            if next_t == -1:
+                return t
+            t = next_t
+            step += 1
+
+        # the walk did not finish. check all triangles
+        for t, alive in enumerate(self._tri_alive):
+            if not alive:
+                continue
+            base = 3 * t
+            inside = True
+            for j in range(3):
+                v_a = tri_v[base + (j + 1) % 3]
+                v_b = tri_v[base + (j + 2) % 3]
+                if ((xs[v_b] - xs[v_a]) * (p_y - ys[v_a])
+                        - (ys[v_b] - ys[v_a]) * (p_x - xs[v_a]) < 0.0):
+                    inside = False
+                    break
+            if inside:
+                return t
+        return self._last
+
+    def in_circle(self, tri_id: int, p_x: float, p_y: float) -> bool:
+        """check if the circum circle of the triangle contains the point
+
+        super triangle vertices are treated as infinitely far points.
+
+        Args:
+            tri_id (int): triangle id
+            p_x (float): point x
+            p_y (float): point y
+
+        Returns:
+            bool: True if the point is strictly inside
+        """
+        base = 3 * tri_id
+        v_0 = self._tri_v[base]
+        v_1 = self._tri_v[base + 1]
+        v_2 = self._tri_v[base + 2]
+        xs = self._xs
+        ys = self._ys
+        super_count = (v_0 < 3) + (v_1 < 3) + (v_2 < 3)
+        if super_count == 0:
+            return in_circum_circle(p_x, p_y, xs[v_0], ys[v_0],
+                                    xs[v_1], ys[v_1], xs[v_2], ys[v_2]) > 0.0
+        if super_count == 3:
+            return True
+
+        # rotate the vertices. finite vertices first
+        while v_0 < 3 or (super_count == 1 and v_1 < 3):
+            v_0, v_1, v_2 = v_1, v_2, v_0
+        if super_count == 1:
+            # the circle becomes the half plane left of the edge v_0 -> v_1
+            e_x = xs[v_1] - xs[v_0]
+            e_y = ys[v_1] - ys[v_0]
+            r_x = p_x - xs[v_0]
+            r_y = p_y - ys[v_0]
+            cross = e_x * r_y - e_y * r_x
+            if cross != 0.0:
+                return cross > 0.0
+            dot = e_x * r_x + e_y * r_y
+            return 0.0 < dot < e_x * e_x + e_y * e_y
+
+        # the circle becomes the half plane bounded by its tangent at v_0
+        d_1x, d_1y = self._super_dir[v_1]
+        d_2x, d_2y = self._super_dir[v_2]
+        area = 2.0 * (d_1x * d_2y - d_1y * d_2x)
+        c_x = (d_2y * (d_1x * d_1x + d_1y * d_1y) - d_1y * (d_2x * d_2x + d_2y * d_2y)) / area
+        c_y = (d_1x * (d_2x * d_2x + d_2y * d_2y) - d_2x * (d_1x * d_1x + d_1y * d_1y)) / area
+        return (p_x - xs[v_0]) * c_x + (p_y - ys[v_0]) * c_y > 0.0
+
+    def insert(self, vid: int) -> None:
+        """insert a vertex into the triangulation by the Bowyer-Watson method
+
+        Args:
+            vid (int): vertex id
+        """
+        tri_v = self._tri_v
+        tri_n = self._tri_n
+        xs = self._xs
+        ys = self._ys
+        p_x = xs[vid]
+        p_y = ys[vid]
+
+        start = self.walk(p_x, p_y, self._last)
+        cavity = {start}
+        stack = [start]
+        while stack:
+            t = stack.pop()
+            for j in range(3):
+                n = tri_n[3 * t + j]
+                if n != -1 and n not in cavity and self.in_circle(n, p_x, p_y):
+                    cavity.add(n)
+                    stack.append(n)
+
+        # boundary edges (v_a, v_b, outer triangle, cavity triangle).
+        # the cavity is grown if rounding errors leave an edge not visible from the vertex
+        while True:
+            boundary = []
+            hidden = -1
+            for t in cavity:
+                for j in range(3):
+                    n = tri_n[3 * t + j]
+                    if n in cavity:
+                        continue
+                    v_a = tri_v[3 * t + (j + 1) % 3]
+                    v_b = tri_v[3 * t + (j + 2) % 3]
+                    if (n != -1 and (xs[v_b] - xs[v_a]) * (p_y - ys[v_a])
+                            - (ys[v_b] - ys[v_a]) * (p_x - xs[v_a]) <= 0.0):
+                        hidden = n
+                        break
+                    boundary.append((v_a, v_b, n, t))
+                if hidden != -1:
+                    break
+            if hidden == -1:
+                break
+            cavity.add(hidden)
+
+        start_map = {}
+        end_map = {}
+        new_ids = []
+        for v_a, v_b, n, t in boundary:
+            if self._free:
+                new_t = self._free.pop()
+                tri_v[3 * new_t:3 * new_t + 3] = (v_a, v_b, vid)
+                tri_n[3 * new_t:3 * new_t + 3] = (-1, -1, n)
+                self._tri_alive[new_t] = True
+            else:
+                new_t = len(self._tri_alive)
+                tri_v.extend((v_a, v_b, vid))
+                tri_n.extend((-1, -1, n))
+                self._tri_alive.append(True)
+            if n != -1:
+                for j in range(3):
+                    if tri_n[3 * n + j] == t:
+                        tri_n[3 * n + j] = new_t
+                        break
+            start_map[v_a] = new_t
+            end_map[v_b] = new_t
+            self._vertex_tri[v_a] = new_t
+            new_ids.append(new_t)
+        for new_t in new_ids:
+            tri_n[3 * new_t] = start_map[tri_v[3 * new_t + 1]]
+            tri_n[3 * new_t + 1] = end_map[tri_v[3 * new_t]]
+        self._vertex_tri[vid] = new_ids[-1]
+        self._last = new_ids[-1]
+
+        for t in cavity:
+            self._tri_alive[t] = False
+            self._free.append(t)
+
+    def ring(self, vid: int) -> list[int]:
+        """get vertex ids connected to a vertex in counter clockwise order
+
+        Args:
+            vid (int): vertex id
+
+        Returns:
+            list[int]: neighbor vertex ids that may include super triangle vertices
+        """
+        tri_v = self._tri_v
+        tri_n = self._tri_n
+        start = self._vertex_tri[vid]
+        result = []
+        t = start
+        while True:
+            base = 3 * t
+            k = 0 if tri_v[base] == vid else 1 if tri_v[base + 1] == vid else 2
+            result.append(tri_v[base + (k + 1) % 3])
+            t = tri_n[base + (k + 1) % 3]
+            if t == start or t == -1:
+                break
+        return result
+
+    def __repr__(self) -> str:
+        """represent the triangulation as a string
+
+        Returns:
+            str: contains the vertices and the triangles
+        """
+        return f"({self._vertices} , {self.triangles()})"
@@ -0,0 +1,422 @@
+""" edge_tree_2d.py file
+    EdgeTree2D: class name
+    Bounding volume hierarchy over the edges of a polygon or polyline
+"""
+from __future__ import annotations
+import math
+
+from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.segment_2d import Segment2D, segment_dist2
+from pyrusgeom.ray_2d import Ray2D
+
+
+class EdgeTree2D:
+    """ handling a bounding volume hierarchy over polygon edges in SS2D
+
+    the tree is built lazily on the first query. edge i goes from vertex i
+    to vertex i + 1 (the last edge of a closed outline goes back to vertex 0).
+
+    Attributes:
+        _xs: x coordinates of the vertices
+        _ys: y coordinates of the vertices
+        _edge_count: number of edges
+        _leaf_size: maximum number of edges in a leaf node
+        _order: edge indices ordered by node
+        _min_x, _min_y, _max_x, _max_y: bounding box of each node
+        _first, _last: edge range [first, last) in _order of each node
+        _left, _right: child node indices. -1 for a leaf node
+    """
+
+    def __init__(self, vertices: list[Vector2D], closed: bool = True, leaf_size: int = 4):
+        """This is the class init function and stores the outline.
+
+        Args:
+            vertices (list[Vector2D]): outline vertices
+            closed (bool, optional): close the outline if there are 3 or more
+                vertices, same as Polygon2D.dist. Defaults to True.
+            leaf_size (int, optional): maximum number of edges in a leaf. Defaults to 4.
+        """
+        self._xs = [point.x() for point in vertices]
+        self._ys = [point.y() for point in vertices]
+        size = len(vertices)
+        if size == 1:
+            self._edge_count = 1  # a zero length edge
+        elif closed and size >= 3:
+            self._edge_count = size
+        else:
+            self._edge_count = max(0, size - 1)
+        self._leaf_size = max(1, leaf_size)
+        self._order: list[int] = []
+        self._min_x: list[float] = []
+        self._min_y: list[float] = []
+        self._max_x: list[float] = []
+        self._max_y: list[float] = []
+        self._first: list[int] = []
+        self._last: list[int] = []
+        self._left: list[int] = []
+        self._right: list[int] = []
+
+    def size(self) -> int:
+        """get the number of edges
+
+        Returns:
+            int: number of edges
+        """
+        return self._edge_count
+
+    def is_built(self) -> bool:
+        """check if the tree nodes are already built
+
+        Returns:
+            bool: True if built
+        """
+        return len(self._min_x) > 0
+
+    def edge(self, index: int) -> Segment2D:
+        """get the edge segment
+
+        Args:
+            index (int): edge index
+
+        Returns:
+            Segment2D: segment from vertex index to the next vertex
+        """
+        i_0, i_1 = self._edge_vertices(index)
+        return Segment2D(self._xs[i_0], self._ys[i_0], self._xs[i_1], self._ys[i_1])
+
+    def build(self) -> None:
+        """build the tree nodes. called automatically by the first query.
+
+        edges are split at the median of their center along the longer side
+        of the node bounding box.
+        """
+        if self.is_built() or self._edge_count == 0:
+            return
+        xs = self._xs
+        ys = self._ys
+        centers = []
+        for i in range(self._edge_count):
+            i_0, i_1 = self._edge_vertices(i)
+            centers.append(((xs[i_0] + xs[i_1]) * 0.5, (ys[i_0] + ys[i_1]) * 0.5))
+        self._order = list(range(self._edge_count))
+
+        self._new_node(0, self._edge_count)
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            first = self._first[node]
+            last = self._last[node]
+            if last - first <= self._leaf_size:
+                continue
+            axis = 0 if (self._max_x[node] - self._min_x[node]
+                         >= self._max_y[node] - self._min_y[node]) else 1
+            self._order[first:last] = sorted(self._order[first:last],
+                                             key=lambda i: centers[i][axis])
+            middle = (first + last) // 2
+            self._left[node] = self._new_node(first, middle)
+            self._right[node] = self._new_node(middle, last)
+            stack.append(self._left[node])
+            stack.append(self._right[node])
+
+    def nearest_edge(self, point: Vector2D) -> int:
+        """get the edge nearest to the point
+
+        Args:
+            point (Vector2D): considered point
+
+        Returns:
+            int: edge index. -1 if there is no edge
+        """
+        return self._nearest(point.x(), point.y())[0]
+
+    def nearest_point(self, point: Vector2D) -> Vector2D:
+        """get the point on the outline nearest to the point
+
+        Args:
+            point (Vector2D): considered point
+
+        Returns:
+            Vector2D: nearest point. invalid vector if there is no edge
+        """
+        index = self._nearest(point.x(), point.y())[0]
+        if index == -1:
+            return Vector2D.invalid()
+        i_0, i_1 = self._edge_vertices(index)
+        a_x = self._xs[i_0]
+        a_y = self._ys[i_0]
+        d_x = self._xs[i_1] - a_x
+        d_y = self._ys[i_1] - a_y
+        len2 = d_x * d_x + d_y * d_y
+        if len2 == 0.0:
+            return Vector2D(a_x, a_y)
+        rate = ((point.x() - a_x) * d_x + (point.y() - a_y) * d_y) / len2
+        rate = min(1.0, max(0.0, rate))
+        return Vector2D(a_x + d_x * rate, a_y + d_y * rate)
+
+    def dist(self, point: Vector2D, check_as_plane: bool = True) -> float:
+        """get minimum distance between the outline and point
+
+        Args:
+            point (Vector2D): considered point
+            check_as_plane (bool, optional): if True, the inside of a closed
+                outline counts as distance 0. Defaults to True.
+
+        Returns:
+            float: minimum distance. inf if there is no edge
+        """
+        if check_as_plane and self.contains(point):
+            return 0.0
+        return math.sqrt(self._nearest(point.x(), point.y())[1])
+
+    def contains(self, point: Vector2D) -> bool:
+        """check if the point is inside the closed outline (even-odd rule)
+
+        only the nodes crossed by the horizontal half line from the point are
+        visited. points exactly on the outline may be reported either way.
+
+        Args:
+            point (Vector2D): considered point
+
+        Returns:
+            bool: True if inside
+        """
+        if self._edge_count < 3:
+            return False
+        self.build()
+        p_x = point.x()
+        p_y = point.y()
+        xs = self._xs
+        ys = self._ys
+        inside = False
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if (self._max_x[node] < p_x or self._min_y[node] > p_y
+                    or self._max_y[node] < p_y):
+                continue
+            if self._left[node] != -1:
+                stack.append(self._left[node])
+                stack.append(self._right[node])
+                continue
+            for k in range(self._first[node], self._last[node]):
+                i_0, i_1 = self._edge_vertices(self._order[k])
+                y_0 = ys[i_0]
+                y_1 = ys[i_1]
+                if (y_0 > p_y) != (y_1 > p_y):
+                    cross_x = xs[i_0] + (p_y - y_0) * (xs[i_1] - xs[i_0]) / (y_1 - y_0)
+                    if cross_x > p_x:
+                        inside = not inside
+        return inside
+
+    def ray_intersection(self, ray: Ray2D) -> Vector2D:
+        """get the first intersection point of the ray and the outline
+
+        Args:
+            ray (Ray2D): considered ray
+
+        Returns:
+            Vector2D: intersection point. if it does not exist,
+             the invalidated value vector is returned.
+        """
+        index, dist = self.ray_intersection_edge(ray)
+        if index == -1:
+            return Vector2D.invalid()
+        return ray.origin_() + Vector2D.from_polar(dist, ray.dir_())
+
+    def ray_intersection_edge(self, ray: Ray2D) -> tuple:
+        """get the first edge hit by the ray
+
+        Args:
+            ray (Ray2D): considered ray
+
+        Returns:
+            tuple: (edge index, distance from the ray origin). (-1, inf) if no hit
+        """
+        if self._edge_count == 0:
+            return -1, float('inf')
+        self.build()
+        o_x = ray.origin_().x()
+        o_y = ray.origin_().y()
+        d_x = ray.dir_().cos()
+        d_y = ray.dir_().sin()
+        inv_x = 1.0 / d_x if d_x != 0.0 else float('inf')
+        inv_y = 1.0 / d_y if d_y != 0.0 else float('inf')
+        xs = self._xs
+        ys = self._ys
+        best_index = -1
+        best_t = float('inf')
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if not self._box_hit(node, o_x, o_y, d_x, d_y, inv_x, inv_y, best_t):
+                continue
+            if self._left[node] != -1:
+                stack.append(self._left[node])
+                stack.append(self._right[node])
+                continue
+            for k in range(self._first[node], self._last[node]):
+                index = self._order[k]
+                i_0, i_1 = self._edge_vertices(index)
+                rel_x = xs[i_0] - o_x
+                rel_y = ys[i_0] - o_y
+                e_x = xs[i_1] - xs[i_0]
+                e_y = ys[i_1] - ys[i_0]
+                denom = d_x * e_y - d_y * e_x
+                if denom != 0.0:
+                    t_ray = (rel_x * e_y - rel_y * e_x) / denom
+                    t_edge = (rel_x * d_y - rel_y * d_x) / denom
+                    if t_ray < 0.0 or t_edge < 0.0 or t_edge > 1.0:
+                        continue
+                elif rel_x * d_y - rel_y * d_x == 0.0:
+                    # collinear edge
+                    t_0 = rel_x * d_x + rel_y * d_y
+                    t_1 = t_0 + e_x * d_x + e_y * d_y
+                    if max(t_0, t_1) < 0.0:
+                        continue
+                    t_ray = max(0.0, min(t_0, t_1))
+                else:
+                    continue
+                if t_ray < best_t:
+                    best_t = t_ray
+                    best_index = index
+        return best_index, best_t
+
+    def _edge_vertices(self, index: int) -> tuple:
+        """get the vertex indices of the edge
+
+        Args:
+            index (int): edge index
+
+        Returns:
+            tuple: (origin vertex index, terminal vertex index)
+        """
+        terminal = index + 1
+        if terminal >= len(self._xs):
+            terminal = 0
+        return index, terminal
+
+    def _new_node(self, first: int, last: int) -> int:
+        """append a node with the bounding box of the edges [first, last) in _order
+
+        Args:
+            first (int): first position in _order
+            last (int): last position in _order (exclusive)
+
+        Returns:
+            int: new node index
+        """
+        xs = self._xs
+        ys = self._ys
+        min_x = min_y = float('inf')
+        max_x = max_y = -float('inf')
+        for k in range(first, last):
+            i_0, i_1 = self._edge_vertices(self._order[k])
+            min_x = min(min_x, xs[i_0], xs[i_1])
+            max_x = max(max_x, xs[i_0], xs[i_1])
+            min_y = min(min_y, ys[i_0], ys[i_1])
+            max_y = max(max_y, ys[i_0], ys[i_1])
+        self._min_x.append(min_x)
+        self._min_y.append(min_y)
+        self._max_x.append(max_x)
+        self._max_y.append(max_y)
+        self._first.append(first)
+        self._last.append(last)
+        self._left.append(-1)
+        self._right.append(-1)
+        return len(self._min_x) - 1
+
+    def _box_dist2(self, node: int, p_x: float, p_y: float) -> float:
+        """get squared distance between the node bounding box and the point
+
+        Args:
+            node (int): node index
+            p_x (float): point x
+            p_y (float): point y
+
+        Returns:
+            float: squared distance. 0 if the point is inside the box
+        """
+        d_x = max(self._min_x[node] - p_x, 0.0, p_x - self._max_x[node])
+        d_y = max(self._min_y[node] - p_y, 0.0, p_y - self._max_y[node])
+        return d_x * d_x + d_y * d_y
+
+    def _box_hit(self, node: int, o_x: float, o_y: float, d_x: float, d_y: float,
+                 inv_x: float, inv_y: float, max_t: float) -> bool:
+        """check if the ray hits the node bounding box before max_t (slab method)
+
+        Returns:
+            bool: True if hit
+        """
+        if d_x == 0.0:
+            if o_x < self._min_x[node] or o_x > self._max_x[node]:
+                return False
+            t_min_x = -float('inf')
+            t_max_x = float('inf')
+        else:
+            t_0 = (self._min_x[node] - o_x) * inv_x
+            t_1 = (self._max_x[node] - o_x) * inv_x
+            t_min_x = min(t_0, t_1)
+            t_max_x = max(t_0, t_1)
+        if d_y == 0.0:
+            if o_y < self._min_y[node] or o_y > self._max_y[node]:
+                return False
+            t_min_y = -float('inf')
+            t_max_y = float('inf')
+        else:
+            t_0 = (self._min_y[node] - o_y) * inv_y
+            t_1 = (self._max_y[node] - o_y) * inv_y
+            t_min_y = min(t_0, t_1)
+            t_max_y = max(t_0, t_1)
+        t_enter = max(t_min_x, t_min_y, 0.0)
+        t_exit = min(t_max_x, t_max_y)
+        return t_enter <= t_exit and t_enter <= max_t
+
+    def _nearest(self, p_x: float, p_y: float) -> tuple:
+        """find the nearest edge by depth first search with box pruning
+
+        Args:
+            p_x (float): point x
+            p_y (float): point y
+
+        Returns:
+            tuple: (edge index, squared distance). (-1, inf) if there is no edge
+        """
+        if self._edge_count == 0:
+            return -1, float('inf')
+        self.build()
+        xs = self._xs
+        ys = self._ys
+        best_index = -1
+        best_dist2 = float('inf')
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._box_dist2(node, p_x, p_y) >= best_dist2:
+                continue
+            left = self._left[node]
+            if left != -1:
+                right = self._right[node]
+                # visit the nearer child first
+                if self._box_dist2(left, p_x, p_y) < self._box_dist2(right, p_x, p_y):
+                    stack.append(right)
+                    stack.append(left)
+                else:
+                    stack.append(left)
+                    stack.append(right)
+                continue
+            for k in range(self._first[node], self._last[node]):
+                index = self._order[k]
+                i_0, i_1 = self._edge_vertices(index)
+                dist2 = segment_dist2(p_x, p_y, xs[i_0], ys[i_0], xs[i_1], ys[i_1])
+                if dist2 < best_dist2:
+                    best_dist2 = dist2
+                    best_index = index
+        return best_index, best_dist2
+
+    def __repr__(self) -> str:
+        """represent the edge tree as a string
+
+        Returns:
+            str: contains number of edges and nodes
+        """
+        return f"(edges:{self._edge_count}, nodes:{len(self._min_x)})"
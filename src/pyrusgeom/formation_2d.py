@@ -0,0 +1,201 @@
+""" formation_2d.py file
+    Formation2D: class name
+    Delaunay triangulation based formation (ball position -> player positions)
+"""
+from __future__ import annotations
+
+from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.triangle_2d import Triangle2D
+from pyrusgeom.delaunay_triangulation import DelaunayTriangulation
+
+
+class Formation2D:
+    """ handling a Delaunay triangulation based formation in SS2D
+
+    each sample maps a ball position to the positions of all players. the
+    ball is located in the Delaunay triangulation of the sample ball
+    positions and the player positions of the 3 samples are blended with
+    the barycentric weights of the ball. if the ball is outside of the
+    triangulation, the positions of the nearest sample are used.
+
+    the triangulation is built on the first query after samples are added,
+    and the last containing triangle is kept as the start of the next walk,
+    so a query for a ball moving smoothly costs a few orientation tests.
+
+    Attributes:
+        _balls: ball position of each sample
+        _coords: flat player coordinates [x0, y0, x1, y1, ...] of each sample
+        _index_map: (x, y) of the ball -> sample index
+        _pending: number of samples not added to the triangulation yet
+        _player_size: number of players in a sample
+        _delaunay: triangulation of the sample ball positions
+        _last_tri: last found triangle id
+    """
+
+    def __init__(self, samples: list = None):
+        """This is the class init function and creates the formation.
+
+        Defualt:
+            create an empty formation
+        OR
+            create a formation with given samples
+        Args:
+            samples (list, optional): list of (ball, players). Defaults to None.
+        """
+        self._balls: list[Vector2D] = []
+        self._coords: list[list[float]] = []
+        self._index_map: dict = {}
+        self._pending = 0
+        self._player_size = 0
+        self._delaunay = DelaunayTriangulation()
+        self._last_tri = -1
+        if samples is not None:
+            for ball, players in samples:
+                self.add_sample(ball, players)
+
+    def add_sample(self, ball: Vector2D, players: list[Vector2D]) -> int:
+        """add a sample. the players of the sample at the same ball position are replaced
+
+        Args:
+            ball (Vector2D): ball position
+            players (list[Vector2D]): player positions
+
+        Raises:
+            Exception: the number of players must be same in all samples
+
+        Returns:
+            int: sample index
+        """
+        if len(self._balls) == 0:
+            self._player_size = len(players)
+        elif len(players) != self._player_size:
+            raise Exception(f"Formation2D.add_sample: {len(players)} players are given."
+                            f" {self._player_size} players are expected")
+
+        coords = []
+        for player in players:
+            coords.append(player.x())
+            coords.append(player.y())
+
+        key = (ball.x(), ball.y())
+        index = self._index_map.get(key)
+        if index is not None:
+            self._coords[index] = coords
+            return index
+
+        index = len(self._balls)
+        self._balls.append(ball)
+        self._coords.append(coords)
+        self._index_map[key] = index
+        self._pending += 1
+        return index
+
+    def sample_size(self) -> int:
+        """get the number of samples
+
+        Returns:
+            int: number of samples
+        """
+        return len(self._balls)
+
+    def player_size(self) -> int:
+        """get the number of players in a sample
+
+        Returns:
+            int: number of players
+        """
+        return self._player_size
+
+    def ball(self, index: int) -> Vector2D:
+        """get the ball position of a sample
+
+        Args:
+            index (int): sample index
+
+        Returns:
+            Vector2D: ball position
+        """
+        return self._balls[index]
+
+    def players(self, index: int) -> list[Vector2D]:
+        """get the player positions of a sample
+
+        Args:
+            index (int): sample index
+
+        Returns:
+            list[Vector2D]: player positions
+        """
+        coords = self._coords[index]
+        return [Vector2D(coords[2 * i], coords[2 * i + 1]) for i in range(self._player_size)]
+
+    def triangulation(self) -> DelaunayTriangulation:
+        """get the triangulation of the sample ball positions
+
+        Returns:
+            DelaunayTriangulation: triangulation with all samples
+        """
+        if self._pending > 0:
+            self._delaunay.add_vertices(self._balls[len(self._balls) - self._pending:])
+            self._pending = 0
+        return self._delaunay
+
+    def get_coords(self, ball: Vector2D) -> list[float]:
+        """get all player positions for the ball position as flat coordinates
+
+        Args:
+            ball (Vector2D): ball position
+
+        Returns:
+            list[float]: [x0, y0, x1, y1, ...]. empty list if there is no sample
+        """
+        if len(self._balls) == 0:
+            return []
+        delaunay = self.triangulation()
+
+        tri_id = delaunay.locate(ball, self._last_tri)
+        if tri_id != -1:
+            self._last_tri = tri_id
+            i_a, i_b, i_c = delaunay.triangle(tri_id)
+            if i_a >= 0 and i_b >= 0 and i_c >= 0:
+                w_a, w_b, w_c = Triangle2D.tri_barycentric(self._balls[i_a], self._balls[i_b],
+                                                           self._balls[i_c], ball)
+                return [w_a * a + w_b * b + w_c * c
+                        for a, b, c in zip(self._coords[i_a], self._coords[i_b], self._coords[i_c])]
+
+        return self._coords[delaunay.find_nearest_vertex(ball)].copy()
+
+    def get_positions(self, ball: Vector2D) -> list[Vector2D]:
+        """get all player positions for the ball position
+
+        Args:
+            ball (Vector2D): ball position
+
+        Returns:
+            list[Vector2D]: player positions. empty list if there is no sample
+        """
+        coords = self.get_coords(ball)
+        return [Vector2D(coords[2 * i], coords[2 * i + 1]) for i in range(len(coords) // 2)]
+
+    def get_position(self, ball: Vector2D, player_index: int) -> Vector2D:
+        """get a player position for the ball position
+
+        Args:
+            ball (Vector2D): ball position
+            player_index (int): player index in a sample
+
+        Returns:
+            Vector2D: player position. invalid vector if there is no sample
+        """
+        coords = self.get_coords(ball)
+        if len(coords) == 0:
+            return Vector2D.invalid()
+        return Vector2D(coords[2 * player_index], coords[2 * player_index + 1])
+
+    def __repr__(self) -> str:
+        """represent the formation as a string
+
+        Returns:
+            str: contains the sample ball positions
+        """
+        return f"({self._balls})"
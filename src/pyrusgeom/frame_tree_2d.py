@@ -0,0 +1,335 @@
+""" frame_tree_2d.py file
+    FrameTree2D: class name
+    Coordinate frames with cached world transforms
+"""
+from __future__ import annotations
+from typing import Union
+
+from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.matrix_2d import Matrix2D
+
+
+def copy_matrix(matrix: Matrix2D) -> Matrix2D:
+    """create a copy of a matrix
+
+    Args:
+        matrix (Matrix2D): source matrix
+
+    Returns:
+        Matrix2D: new matrix object with the same elements
+    """
+    return Matrix2D(matrix.m11(), matrix.m12(), matrix.m21(), matrix.m22(),
+                    matrix.dxtf(), matrix.dytf())
+
+
+def compose_matrix(lhs: Matrix2D, rhs: Matrix2D) -> Matrix2D:
+    """create lhs * rhs without changing the operands
+
+    Matrix2D.__mul__ overwrites the left hand side, so a copy is multiplied.
+
+    Args:
+        lhs (Matrix2D): left hand side matrix (applied last)
+        rhs (Matrix2D): right hand side matrix (applied first)
+
+    Returns:
+        Matrix2D: new composed matrix
+    """
+    result = copy_matrix(lhs)
+    result *= rhs
+    return result
+
+
+class FrameTree2D:
+    """ handling coordinate frames in SS2D
+
+    every frame has a pose (position and angle) in its parent frame, and the
+    root frame is ROOT. the matrix from a frame to the world and its inverse
+    are cached, and they are dropped for the frame and its descendants when a
+    pose is changed. they are calculated again when they are requested.
+
+    e.g. a "self" frame at the agent position with the body angle, and a
+    "ball" frame at the ball position.
+
+    Attributes:
+        _parents: parent name of each frame
+        _children: child names of each frame
+        _positions: position of each frame in its parent frame
+        _angles: angle of each frame in its parent frame
+        _world: cached matrix from each frame to the world or None
+        _inverse: cached matrix from the world to each frame or None
+    """
+    ROOT = "world"
+
+    def __init__(self):
+        """This is the class init function and creates a tree with only the root frame.
+        """
+        self._parents: dict[str, str] = {FrameTree2D.ROOT: None}
+        self._children: dict[str, list[str]] = {FrameTree2D.ROOT: []}
+        self._positions: dict[str, Vector2D] = {FrameTree2D.ROOT: Vector2D(0.0, 0.0)}
+        self._angles: dict[str, AngleDeg] = {FrameTree2D.ROOT: AngleDeg(0.0)}
+        self._world: dict[str, Matrix2D] = {FrameTree2D.ROOT: Matrix2D()}
+        self._inverse: dict[str, Matrix2D] = {FrameTree2D.ROOT: Matrix2D()}
+
+    def add_frame(self, name: str, parent: str = ROOT, position: Vector2D = None,
+                  angle: Union[AngleDeg, float] = 0.0) -> None:
+        """add a new frame
+
+        Args:
+            name (str): frame name
+            parent (str, optional): parent frame name. Defaults to ROOT.
+            position (Vector2D, optional): position in the parent frame. Defaults to None (origin).
+            angle (Union[AngleDeg, float], optional): angle in the parent frame. Defaults to 0.0.
+
+        Raises:
+            Exception: the name is already used or the parent does not exist
+        """
+        if name in self._parents:
+            raise Exception(f"FrameTree2D: the frame {name} already exists")
+        if parent not in self._parents:
+            raise Exception(f"FrameTree2D: the parent frame {parent} does not exist")
+        self._parents[name] = parent
+        self._children[name] = []
+        self._children[parent].append(name)
+        self._positions[name] = Vector2D(0.0, 0.0) if position is None else Vector2D(position)
+        self._angles[name] = AngleDeg(angle)
+        self._world[name] = None
+        self._inverse[name] = None
+
+    def remove_frame(self, name: str) -> None:
+        """remove a frame and all its descendants
+
+        Args:
+            name (str): frame name
+
+        Raises:
+            Exception: the frame is the root or does not exist
+        """
+        self.check_frame(name)
+        if name == FrameTree2D.ROOT:
+            raise Exception("FrameTree2D: the root frame cannot be removed")
+        self._children[self._parents[name]].remove(name)
+        stack = [name]
+        while stack:
+            frame = stack.pop()
+            stack.extend(self._children[frame])
+            for table in (self._parents, self._children, self._positions,
+                          self._angles, self._world, self._inverse):
+                del table[frame]
+
+    def set_pose(self, name: str, position: Vector2D,
+                 angle: Union[AngleDeg, float]) -> None:
+        """set the pose of a frame in its parent frame
+
+        Args:
+            name (str): frame name
+            position (Vector2D): new position in the parent frame
+            angle (Union[AngleDeg, float]): new angle in the parent frame
+
+        Raises:
+            Exception: the frame is the root or does not exist
+        """
+        self.check_frame(name)
+        if name == FrameTree2D.ROOT:
+            raise Exception("FrameTree2D: the root frame cannot be moved")
+        self._positions[name] = Vector2D(position)
+        self._angles[name] = AngleDeg(angle)
+        self.invalidate(name)
+
+    def has_frame(self, name: str) -> bool:
+        """check if the frame exists
+
+        Args:
+            name (str): frame name
+
+        Returns:
+            bool: True if exists
+        """
+        return name in self._parents
+
+    def check_frame(self, name: str) -> None:
+        """raise if the frame does not exist
+
+        Args:
+            name (str): frame name
+
+        Raises:
+            Exception: the frame does not exist
+        """
+        if name not in self._parents:
+            raise Exception(f"FrameTree2D: the frame {name} does not exist")
+
+    def parent(self, name: str) -> str:
+        """get the parent frame name
+
+        Args:
+            name (str): frame name
+
+        Returns:
+            str: parent name, None for the root
+        """
+        self.check_frame(name)
+        return self._parents[name]
+
+    def position(self, name: str) -> Vector2D:
+        """get a copy of the frame position in its parent frame
+
+        Args:
+            name (str): frame name
+
+        Returns:
+            Vector2D: position
+        """
+        self.check_frame(name)
+        return Vector2D(self._positions[name])
+
+    def angle(self, name: str) -> AngleDeg:
+        """get a copy of the frame angle in its parent frame
+
+        Args:
+            name (str): frame name
+
+        Returns:
+            AngleDeg: angle
+        """
+        self.check_frame(name)
+        return AngleDeg(self._angles[name])
+
+    def invalidate(self, name: str) -> None:
+        """drop the cached matrices of a frame and its descendants
+
+        Args:
+            name (str): frame name
+        """
+        stack = [name]
+        while stack:
+            frame = stack.pop()
+            if self._world[frame] is None and self._inverse[frame] is None:
+                continue  # descendants are already dropped
+            self._world[frame] = None
+            self._inverse[frame] = None
+            stack.extend(self._children[frame])
+
+    def world_matrix_(self, name: str) -> Matrix2D:
+        """get the cached matrix from the frame to the world
+
+        Args:
+            name (str): frame name
+
+        Returns:
+            Matrix2D: reference to the cached matrix
+        """
+        self.check_frame(name)
+        matrix = self._world[name]
+        if matrix is None:
+            position = self._positions[name]
+            local = Matrix2D.make_rotation(self._angles[name])
+            local.translate(position.x(), position.y())
+            matrix = compose_matrix(self.world_matrix_(self._parents[name]), local)
+            self._world[name] = matrix
+        return matrix
+
+    def world_matrix(self, name: str) -> Matrix2D:
+        """get the matrix from the frame to the world
+
+        Args:
+            name (str): frame name
+
+        Returns:
+            Matrix2D: new matrix object
+        """
+        return copy_matrix(self.world_matrix_(name))
+
+    def inverse_matrix_(self, name: str) -> Matrix2D:
+        """get the cached matrix from the world to the frame
+
+        Args:
+            name (str): frame name
+
+        Returns:
+            Matrix2D: reference to the cached matrix
+        """
+        self.check_frame(name)
+        matrix = self._inverse[name]
+        if matrix is None:
+            matrix = self.world_matrix_(name).inverted()
+            self._inverse[name] = matrix
+        return matrix
+
+    def inverse_matrix(self, name: str) -> Matrix2D:
+        """get the matrix from the world to the frame
+
+        Args:
+            name (str): frame name
+
+        Returns:
+            Matrix2D: new matrix object
+        """
+        return copy_matrix(self.inverse_matrix_(name))
+
+    def relative_matrix(self, source: str, target: str) -> Matrix2D:
+        """get the matrix from the source frame to the target frame
+
+        Args:
+            source (str): source frame name
+            target (str): target frame name
+
+        Returns:
+            Matrix2D: new matrix object
+        """
+        if source == target:
+            self.check_frame(source)
+            return Matrix2D()
+        if target == FrameTree2D.ROOT:
+            return self.world_matrix(source)
+        if source == FrameTree2D.ROOT:
+            return self.inverse_matrix(target)
+        return compose_matrix(self.inverse_matrix_(target), self.world_matrix_(source))
+
+    def convert(self, point: Vector2D, source: str, target: str) -> Vector2D:
+        """convert a point from the source frame to the target frame
+
+        Args:
+            point (Vector2D): point in the source frame
+            source (str): source frame name
+            target (str): target frame name
+
+        Returns:
+            Vector2D: new point in the target frame
+        """
+        return self.relative_matrix(source, target).transform(point)
+
+    def convert_points(self, points, source: str, target: str) -> list[Vector2D]:
+        """convert many points from the source frame to the target frame
+
+        Args:
+            points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+            source (str): source frame name
+            target (str): target frame name
+
+        Returns:
+            list[Vector2D]: new points in the target frame
+        """
+        return self.relative_matrix(source, target).transform_points(points)
+
+    def convert_coords(self, coords, source: str, target: str, out=None):
+        """convert a flat coordinate buffer from the source frame to the target frame
+
+        Args:
+            coords: flat coordinates [x0, y0, x1, y1, ...]
+            source (str): source frame name
+            target (str): target frame name
+            out (optional): buffer to write the result. Defaults to None (create a new list).
+
+        Returns:
+            flat converted coordinates (out if given)
+        """
+        return self.relative_matrix(source, target).transform_coords(coords, out)
+
+    def __repr__(self) -> str:
+        """represent the frame tree as a string
+
+        Returns:
+            str: contains the parent of each frame
+        """
+        return f"({self._parents})"
@@ -1,5 +1,6 @@
 """ file matrix_2d.py
     Matrix2D: class name
+    Matrix2DArray: class name
 """
 
 from __future__ import annotations
@@ -7,8 +8,14 @@ from typing import Union
 import math
 from pyrusgeom.math_values import EPSILON
 
-from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.vector_2d import Vector2D, to_coords
 from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.size_2d import Size2D
+from pyrusgeom.segment_2d import Segment2D
+from pyrusgeom.triangle_2d import Triangle2D
+from pyrusgeom.circle_2d import Circle2D
+from pyrusgeom.rect_2d import Rect2D
+from pyrusgeom.polygon_2d import Polygon2D
 
 
 class Matrix2D:
@@ -268,6 +275,142 @@ class Matrix2D:
         vector.assign(t_x, t_y)
         return vector
 
+    def transform_points(self, points) -> list[Vector2D]:
+        """create transformed vectors from many points
+
+        Args:
+            points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+
+        Returns:
+            list[Vector2D]: new mapped vector objects
+        """
+        m11 = self._m11
+        m12 = self._m12
+        m21 = self._m21
+        m22 = self._m22
+        d_x = self._dx
+        d_y = self._dy
+        return [Vector2D(m11 * p_x + m12 * p_y + d_x, m21 * p_x + m22 * p_y + d_y)
+                for p_x, p_y in to_coords(points)]
+
+    def transform_vecs(self, vectors: list[Vector2D]) -> list[Vector2D]:
+        """transform input vectors in place with this matrix
+
+        Args:
+            vectors (list[Vector2D]): input vectors
+
+        Returns:
+            list[Vector2D]: the input list with the transformed vectors
+        """
+        m11 = self._m11
+        m12 = self._m12
+        m21 = self._m21
+        m22 = self._m22
+        d_x = self._dx
+        d_y = self._dy
+        for vector in vectors:
+            p_x = vector.x()
+            p_y = vector.y()
+            vector.assign(m11 * p_x + m12 * p_y + d_x, m21 * p_x + m22 * p_y + d_y)
+        return vectors
+
+    def transform_coords(self, coords, out=None):
+        """transform a flat coordinate buffer [x0, y0, x1, y1, ...]
+
+        Args:
+            coords: flat coordinates. list or 1-D array
+            out (optional): buffer of the same length to write the result.
+                coords itself can be given to transform in place.
+                Defaults to None (create a new list).
+
+        Returns:
+            flat transformed coordinates (out if given)
+        """
+        m11 = self._m11
+        m12 = self._m12
+        m21 = self._m21
+        m22 = self._m22
+        d_x = self._dx
+        d_y = self._dy
+        if out is None:
+            out = [0.0] * len(coords)
+        for i in range(0, len(coords) - 1, 2):
+            p_x = coords[i]
+            p_y = coords[i + 1]
+            out[i] = m11 * p_x + m12 * p_y + d_x
+            out[i + 1] = m21 * p_x + m22 * p_y + d_y
+        return out
+
+    def transform_segment(self, segment: Segment2D) -> Segment2D:
+        """create transformed segment
+
+        Args:
+            segment (Segment2D): input segment
+
+        Returns:
+            Segment2D: mapped segment object
+        """
+        return Segment2D(self.transform(segment.origin_()), self.transform(segment.terminal_()))
+
+    def transform_triangle(self, triangle: Triangle2D) -> Triangle2D:
+        """create transformed triangle
+
+        Args:
+            triangle (Triangle2D): input triangle
+
+        Returns:
+            Triangle2D: mapped triangle object
+        """
+        return Triangle2D(self.transform(triangle.a_()), self.transform(triangle.b_()),
+                          self.transform(triangle.c_()))
+
+    def transform_polygon(self, polygon: Polygon2D) -> Polygon2D:
+        """create transformed polygon
+
+        Args:
+            polygon (Polygon2D): input polygon
+
+        Returns:
+            Polygon2D: mapped polygon object
+        """
+        return Polygon2D(self.transform_points(polygon.vertices_()))
+
+    def transform_circle(self, circle: Circle2D) -> Circle2D:
+        """create transformed circle
+
+        the radius is scaled by sqrt(|det|), so the result is exact only
+        for rotation, translation and uniform scaling.
+
+        Args:
+            circle (Circle2D): input circle
+
+        Returns:
+            Circle2D: mapped circle object
+        """
+        return Circle2D(self.transform(circle.center()),
+                        circle.radius() * math.sqrt(math.fabs(self.det())))
+
+    def transform_rect(self, rect: Rect2D, aabb: bool = False) -> Union[Polygon2D, Rect2D]:
+        """create transformed rectangle
+
+        Args:
+            rect (Rect2D): input rectangle
+            aabb (bool, optional): return the axis aligned bounding box of the result.
+                Defaults to False.
+
+        Returns:
+            Union[Polygon2D, Rect2D]: mapped rectangle as a polygon, or its bounding box
+        """
+        corners = self.transform_points([rect.top_left(), rect.top_right(),
+                                         rect.bottom_right(), rect.bottom_left()])
+        if not aabb:
+            return Polygon2D(corners)
+        min_x = min(p.x() for p in corners)
+        min_y = min(p.y() for p in corners)
+        max_x = max(p.x() for p in corners)
+        max_y = max(p.y() for p in corners)
+        return Rect2D(Vector2D(min_x, min_y), Size2D(max_x - min_x, max_y - min_y))
+
     @staticmethod
     def make_translation(dxtf: float, dytf: float) -> Matrix2D:
         """create the translation matrix.
@@ -372,3 +515,321 @@ class Matrix2D:
             str: contains Matrix2D index
         """
         return f"{[self._m11, self._m12, self._m21, self._m22, self._dx, self._dy]}"
+
+
+class Matrix2DArray:
+    """ many 2D transform matrices stored element by element
+
+    each element (m11, m12, m21, m22, dxtf, dytf) of all matrices is kept in
+    one list, so composition, inversion and transformation are done in one
+    pass without creating a Matrix2D per item.
+    operators never change the operands.
+
+    Attributes:
+        _m11: (1,1) element of each matrix
+        _m12: (1,2) element of each matrix
+        _m21: (2,1) element of each matrix
+        _m22: (2,2) element of each matrix
+        _dx: horizontal translation of each matrix
+        _dy: vertical translation of each matrix
+    """
+
+    def __init__(self, matrices: list[Matrix2D] = None):
+        """This is the class init function and creates a matrix array
+
+        Defualt:
+            create an empty array
+        OR
+            create an array with copies of given matrices
+        Args:
+            matrices (list[Matrix2D], optional): source matrices. Defaults to None.
+        """
+        matrices = [] if matrices is None else matrices
+        self._m11: list[float] = [m.m11() for m in matrices]
+        self._m12: list[float] = [m.m12() for m in matrices]
+        self._m21: list[float] = [m.m21() for m in matrices]
+        self._m22: list[float] = [m.m22() for m in matrices]
+        self._dx: list[float] = [m.dxtf() for m in matrices]
+        self._dy: list[float] = [m.dytf() for m in matrices]
+
+    @staticmethod
+    def from_elements(m11: list[float], m12: list[float], m21: list[float], m22: list[float],
+                      d_x: list[float], d_y: list[float]) -> Matrix2DArray:
+        """create an array from element lists
+
+        Args:
+            m11 (list[float]): (1,1) elements
+            m12 (list[float]): (1,2) elements
+            m21 (list[float]): (2,1) elements
+            m22 (list[float]): (2,2) elements
+            d_x (list[float]): horizontal translations
+            d_y (list[float]): vertical translations
+
+        Returns:
+            Matrix2DArray: new array object. the lists are not copied
+        """
+        array = Matrix2DArray()
+        array._m11 = m11
+        array._m12 = m12
+        array._m21 = m21
+        array._m22 = m22
+        array._dx = d_x
+        array._dy = d_y
+        return array
+
+    @staticmethod
+    def make_identities(size: int) -> Matrix2DArray:
+        """create identity matrices
+
+        Args:
+            size (int): number of matrices
+
+        Returns:
+            Matrix2DArray: new array object
+        """
+        return Matrix2DArray.from_elements([1.0] * size, [0.0] * size, [0.0] * size,
+                                           [1.0] * size, [0.0] * size, [0.0] * size)
+
+    @staticmethod
+    def make_translations(points) -> Matrix2DArray:
+        """create translation matrices
+
+        Args:
+            points: translation of each matrix. sequence of Vector2D, (x, y) pairs or (n, 2) array
+
+        Returns:
+            Matrix2DArray: new array object
+        """
+        coords = to_coords(points)
+        size = len(coords)
+        return Matrix2DArray.from_elements([1.0] * size, [0.0] * size, [0.0] * size,
+                                           [1.0] * size, [p[0] for p in coords],
+                                           [p[1] for p in coords])
+
+    @staticmethod
+    def make_rotations(angles: list) -> Matrix2DArray:
+        """create rotation matrices
+
+        Args:
+            angles (list): AngleDeg or degree of each matrix
+
+        Returns:
+            Matrix2DArray: new array object
+        """
+        return Matrix2DArray.make_poses(None, angles)
+
+    @staticmethod
+    def make_poses(points, angles: list) -> Matrix2DArray:
+        """create rotation then translation matrices
+
+        SameAs:
+            Matrix2D.make_translation(x, y) * Matrix2D.make_rotation(angle) for each item
+
+        Args:
+            points: translation of each matrix, None for no translation
+            angles (list): AngleDeg or degree of each matrix
+
+        Returns:
+            Matrix2DArray: new array object
+        """
+        cos_list = []
+        sin_list = []
+        for angle in angles:
+            if not isinstance(angle, AngleDeg):
+                angle = AngleDeg(angle)
+            cos_list.append(angle.cos())
+            sin_list.append(angle.sin())
+        size = len(cos_list)
+        if points is None:
+            d_x = [0.0] * size
+            d_y = [0.0] * size
+        else:
+            coords = to_coords(points)
+            if len(coords) != size:
+                raise Exception("Matrix2DArray: the number of points and angles must be same")
+            d_x = [p[0] for p in coords]
+            d_y = [p[1] for p in coords]
+        return Matrix2DArray.from_elements(cos_list, [-s for s in sin_list], sin_list.copy(),
+                                           cos_list.copy(), d_x, d_y)
+
+    def size(self) -> int:
+        """get the number of matrices
+
+        Returns:
+            int: number of matrices
+        """
+        return len(self._m11)
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def matrix(self, index: int) -> Matrix2D:
+        """create a Matrix2D from an item
+
+        Args:
+            index (int): item index
+
+        Returns:
+            Matrix2D: new matrix object
+        """
+        return Matrix2D(self._m11[index], self._m12[index], self._m21[index],
+                        self._m22[index], self._dx[index], self._dy[index])
+
+    def matrices(self) -> list[Matrix2D]:
+        """create Matrix2D of all items
+
+        Returns:
+            list[Matrix2D]: new matrix objects
+        """
+        return [self.matrix(i) for i in range(self.size())]
+
+    def elements(self) -> tuple[list[float], list[float], list[float],
+                                            list[float], list[float], list[float]]:
+        """get the element lists
+
+        Returns:
+            tuple: references to (m11, m12, m21, m22, dxtf, dytf) lists
+        """
+        return self._m11, self._m12, self._m21, self._m22, self._dx, self._dy
+
+    def det(self) -> list[float]:
+        """get the determinant of each matrix
+
+        Returns:
+            list[float]: determinant values
+        """
+        return [m11 * m22 - m12 * m21
+                for m11, m12, m21, m22 in zip(self._m11, self._m12, self._m21, self._m22)]
+
+    def inverted(self) -> Matrix2DArray:
+        """get the inverted matrices
+
+        a matrix that isn't invertible becomes the identity matrix as Matrix2D.inverted().
+
+        Returns:
+            Matrix2DArray: new array object
+        """
+        result = ([], [], [], [], [], [])
+        i11, i12, i21, i22, i_x, i_y = result
+        for m11, m12, m21, m22, d_x, d_y in zip(self._m11, self._m12, self._m21,
+                                                 self._m22, self._dx, self._dy):
+            determinant = m11 * m22 - m12 * m21
+            if determinant == 0.0:  # not invertible
+                i11.append(1.0)
+                i12.append(0.0)
+                i21.append(0.0)
+                i22.append(1.0)
+                i_x.append(0.0)
+                i_y.append(0.0)
+                continue
+            dinv = 1.0 / determinant
+            i11.append(m22 * dinv)
+            i12.append(-m12 * dinv)
+            i21.append(-m21 * dinv)
+            i22.append(m11 * dinv)
+            i_x.append((m12 * d_y - d_x * m22) * dinv)
+            i_y.append((d_x * m21 - m11 * d_y) * dinv)
+        return Matrix2DArray.from_elements(*result)
+
+    def __mul__(self, other: Union[Matrix2DArray, Matrix2D]) -> Matrix2DArray:
+        """elementwise multiplication operator. self[i] * other[i]
+
+        a Matrix2D or an array with one item is applied to all items.
+        use Matrix2DArray([matrix]) * array for a Matrix2D on the left hand side.
+
+        Args:
+            other (Union[Matrix2DArray, Matrix2D]): right hand side matrices
+
+        Returns:
+            Matrix2DArray: new array object
+        """
+        if isinstance(other, Matrix2D):
+            other = Matrix2DArray([other])
+        size = self.size()
+        other_size = other.size()
+        if size == 1 and other_size != 1:
+            lhs = (self._m11 * other_size, self._m12 * other_size, self._m21 * other_size,
+                   self._m22 * other_size, self._dx * other_size, self._dy * other_size)
+        else:
+            lhs = (self._m11, self._m12, self._m21, self._m22, self._dx, self._dy)
+        if other_size == 1 and size != 1:
+            rhs = (other._m11 * size, other._m12 * size, other._m21 * size,
+                   other._m22 * size, other._dx * size, other._dy * size)
+        else:
+            rhs = (other._m11, other._m12, other._m21, other._m22, other._dx, other._dy)
+        if len(lhs[0]) != len(rhs[0]):
+            raise Exception("Matrix2DArray: the sizes of the arrays must be same or 1")
+
+        result = ([], [], [], [], [], [])
+        r11, r12, r21, r22, r_x, r_y = result
+        for a11, a12, a21, a22, a_x, a_y, b11, b12, b21, b22, b_x, b_y in zip(*lhs, *rhs):
+            r11.append(a11 * b11 + a12 * b21)
+            r12.append(a11 * b12 + a12 * b22)
+            r21.append(a21 * b11 + a22 * b21)
+            r22.append(a21 * b12 + a22 * b22)
+            r_x.append(a11 * b_x + a12 * b_y + a_x)
+            r_y.append(a21 * b_x + a22 * b_y + a_y)
+        return Matrix2DArray.from_elements(*result)
+
+    def transform_point(self, point: Vector2D) -> list[Vector2D]:
+        """transform one point by all matrices
+
+        Args:
+            point (Vector2D): input point
+
+        Returns:
+            list[Vector2D]: new mapped vector of each matrix
+        """
+        p_x = point.x()
+        p_y = point.y()
+        return [Vector2D(m11 * p_x + m12 * p_y + d_x, m21 * p_x + m22 * p_y + d_y)
+                for m11, m12, m21, m22, d_x, d_y in zip(self._m11, self._m12, self._m21,
+                                                         self._m22, self._dx, self._dy)]
+
+    def transform_points(self, points) -> list[Vector2D]:
+        """transform the i-th point by the i-th matrix
+
+        Args:
+            points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array.
+                the number of points must be same as the number of matrices
+
+        Returns:
+            list[Vector2D]: new mapped vectors
+        """
+        coords = to_coords(points)
+        if len(coords) != self.size():
+            raise Exception("Matrix2DArray: the number of points must be same as the size")
+        return [Vector2D(m11 * p_x + m12 * p_y + d_x, m21 * p_x + m22 * p_y + d_y)
+                for (p_x, p_y), m11, m12, m21, m22, d_x, d_y
+                in zip(coords, self._m11, self._m12, self._m21, self._m22, self._dx, self._dy)]
+
+    def transform_coords(self, coords, out=None):
+        """transform a flat coordinate buffer, the i-th point by the i-th matrix
+
+        Args:
+            coords: flat coordinates [x0, y0, x1, y1, ...] of size points
+            out (optional): buffer to write the result, can be coords itself.
+                Defaults to None (create a new list).
+
+        Returns:
+            flat transformed coordinates (out if given)
+        """
+        if len(coords) != 2 * self.size():
+            raise Exception("Matrix2DArray: the number of points must be same as the size")
+        if out is None:
+            out = [0.0] * len(coords)
+        for i, (m11, m12, m21, m22, d_x, d_y) in enumerate(zip(self._m11, self._m12, self._m21,
+                                                                self._m22, self._dx, self._dy)):
+            p_x = coords[2 * i]
+            p_y = coords[2 * i + 1]
+            out[2 * i] = m11 * p_x + m12 * p_y + d_x
+            out[2 * i + 1] = m21 * p_x + m22 * p_y + d_y
+        return out
+
+    def __repr__(self) -> str:
+        """represent the Matrix2DArray as a string
+
+        Returns:
+            str: contains the elements of each matrix
+        """
+        return f"{[self.matrix(i) for i in range(self.size())]}"
@@ -0,0 +1,213 @@
+""" player_type.py file
+    PlayerType: class name
+    Movement parameters of a (heterogeneous) player type
+"""
+from __future__ import annotations
+
+
+class PlayerType:
+    """ handling player type parameters in SS2D
+
+    the default values are the default player type of rcssserver. server
+    parameters used by the movement model (dash power, dash rates, moment and
+    ball size) are kept together, so one object describes how a player moves.
+    player types with the same parameters are equal and have the same hash.
+
+    Attributes:
+        _player_speed_max: max speed
+        _player_decay: speed decay per cycle
+        _inertia_moment: inertia moment for turn
+        _dash_power_rate: dash power rate
+        _player_size: body radius
+        _kickable_margin: kickable area margin
+        _effort_max: max effort
+        _max_dash_power: server max dash power
+        _max_moment: server max turn moment
+        _back_dash_rate: server back dash rate
+        _side_dash_rate: server side dash rate
+        _dash_angle_step: server dash direction step in degree
+        _ball_size: server ball radius
+    """
+
+    def __init__(self, player_speed_max: float = 1.05, player_decay: float = 0.4,
+                 inertia_moment: float = 5.0, dash_power_rate: float = 0.006,
+                 player_size: float = 0.3, kickable_margin: float = 0.7,
+                 effort_max: float = 1.0, max_dash_power: float = 100.0,
+                 max_moment: float = 180.0, back_dash_rate: float = 0.7,
+                 side_dash_rate: float = 0.4, dash_angle_step: float = 45.0,
+                 ball_size: float = 0.085):
+        """This is the class init function and sets the parameters.
+
+        Defualt:
+            create the default player type of rcssserver
+        OR
+            create a player type with given parameters
+        Args:
+            player_speed_max (float, optional): max speed. Defaults to 1.05.
+            player_decay (float, optional): speed decay. Defaults to 0.4.
+            inertia_moment (float, optional): inertia moment. Defaults to 5.0.
+            dash_power_rate (float, optional): dash power rate. Defaults to 0.006.
+            player_size (float, optional): body radius. Defaults to 0.3.
+            kickable_margin (float, optional): kickable area margin. Defaults to 0.7.
+            effort_max (float, optional): max effort. Defaults to 1.0.
+            max_dash_power (float, optional): max dash power. Defaults to 100.0.
+            max_moment (float, optional): max turn moment. Defaults to 180.0.
+            back_dash_rate (float, optional): back dash rate. Defaults to 0.7.
+            side_dash_rate (float, optional): side dash rate. Defaults to 0.4.
+            dash_angle_step (float, optional): dash direction step. Defaults to 45.0.
+            ball_size (float, optional): ball radius. Defaults to 0.085.
+        """
+        self._player_speed_max = player_speed_max
+        self._player_decay = player_decay
+        self._inertia_moment = inertia_moment
+        self._dash_power_rate = dash_power_rate
+        self._player_size = player_size
+        self._kickable_margin = kickable_margin
+        self._effort_max = effort_max
+        self._max_dash_power = max_dash_power
+        self._max_moment = max_moment
+        self._back_dash_rate = back_dash_rate
+        self._side_dash_rate = side_dash_rate
+        self._dash_angle_step = dash_angle_step
+        self._ball_size = ball_size
+
+    def player_speed_max(self) -> float:
+        """get the max speed
+
+        Returns:
+            float: max speed
+        """
+        return self._player_speed_max
+
+    def player_decay(self) -> float:
+        """get the speed decay
+
+        Returns:
+            float: speed decay per cycle
+        """
+        return self._player_decay
+
+    def inertia_moment(self) -> float:
+        """get the inertia moment
+
+        Returns:
+            float: inertia moment
+        """
+        return self._inertia_moment
+
+    def dash_power_rate(self) -> float:
+        """get the dash power rate
+
+        Returns:
+            float: dash power rate
+        """
+        return self._dash_power_rate
+
+    def player_size(self) -> float:
+        """get the body radius
+
+        Returns:
+            float: body radius
+        """
+        return self._player_size
+
+    def kickable_margin(self) -> float:
+        """get the kickable area margin
+
+        Returns:
+            float: kickable area margin
+        """
+        return self._kickable_margin
+
+    def effort_max(self) -> float:
+        """get the max effort
+
+        Returns:
+            float: max effort
+        """
+        return self._effort_max
+
+    def max_dash_power(self) -> float:
+        """get the max dash power
+
+        Returns:
+            float: max dash power
+        """
+        return self._max_dash_power
+
+    def max_moment(self) -> float:
+        """get the max turn moment
+
+        Returns:
+            float: max turn moment
+        """
+        return self._max_moment
+
+    def back_dash_rate(self) -> float:
+        """get the back dash rate
+
+        Returns:
+            float: back dash rate
+        """
+        return self._back_dash_rate
+
+    def side_dash_rate(self) -> float:
+        """get the side dash rate
+
+        Returns:
+            float: side dash rate
+        """
+        return self._side_dash_rate
+
+    def dash_angle_step(self) -> float:
+        """get the dash direction step
+
+        Returns:
+            float: dash direction step in degree
+        """
+        return self._dash_angle_step
+
+    def ball_size(self) -> float:
+        """get the ball radius
+
+        Returns:
+            float: ball radius
+        """
+        return self._ball_size
+
+    def kickable_area(self) -> float:
+        """get the kickable area radius
+
+        Returns:
+            float: player_size + kickable_margin + ball_size
+        """
+        return self._player_size + self._kickable_margin + self._ball_size
+
+    def parameters(self) -> tuple:
+        """get all parameters
+
+        Returns:
+            tuple: parameters in the order of the init function arguments
+        """
+        return (self._player_speed_max, self._player_decay, self._inertia_moment,
+                self._dash_power_rate, self._player_size, self._kickable_margin,
+                self._effort_max, self._max_dash_power, self._max_moment,
+                self._back_dash_rate, self._side_dash_rate, self._dash_angle_step,
+                self._ball_size)
+
+    def __hash__(self):
+        return hash(self.parameters())
+
+    def __eq__(self, other: PlayerType) -> bool:
+        return isinstance(other, PlayerType) and self.parameters() == other.parameters()
+
+    def __repr__(self) -> str:
+        """represent the player type as a string
+
+        Returns:
+            str: contains the main parameters
+        """
+        return (f"(speed_max: {self._player_speed_max}, decay: {self._player_decay},"
+                f" inertia_moment: {self._inertia_moment},"
+                f" dash_power_rate: {self._dash_power_rate},"
+                f" kickable_margin: {self._kickable_margin})")
@@ -2,15 +2,42 @@
     Polygon2D: class name
 """
 from __future__ import annotations
+from typing import Union
+from enum import Enum, unique, auto
+import heapq
 import math
 
 from pyrusgeom.rect_2d import Rect2D
 from pyrusgeom.region_2d import Region2D
-from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.vector_2d import Vector2D, unique_points
 from pyrusgeom.angle_deg import AngleDeg
 from pyrusgeom.size_2d import Size2D
 from pyrusgeom.line_2d import Line2D
-from pyrusgeom.segment_2d import Segment2D
+from pyrusgeom.segment_2d import Segment2D, segment_dist2
+from pyrusgeom.edge_tree_2d import EdgeTree2D
+from pyrusgeom.math_values import EPSILON, PI
+
+
+@unique
+class SimplifyType(Enum):
+    """ SimplifyType
+        Polygon simplification algorithms:
+            DOUGLAS_PEUCKER
+            VISVALINGAM_WHYATT
+    """
+    DOUGLAS_PEUCKER = auto()
+    VISVALINGAM_WHYATT = auto()
+
+
+@unique
+class JoinType(Enum):
+    """ JoinType
+        Corner types of an offset polygon:
+            MITER: sharp corners
+            ROUND: corners approximated by arc segments
+    """
+    MITER = auto()
+    ROUND = auto()
 
 
 class XLessEqual:
@@ -144,6 +171,7 @@ class Polygon2D(Region2D):
         """
         super().__init__()
         self._vertices:list[Vector2D] = []
+        self._edge_tree: EdgeTree2D = None
         if len(args) == 0:
             self._vertices = [Vector2D()]
         elif isinstance(args[0], list):
@@ -157,6 +185,7 @@ class Polygon2D(Region2D):
         """clear all data.
         """
         self._vertices = [Vector2D()]
+        self._edge_tree = None
 
     def assign(self, points:list[Vector2D]) -> Polygon2D:
         """set polygon with given points and returns a reference to itself
@@ -167,6 +196,7 @@ class Polygon2D(Region2D):
         """
         if len(points) > 0:
             self._vertices = points.copy()
+            self._edge_tree = None
         return self
 
     def add_vertex(self, point: Vector2D) -> None:
@@ -176,6 +206,22 @@ class Polygon2D(Region2D):
             point(Vector2d): point to add
         """
         self._vertices.append(point)
+        self._edge_tree = None
+
+    def remove_duplicate_vertices(self, tolerance: float = 0.0) -> Polygon2D:
+        """remove duplicated vertices in linear time and returns a reference to itself
+
+        the first occurrence of each vertex is kept in the vertex order.
+
+        Args:
+            tolerance (float, optional): snapping distance. Defaults to 0.0 (exact equality).
+
+        Returns:
+            Polygon2D: return itself
+        """
+        self._vertices = unique_points(self._vertices, tolerance)
+        self._edge_tree = None
+        return self
 
     def vertices(self) -> list[Vector2D]:
         """get a copy list from the vertex container
@@ -194,6 +240,21 @@ class Polygon2D(Region2D):
         """
         return self._vertices
 
+    def edge_tree(self) -> EdgeTree2D:
+        """get the edge tree of this polygon for fast dist, nearest point and
+        ray queries on large polygons.
+
+        the tree is created on the first call and its nodes are built on the
+        first query. it is dropped by assign(), add_vertex() and clear(), but
+        not by direct edits through vertices_().
+
+        Returns:
+            EdgeTree2D: edge tree of the current vertices
+        """
+        if self._edge_tree is None:
+            self._edge_tree = EdgeTree2D(self._vertices)
+        return self._edge_tree
+
     def get_bounding_box(self) -> Rect2D:
         """get bounding box of this polygon
 
@@ -353,12 +414,13 @@ class Polygon2D(Region2D):
         if size < 3:
             return ds_area_value
 
+        xs = [point.x() for point in self._vertices]
+        ys = [point.y() for point in self._vertices]
         for i in range(size):
             n_count = i + 1
             if n_count == size:
                 n_count = 0
-            ds_area_value += (self._vertices[i].x() * self._vertices[n_count].y()
-                              - self._vertices[n_count].x() * self._vertices[i].y())
+            ds_area_value += xs[i] * ys[n_count] - xs[n_count] * ys[i]
 
         return ds_area_value
 
@@ -429,9 +491,10 @@ class Polygon2D(Region2D):
             list[Vector2D]: a list contains the final points
         """
         new_points = []
-        in_rectangle = []
-        for point in points:
-            in_rectangle.append(in_region(point))
+        in_rectangle = [in_region(point) for point in points]
+        line_a = line.a()
+        line_b = line.b()
+        line_c = line.c()
         for i in range(len(points)):
             index_0 = i
             index_1 = i + 1
@@ -441,25 +504,392 @@ class Polygon2D(Region2D):
             p_0 = points[index_0]
             p_1 = points[index_1]
 
-            if in_rectangle[index_0]:
+            if in_rectangle[index_0] and in_rectangle[index_1]:
+                new_points.append(p_1)
+            elif in_rectangle[index_0] or in_rectangle[index_1]:
+                # intersection with the line through p_0 and p_1, same as
+                # line.intersection(Line2D(p_0, p_1)) without creating the edge line
+                edge_a = -(p_1.y() - p_0.y())
+                edge_b = p_1.x() - p_0.x()
+                edge_c = -edge_a * p_0.x() - edge_b * p_0.y()
+                tmp = line_a * edge_b - line_b * edge_a
+                if math.fabs(tmp) < EPSILON:
+                    return new_points
+
+                new_points.append(Vector2D((line_b * edge_c - edge_b * line_c) / tmp,
+                                           (edge_a * line_c - line_a * edge_c) / tmp))
                 if in_rectangle[index_1]:
                     new_points.append(p_1)
-                else:
-                    cuted = line.intersection(Line2D(p_0, p_1))
+        return new_points
+
+    def get_convex_clipped_polygon(self, clipper: Union[Polygon2D, list[Line2D]]) -> Polygon2D:
+        """get this polygon clipped by a convex polygon or by a list of half-planes
+
+        Sutherland-Hodgman clipping. each Line2D keeps the points on its left
+        side (a * x + b * y + c >= 0), so Line2D(p_0, p_1) keeps the left side
+        of the direction p_0 -> p_1. a convex clipper polygon may be given in
+        clockwise or counterclockwise order.
+
+        Args:
+            clipper (Union[Polygon2D, list[Line2D]]): convex polygon or half-planes
+
+        Returns:
+            Polygon2D: clipped polygon, empty if nothing remains
+        """
+        if isinstance(clipper, Polygon2D):
+            half_planes = clipper.get_half_planes()
+        else:
+            half_planes = clipper
+        return Polygon2D(Polygon2D.get_half_planes_clipped_polygon(self._vertices, half_planes))
+
+    def get_half_planes(self) -> list[Line2D]:
+        """get the half-planes whose intersection is this convex polygon
+
+        every returned line keeps the inside of the polygon on its left side.
+        zero length edges are skipped.
+
+        Returns:
+            list[Line2D]: one line for each edge
+        """
+        size = len(self._vertices)
+        sign = -1.0 if self.double_signed_area() < 0.0 else 1.0
+        half_planes = []
+        for i in range(size):
+            p_0 = self._vertices[i - 1]
+            p_1 = self._vertices[i]
+            edge_a = -(p_1.y() - p_0.y()) * sign
+            edge_b = (p_1.x() - p_0.x()) * sign
+            if edge_a == 0.0 and edge_b == 0.0:
+                continue
+            half_planes.append(Line2D(edge_a, edge_b, -edge_a * p_0.x() - edge_b * p_0.y()))
+        return half_planes
+
+    @staticmethod
+    def get_half_planes_clipped_polygon(points: list[Vector2D],
+                                        half_planes: list[Line2D]) -> list[Vector2D]:
+        """get points clipped by the intersection of some half-planes
+
+        every stage writes into one preallocated coordinate buffer, and the
+        crossing points are calculated directly from the signed distances of
+        the edge end points, so no Line2D or Vector2D is created until the end.
+
+        Args:
+            points (list[Vector2D]): polygon vertices
+            half_planes (list[Line2D]): each line keeps its left side (a * x + b * y + c >= 0)
 
-                    if not cuted.is_valid():
-                        return new_points
-                    new_points.append(cuted)
+        Returns:
+            list[Vector2D]: a list contains the final points
+        """
+        size = len(points)
+        xs = [point.x() for point in points]
+        ys = [point.y() for point in points]
+        for half_plane in half_planes:
+            if size == 0:
+                break
+            plane_a = half_plane.a()
+            plane_b = half_plane.b()
+            plane_c = half_plane.c()
+            # each input vertex emits at most two output vertices
+            out_xs = [0.0] * (2 * size)
+            out_ys = [0.0] * (2 * size)
+            count = 0
+            prev_x = xs[size - 1]
+            prev_y = ys[size - 1]
+            prev_d = plane_a * prev_x + plane_b * prev_y + plane_c
+            for i in range(size):
+                cur_x = xs[i]
+                cur_y = ys[i]
+                cur_d = plane_a * cur_x + plane_b * cur_y + plane_c
+                if (cur_d >= 0.0) != (prev_d >= 0.0):
+                    rate = prev_d / (prev_d - cur_d)
+                    out_xs[count] = prev_x + (cur_x - prev_x) * rate
+                    out_ys[count] = prev_y + (cur_y - prev_y) * rate
+                    count += 1
+                if cur_d >= 0.0:
+                    out_xs[count] = cur_x
+                    out_ys[count] = cur_y
+                    count += 1
+                prev_x = cur_x
+                prev_y = cur_y
+                prev_d = cur_d
+            xs = out_xs
+            ys = out_ys
+            size = count
+        return [Vector2D(xs[i], ys[i]) for i in range(size)]
+
+    def simplified(self, tolerance: float,
+                   m_type: SimplifyType = SimplifyType.DOUGLAS_PEUCKER) -> Polygon2D:
+        """get a simplified polygon by specified method
+
+        the result keeps a subset of the vertices and its Hausdorff distance
+        from this polygon outline is never more than tolerance.
+
+        Args:
+            tolerance (float): maximum allowed distance from the original outline
+            m_type (SimplifyType): the specified method id
+
+        Returns:
+            Polygon2D: simplified polygon
+        """
+        if m_type == SimplifyType.VISVALINGAM_WHYATT:
+            return self.visvalingam_simplified(tolerance)
+        return self.douglas_peucker_simplified(tolerance)
+
+    def douglas_peucker_simplified(self, tolerance: float) -> Polygon2D:
+        """get a polygon simplified by Douglas-Peucker method
+
+        the ring is split at vertex 0 and the vertex farthest from it, and each
+        chain is refined with an explicit stack. O(n log n) on average when
+        the splits are balanced, and O(n^2) in the worst case when each split
+        keeps only one vertex. at least 3 vertices are kept like
+        visvalingam_simplified(): if only the two split vertices are left,
+        the vertex farthest from the segment between them is also kept.
+
+        Args:
+            tolerance (float): maximum allowed distance from the original outline
+
+        Returns:
+            Polygon2D: simplified polygon
+        """
+        size = len(self._vertices)
+        if size <= 3:
+            return Polygon2D(self._vertices)
+
+        xs = [point.x() for point in self._vertices]
+        ys = [point.y() for point in self._vertices]
+        tol2 = tolerance * tolerance
+
+        far_index = 0
+        far_dist2 = -1.0
+        for i in range(1, size):
+            dist2 = (xs[i] - xs[0]) ** 2 + (ys[i] - ys[0]) ** 2
+            if dist2 > far_dist2:
+                far_dist2 = dist2
+                far_index = i
+
+        keep = [False] * size
+        keep[0] = True
+        keep[far_index] = True
+        # the closing chain ends at index size, which stands for vertex 0
+        stack = [(0, far_index), (far_index, size)]
+        while stack:
+            first, last = stack.pop()
+            a_x = xs[first]
+            a_y = ys[first]
+            b_x = xs[last % size]
+            b_y = ys[last % size]
+            max_dist2 = -1.0
+            max_index = -1
+            for i in range(first + 1, last):
+                dist2 = segment_dist2(xs[i], ys[i], a_x, a_y, b_x, b_y)
+                if dist2 > max_dist2:
+                    max_dist2 = dist2
+                    max_index = i
+            if max_index != -1 and max_dist2 > tol2:
+                keep[max_index] = True
+                stack.append((first, max_index))
+                stack.append((max_index, last))
+
+        if keep.count(True) < 3:
+            a_x = xs[0]
+            a_y = ys[0]
+            b_x = xs[far_index]
+            b_y = ys[far_index]
+            third = max((i for i in range(size) if not keep[i]),
+                        key=lambda i: segment_dist2(xs[i], ys[i], a_x, a_y, b_x, b_y))
+            keep[third] = True
+
+        return Polygon2D([self._vertices[i] for i in range(size) if keep[i]])
+
+    def visvalingam_simplified(self, tolerance: float) -> Polygon2D:
+        """get a polygon simplified by Visvalingam-Whyatt method
+
+        vertices are removed in order of their effective triangle area using a
+        heap. each current edge carries an upper bound of the distance from
+        the original vertices it covers. removing vertex i replaces the edges
+        (prev, i) and (i, next) by (prev, next), and every covered vertex is
+        within max(bound of the two edges) + distance(i, new edge) of the new
+        edge, so a vertex is removed only if this bound is within tolerance.
+        the check is O(1), so the whole method is O(n log n), and the same
+        Hausdorff bound as Douglas-Peucker holds. the bound is conservative,
+        so a few more vertices may be kept than by an exact check.
+
+        Args:
+            tolerance (float): maximum allowed distance from the original outline
+
+        Returns:
+            Polygon2D: simplified polygon
+        """
+        size = len(self._vertices)
+        if size <= 3:
+            return Polygon2D(self._vertices)
+
+        xs = [point.x() for point in self._vertices]
+        ys = [point.y() for point in self._vertices]
+        prev = [i - 1 for i in range(size)]
+        prev[0] = size - 1
+        nxt = [i + 1 for i in range(size)]
+        nxt[size - 1] = 0
+        removed = [False] * size
+        stamp = [0] * size
+        # upper bound of the distance from the covered vertices to edge (i, nxt[i])
+        errors = [0.0] * size
+
+        def effective_area(i: int) -> float:
+            p_i = prev[i]
+            n_i = nxt[i]
+            return math.fabs((xs[p_i] - xs[i]) * (ys[n_i] - ys[i])
+                             - (xs[n_i] - xs[i]) * (ys[p_i] - ys[i])) * 0.5
+
+        def merged_error(i: int) -> float:
+            p_i = prev[i]
+            n_i = nxt[i]
+            return (max(errors[p_i], errors[i])
+                    + math.sqrt(segment_dist2(xs[i], ys[i], xs[p_i], ys[p_i], xs[n_i], ys[n_i])))
+
+        heap = [(effective_area(i), i, 0) for i in range(size)]
+        heapq.heapify(heap)
+        alive = size
+        while heap and alive > 3:
+            area, i, i_stamp = heapq.heappop(heap)
+            if removed[i] or i_stamp != stamp[i]:
+                continue
+            error = merged_error(i)
+            if error > tolerance:
+                continue
+            removed[i] = True
+            errors[prev[i]] = error
+            alive -= 1
+            p_i = prev[i]
+            n_i = nxt[i]
+            nxt[p_i] = n_i
+            prev[n_i] = p_i
+            for j in (p_i, n_i):
+                stamp[j] += 1
+                heapq.heappush(heap, (max(area, effective_area(j)), j, stamp[j]))
+
+        return Polygon2D([self._vertices[i] for i in range(size) if not removed[i]])
+
+    def minkowski_sum(self, other: Polygon2D) -> Polygon2D:
+        """get the Minkowski sum of this convex polygon and other convex polygon
+
+        both edge sequences are merged by their direction in O(n + m).
+        the polygons may be given in clockwise or counterclockwise order.
+
+        Args:
+            other (Polygon2D): other convex polygon
+
+        Returns:
+            Polygon2D: convex polygon in counterclockwise order
+        """
+        lhs = self._counter_clockwise_coords()
+        rhs = other._counter_clockwise_coords()
+        size_l = len(lhs)
+        size_r = len(rhs)
+        if size_l == 0 or size_r == 0:
+            return Polygon2D([])
+
+        result = []
+        i = 0
+        j = 0
+        while i < size_l or j < size_r:
+            l_x, l_y = lhs[i % size_l]
+            r_x, r_y = rhs[j % size_r]
+            result.append(Vector2D(l_x + r_x, l_y + r_y))
+            ln_x, ln_y = lhs[(i + 1) % size_l]
+            rn_x, rn_y = rhs[(j + 1) % size_r]
+            cross = (ln_x - l_x) * (rn_y - r_y) - (ln_y - l_y) * (rn_x - r_x)
+            if i < size_l and (cross > 0.0 or j == size_r):
+                i += 1
+            elif j < size_r and (cross < 0.0 or i == size_l):
+                j += 1
             else:
-                if in_rectangle[index_1]:
-                    cuted = line.intersection(Line2D(p_0, p_1))
+                i += 1
+                j += 1
+        return Polygon2D(result)
 
-                    if not cuted.is_valid():
-                        return new_points
+    def offset(self, distance: float, join: JoinType = JoinType.ROUND,
+               arc_segments: int = 16) -> Polygon2D:
+        """get this convex polygon inflated (or deflated) by distance
 
-                    new_points.append(cuted)
-                    new_points.append(p_1)
-        return new_points
+        round corners are built from tangent lines of the corner arc, so the
+        result always contains every point whose distance from this polygon is
+        less than distance. miter corners turning more than 90 degrees are
+        split into several miters to bound the spike length. a negative
+        distance moves every edge inward.
+
+        Args:
+            distance (float): offset length. negative value shrinks the polygon
+            join (JoinType): corner type. Defaults to JoinType.ROUND
+            arc_segments (int): number of arc segments for a full circle
+                (used by JoinType.ROUND). Defaults to 16
+
+        Returns:
+            Polygon2D: offset polygon in counterclockwise order
+        """
+        coords = self._counter_clockwise_coords()
+        size = len(coords)
+        if size == 0:
+            return Polygon2D([])
+        if distance <= 0.0:
+            half_planes = []
+            for line in self.get_half_planes():
+                length = math.sqrt(line.a() * line.a() + line.b() * line.b())
+                half_planes.append(Line2D(line.a(), line.b(), line.c() + distance * length))
+            ccw_vertices = [Vector2D(p_x, p_y) for p_x, p_y in coords]
+            return Polygon2D(Polygon2D.get_half_planes_clipped_polygon(ccw_vertices, half_planes))
+
+        coords = [coord for i, coord in enumerate(coords) if coord != coords[i - 1]] or coords[:1]
+        size = len(coords)
+        # outward unit normal of the edge i -> i + 1
+        normals = []
+        for i in range(size):
+            d_x = coords[(i + 1) % size][0] - coords[i][0]
+            d_y = coords[(i + 1) % size][1] - coords[i][1]
+            length = math.sqrt(d_x * d_x + d_y * d_y)
+            normals.append((d_y / length, -d_x / length) if length > 0.0 else (1.0, 0.0))
+
+        step = 2.0 * PI / max(1, arc_segments)
+        result = []
+        for i in range(size):
+            p_x, p_y = coords[i]
+            in_x, in_y = normals[i - 1]
+            out_x, out_y = normals[i]
+            turn = math.atan2(in_x * out_y - in_y * out_x, in_x * out_x + in_y * out_y)
+            if size == 1:
+                turn = 2.0 * PI
+            elif turn <= -PI + EPSILON:
+                # a reversed edge, e.g. both ends of a segment
+                turn += 2.0 * PI
+            if turn < EPSILON:
+                result.append(Vector2D(p_x + in_x * distance, p_y + in_y * distance))
+                continue
+            # corners turning more than 90 degrees get several miters
+            count = max(1, int(math.ceil(turn / (PI * 0.5) - EPSILON)))
+            if join == JoinType.ROUND:
+                count = max(count, int(math.ceil(turn / step - EPSILON)))
+            delta = turn / count
+            radius = distance / math.cos(delta * 0.5)
+            base = math.atan2(in_y, in_x) + delta * 0.5
+            for j in range(count):
+                angle = base + delta * j
+                result.append(Vector2D(p_x + radius * math.cos(angle),
+                                       p_y + radius * math.sin(angle)))
+        return Polygon2D(result)
+
+    def _counter_clockwise_coords(self) -> list:
+        """get vertex coordinates in counterclockwise order starting from the lowest vertex
+
+        Returns:
+            list: list of (x, y) tuples
+        """
+        coords = [(point.x(), point.y()) for point in self._vertices]
+        if self.double_signed_area() < 0.0:
+            coords.reverse()
+        if len(coords) == 0:
+            return coords
+        start = min(range(len(coords)), key=lambda i: (coords[i][1], coords[i][0]))
+        return coords[start:] + coords[:start]
 
     def __repr__(self):
         """represent the polygon as a string
@@ -0,0 +1,306 @@
+""" polygon_set_2d.py file
+    PolygonSet2D: class name
+    Many polygons stored in one flat coordinate buffer
+"""
+from __future__ import annotations
+from typing import Union
+import math
+
+from pyrusgeom.polygon_2d import Polygon2D
+from pyrusgeom.rect_2d import Rect2D
+from pyrusgeom.size_2d import Size2D
+from pyrusgeom.vector_2d import Vector2D
+
+
+class PolygonSet2D:
+    """ handling many polygons at once in SS2D
+
+    all vertices are kept in one flat buffer, so area, orientation, centroid
+    and bounding box of every polygon are computed in one pass without any
+    method call per vertex. results are cached per polygon until that
+    polygon is replaced by set_polygon().
+
+    Attributes:
+        _coords: flat coordinate buffer [x0, y0, x1, y1, ...] of all polygons
+        _offsets: polygon i uses the vertices [_offsets[i], _offsets[i + 1])
+        _areas: cached double signed area of each polygon or None
+        _centroids: cached centroid (x, y) of each polygon or None
+        _boxes: cached bounding box (min_x, min_y, max_x, max_y) of each polygon or None
+    """
+
+    def __init__(self, polygons: list = None):
+        """This is the class init function and creates the polygon set.
+
+        Defualt:
+            create an empty set
+        OR
+            create a set with given polygons
+        Args:
+            polygons (list, optional): list of Polygon2D or vertex lists. Defaults to None.
+        """
+        self._coords: list[float] = []
+        self._offsets: list[int] = [0]
+        self._areas: list = []
+        self._centroids: list = []
+        self._boxes: list = []
+        if polygons is not None:
+            for polygon in polygons:
+                self.add_polygon(polygon)
+
+    def add_polygon(self, polygon: Union[Polygon2D, list[Vector2D]]) -> int:
+        """append a polygon to the set
+
+        Args:
+            polygon (Union[Polygon2D, list[Vector2D]]): polygon or its vertices
+
+        Returns:
+            int: index of the added polygon
+        """
+        self._coords.extend(PolygonSet2D._flatten(polygon))
+        self._offsets.append(len(self._coords) // 2)
+        self._areas.append(None)
+        self._centroids.append(None)
+        self._boxes.append(None)
+        return len(self._offsets) - 2
+
+    def set_polygon(self, index: int, polygon: Union[Polygon2D, list[Vector2D]]) -> None:
+        """replace a polygon and drop its cached results
+
+        Args:
+            index (int): polygon index
+            polygon (Union[Polygon2D, list[Vector2D]]): new polygon or its vertices
+        """
+        coords = PolygonSet2D._flatten(polygon)
+        first = self._offsets[index] * 2
+        last = self._offsets[index + 1] * 2
+        self._coords[first:last] = coords
+        shift = len(coords) // 2 - (last - first) // 2
+        if shift != 0:
+            for i in range(index + 1, len(self._offsets)):
+                self._offsets[i] += shift
+        self._areas[index] = None
+        self._centroids[index] = None
+        self._boxes[index] = None
+
+    def size(self) -> int:
+        """get the number of polygons
+
+        Returns:
+            int: number of polygons
+        """
+        return len(self._offsets) - 1
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def vertex_count(self, index: int) -> int:
+        """get the number of vertices of a polygon
+
+        Args:
+            index (int): polygon index
+
+        Returns:
+            int: number of vertices
+        """
+        return self._offsets[index + 1] - self._offsets[index]
+
+    def coords_(self) -> list[float]:
+        """get the reference to the flat coordinate buffer
+
+        Returns:
+            list[float]: [x0, y0, x1, y1, ...] of all polygons
+        """
+        return self._coords
+
+    def offsets_(self) -> list[int]:
+        """get the reference to the vertex offsets
+
+        Returns:
+            list[int]: polygon i uses the vertices [offsets[i], offsets[i + 1])
+        """
+        return self._offsets
+
+    def polygon(self, index: int) -> Polygon2D:
+        """create a Polygon2D from a polygon of the set
+
+        Args:
+            index (int): polygon index
+
+        Returns:
+            Polygon2D: new polygon object
+        """
+        coords = self._coords
+        return Polygon2D([Vector2D(coords[2 * i], coords[2 * i + 1])
+                          for i in range(self._offsets[index], self._offsets[index + 1])])
+
+    def double_signed_areas(self) -> list[float]:
+        """calculate doubled signed area values of all polygons
+
+        same value as Polygon2D.double_signed_area()
+
+        Returns:
+            list[float]: doubled signed area of each polygon
+        """
+        self._update()
+        return self._areas.copy()
+
+    def signed_areas(self) -> list[float]:
+        """calculate signed area values of all polygons
+
+        Returns:
+            list[float]: signed area of each polygon
+        """
+        self._update()
+        return [area * 0.5 for area in self._areas]
+
+    def areas(self) -> list[float]:
+        """calculate area values of all polygons
+
+        Returns:
+            list[float]: area of each polygon
+        """
+        self._update()
+        return [math.fabs(area * 0.5) for area in self._areas]
+
+    def orientations(self) -> list[int]:
+        """get vertex order of all polygons
+
+        Returns:
+            list[int]: 1 if counterclockwise, -1 if clockwise, 0 otherwise
+        """
+        self._update()
+        return [1 if area > 0.0 else -1 if area < 0.0 else 0 for area in self._areas]
+
+    def is_counter_clockwise(self, index: int) -> bool:
+        """check vertexes of a polygon is placed counterclockwise ot not
+
+        Args:
+            index (int): polygon index
+
+        Returns:
+            bool: True if counterclockwise. else false
+        """
+        self._update()
+        return self._areas[index] > 0.0
+
+    def is_clockwise(self, index: int) -> bool:
+        """check vertexes of a polygon is placed clockwise ot not
+
+        Args:
+            index (int): polygon index
+
+        Returns:
+            bool: True if clockwise. else false
+        """
+        self._update()
+        return self._areas[index] < 0.0
+
+    def centroids(self) -> list[Vector2D]:
+        """calculate area centroids of all polygons
+
+        the mean of the vertices is used for a polygon without area.
+
+        Returns:
+            list[Vector2D]: centroid of each polygon. invalid vector for an empty polygon
+        """
+        self._update()
+        result = []
+        for centroid in self._centroids:
+            if centroid is None:
+                result.append(Vector2D.invalid())
+            else:
+                result.append(Vector2D(centroid[0], centroid[1]))
+        return result
+
+    def bounding_boxes(self) -> list[Rect2D]:
+        """get bounding boxes of all polygons
+
+        Returns:
+            list[Rect2D]: bounding box of each polygon. Rect2D() for an empty polygon
+        """
+        self._update()
+        result = []
+        for box in self._boxes:
+            if box is None:
+                result.append(Rect2D())
+            else:
+                result.append(Rect2D(Vector2D(box[0], box[1]),
+                                     Size2D(box[2] - box[0], box[3] - box[1])))
+        return result
+
+    def _update(self) -> None:
+        """calculate the results of all polygons whose cache is dropped
+        """
+        coords = self._coords
+        offsets = self._offsets
+        areas = self._areas
+        for index in range(len(offsets) - 1):
+            if areas[index] is not None:
+                continue
+            first = offsets[index]
+            last = offsets[index + 1]
+            size = last - first
+            if size == 0:
+                areas[index] = 0.0
+                continue
+            ds_area = 0.0
+            sum_x = 0.0
+            sum_y = 0.0
+            mean_x = 0.0
+            mean_y = 0.0
+            min_x = max_x = coords[2 * first]
+            min_y = max_y = coords[2 * first + 1]
+            for i in range(first, last):
+                j = i + 1 if i + 1 < last else first
+                x_i = coords[2 * i]
+                y_i = coords[2 * i + 1]
+                x_j = coords[2 * j]
+                y_j = coords[2 * j + 1]
+                cross = x_i * y_j - x_j * y_i
+                ds_area += cross
+                sum_x += (x_i + x_j) * cross
+                sum_y += (y_i + y_j) * cross
+                mean_x += x_i
+                mean_y += y_i
+                if x_i < min_x:
+                    min_x = x_i
+                elif x_i > max_x:
+                    max_x = x_i
+                if y_i < min_y:
+                    min_y = y_i
+                elif y_i > max_y:
+                    max_y = y_i
+            if size < 3:
+                ds_area = 0.0
+            areas[index] = ds_area
+            if ds_area != 0.0:
+                self._centroids[index] = (sum_x / (3.0 * ds_area), sum_y / (3.0 * ds_area))
+            else:
+                self._centroids[index] = (mean_x / size, mean_y / size)
+            self._boxes[index] = (min_x, min_y, max_x, max_y)
+
+    @staticmethod
+    def _flatten(polygon: Union[Polygon2D, list[Vector2D]]) -> list[float]:
+        """get flat coordinates of a polygon
+
+        Args:
+            polygon (Union[Polygon2D, list[Vector2D]]): polygon or its vertices
+
+        Returns:
+            list[float]: [x0, y0, x1, y1, ...]
+        """
+        if isinstance(polygon, Polygon2D):
+            polygon = polygon.vertices_()
+        coords = []
+        for point in polygon:
+            coords.append(point.x())
+            coords.append(point.y())
+        return coords
+
+    def __repr__(self) -> str:
+        """represent the polygon set as a string
+
+        Returns:
+            str: contains the polygons
+        """
+        return f"({[self.polygon(i) for i in range(self.size())]})"
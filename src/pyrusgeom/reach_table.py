@@ -0,0 +1,344 @@
+""" reach_table.py file
+    ReachTable: class name
+    Precomputed dash and turn reachability of a player type
+"""
+from __future__ import annotations
+import math
+
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.player_type import PlayerType
+from pyrusgeom.soccer_math import (broadcast, dash_distances, dir_rate, effective_turn,
+                                   turn_cycles)
+
+
+class ReachTable:
+    """ handling reachability tables of a player type
+
+    the tables are built once per player type:
+        dash distance after n full power dashes for each dash direction
+        (a multiple of dash_angle_step), starting from zero speed,
+        the first dash count for each distance cell to find the cycles
+        needed to reach a distance in O(1),
+        the accumulated turn angle after k turns for each speed cell.
+    the turn cycles decrease or stay same when the speed gets lower, so a turn
+    lookup reads the two speed cells around the speed. if they give the same
+    count, it is the exact count, and otherwise turn_cycles() is called, so
+    the results are same as turn_cycles().
+    use ReachTable.instance(player_type) to share one table per player type
+    parameters and resolutions.
+
+    Attributes:
+        _type: player type
+        _max_step: max number of cycles in the tables
+        _dist_resolution: size of the distance cells
+        _speed_resolution: size of the speed cells
+        _dash_dirs: dash directions in degree
+        _dash_tables: dash distances after n dashes for each dash direction
+        _dash_grids: first dash count for each distance cell for each dash direction
+        _turn_tables: accumulated turn angles after k turns for each speed cell
+    """
+    _instances: dict[tuple, ReachTable] = {}
+
+    def __init__(self, player_type: PlayerType, max_step: int = 50,
+                 dist_resolution: float = 0.1, speed_resolution: float = 0.001):
+        """This is the class init function and builds the tables.
+
+        Args:
+            player_type (PlayerType): player type
+            max_step (int, optional): max number of cycles. Defaults to 50.
+            dist_resolution (float, optional): size of the distance cells. Defaults to 0.1.
+            speed_resolution (float, optional): size of the speed cells. Defaults to 0.001.
+        """
+        self._type = player_type
+        self._max_step = max_step
+        self._dist_resolution = dist_resolution
+        self._speed_resolution = speed_resolution
+
+        angle_step = player_type.dash_angle_step()
+        count = max(1, int(round(360.0 / angle_step))) if angle_step > 0.0 else 1
+        self._dash_dirs: list[float] = [AngleDeg.normalize_angle(i * 360.0 / count)
+                                        for i in range(count)]
+        self._dash_tables: list[list[float]] = []
+        self._dash_grids: list[list[int]] = []
+        for dash_dir in self._dash_dirs:
+            rate = dir_rate(dash_dir, player_type.back_dash_rate(), player_type.side_dash_rate())
+            table = dash_distances(player_type, rate, max_step)
+            self._dash_tables.append(table)
+            grid = []
+            n_step = 0
+            for cell in range(int(table[-1] / dist_resolution) + 1):
+                while table[n_step] < cell * dist_resolution:
+                    n_step += 1
+                grid.append(n_step)
+            self._dash_grids.append(grid)
+
+        self._turn_tables: list[list[float]] = []
+        max_speed = player_type.player_speed_max() * 1.1
+        for cell in range(int(math.ceil(max_speed / speed_resolution)) + 1):
+            speed = cell * speed_resolution
+            angles = [0.0]
+            while angles[-1] < 180.0 and player_type.max_moment() > 0.0:
+                angles.append(angles[-1] + effective_turn(player_type.max_moment(), speed,
+                                                          player_type.inertia_moment()))
+                speed *= player_type.player_decay()
+            self._turn_tables.append(angles)
+
+    @staticmethod
+    def instance(player_type: PlayerType, max_step: int = 50, dist_resolution: float = 0.1,
+                 speed_resolution: float = 0.001) -> ReachTable:
+        """get the shared table of the player type
+
+        player types with the same parameters share a table. the table is
+        rebuilt with the same resolutions if it is shorter than max_step.
+
+        Args:
+            player_type (PlayerType): player type
+            max_step (int, optional): required max number of cycles. Defaults to 50.
+            dist_resolution (float, optional): size of the distance cells. Defaults to 0.1.
+            speed_resolution (float, optional): size of the speed cells. Defaults to 0.001.
+
+        Returns:
+            ReachTable: cached table object
+        """
+        key = (player_type.parameters(), dist_resolution, speed_resolution)
+        table = ReachTable._instances.get(key)
+        if table is None or table.max_step() < max_step:
+            table = ReachTable(player_type, max(max_step, 50), dist_resolution, speed_resolution)
+            ReachTable._instances[key] = table
+        return table
+
+    @staticmethod
+    def clear_instances() -> None:
+        """drop all shared tables
+        """
+        ReachTable._instances.clear()
+
+    def dist_resolution(self) -> float:
+        """get the size of the distance cells
+
+        Returns:
+            float: distance resolution
+        """
+        return self._dist_resolution
+
+    def speed_resolution(self) -> float:
+        """get the size of the speed cells
+
+        Returns:
+            float: speed resolution
+        """
+        return self._speed_resolution
+
+    def player_type(self) -> PlayerType:
+        """get the player type
+
+        Returns:
+            PlayerType: player type
+        """
+        return self._type
+
+    def max_step(self) -> int:
+        """get the max number of cycles in the tables
+
+        Returns:
+            int: max number of cycles
+        """
+        return self._max_step
+
+    def dash_dirs(self) -> list[float]:
+        """get a copy of the dash directions
+
+        Returns:
+            list[float]: dash directions in degree
+        """
+        return self._dash_dirs.copy()
+
+    def dash_dirs_(self) -> list[float]:
+        """get the reference to the dash directions
+
+        Returns:
+            list[float]: dash directions in degree
+        """
+        return self._dash_dirs
+
+    def dash_dir_index(self, dash_dir: float) -> int:
+        """get the index of the nearest dash direction
+
+        Args:
+            dash_dir (float): dash direction relative to the body in degree
+
+        Returns:
+            int: index of the dash direction
+        """
+        count = len(self._dash_dirs)
+        return int(round(dash_dir * count / 360.0)) % count
+
+    def dash_distance(self, n_step: int, dash_dir: float = 0.0) -> float:
+        """get the distance after n_step full power dashes from zero speed
+
+        Args:
+            n_step (int): number of dashes (0 ... max_step)
+            dash_dir (float, optional): dash direction, the nearest one is used. Defaults to 0.0.
+
+        Returns:
+            float: travel distance
+        """
+        return self._dash_tables[self.dash_dir_index(dash_dir)][n_step]
+
+    def reach_distance(self, n_step: int, n_turn: int = 0, dash_dir: float = 0.0) -> float:
+        """get the distance reachable in n_step cycles with n_turn turns first
+
+        Args:
+            n_step (int): number of cycles (0 ... max_step)
+            n_turn (int, optional): number of turn cycles. Defaults to 0.
+            dash_dir (float, optional): dash direction, the nearest one is used. Defaults to 0.0.
+
+        Returns:
+            float: travel distance by dashes, 0 if there is no time to dash
+        """
+        if n_turn >= n_step:
+            return 0.0
+        return self._dash_tables[self.dash_dir_index(dash_dir)][n_step - n_turn]
+
+    def dash_cycles(self, dist: float, dash_dir: float = 0.0) -> int:
+        """get the number of dashes to move dist from zero speed
+
+        Args:
+            dist (float): distance to move
+            dash_dir (float, optional): dash direction, the nearest one is used. Defaults to 0.0.
+
+        Returns:
+            int: number of dashes, -1 if more than max_step dashes are needed
+        """
+        if dist <= 0.0:
+            return 0
+        index = self.dash_dir_index(dash_dir)
+        table = self._dash_tables[index]
+        if dist > table[-1]:
+            return -1
+        n_step = self._dash_grids[index][int(dist / self._dist_resolution)]
+        while table[n_step] < dist:
+            n_step += 1
+        return n_step
+
+    def turn_cycles(self, angle_diff: float, speed: float) -> int:
+        """get the number of turn commands to change the body direction by angle_diff
+
+        Args:
+            angle_diff (float): required angle change in degree. 0 or less needs no turn
+            speed (float): player's current speed
+
+        Returns:
+            int: number of turn cycles, -1 if the player cannot turn
+        """
+        if angle_diff <= 0.0:
+            return 0
+        if self._type.max_moment() <= 0.0:
+            return -1
+        high = int(math.ceil(speed / self._speed_resolution))
+        if high >= len(self._turn_tables):
+            return turn_cycles(angle_diff, speed, self._type)
+        n_turn = self.cell_turn_cycles(high, angle_diff)
+        low = int(math.floor(speed / self._speed_resolution))
+        if n_turn < 0 or (low != high and self.cell_turn_cycles(low, angle_diff) != n_turn):
+            return turn_cycles(angle_diff, speed, self._type)
+        return n_turn
+
+    def cell_turn_cycles(self, cell: int, angle_diff: float) -> int:
+        """get the number of turns in the turn table of a speed cell
+
+        Args:
+            cell (int): speed cell index
+            angle_diff (float): required angle change in degree
+
+        Returns:
+            int: number of turn cycles, -1 if more than the table covers
+        """
+        for n_turn, angle in enumerate(self._turn_tables[cell]):
+            if angle >= angle_diff:
+                return n_turn
+        return -1
+
+    def reach_cycles(self, dist: float, angle_diff: float, speed: float,
+                     tolerance: float = 0.0) -> int:
+        """get the number of cycles to move dist toward a direction
+
+        the player either turns to the target then dashes forward, or dashes
+        to the nearest dash direction if it is within the tolerance.
+
+        Args:
+            dist (float): distance to move
+            angle_diff (float): target direction relative to the body in degree
+            speed (float): player's current speed
+            tolerance (float, optional): allowed direction error in degree. Defaults to 0.0.
+
+        Returns:
+            int: number of cycles, -1 if not reachable within max_step
+        """
+        if dist <= 0.0:
+            return 0
+        angle_diff = AngleDeg.normalize_angle(angle_diff)
+        best = -1
+        n_turn = self.turn_cycles(math.fabs(angle_diff) - tolerance, speed)
+        n_dash = self.dash_cycles(dist)
+        if n_turn >= 0 and n_dash >= 0 and n_turn + n_dash <= self._max_step:
+            best = n_turn + n_dash
+        index = self.dash_dir_index(angle_diff)
+        if math.fabs(AngleDeg.normalize_angle(angle_diff - self._dash_dirs[index])) <= tolerance:
+            n_dash = self.dash_cycles(dist, self._dash_dirs[index])
+            if n_dash >= 0 and (best < 0 or n_dash < best):
+                best = n_dash
+        return best
+
+    def dash_cycles_array(self, dists, dash_dir: float = 0.0) -> list[int]:
+        """array version of dash_cycles()
+
+        Args:
+            dists: distances. number or 1-D sequence
+            dash_dir (float, optional): dash direction. Defaults to 0.0.
+
+        Returns:
+            list[int]: number of dashes for each distance
+        """
+        return [self.dash_cycles(dist, dash_dir) for dist, in zip(*broadcast(dists))]
+
+    def reach_cycles_array(self, dists, angle_diffs, speeds, tolerances=0.0) -> list[int]:
+        """array version of reach_cycles()
+
+        Args:
+            dists: distances. number or 1-D sequence
+            angle_diffs: target directions relative to the body. number or 1-D sequence
+            speeds: current speeds. number or 1-D sequence
+            tolerances (optional): allowed direction errors. Defaults to 0.0.
+
+        Returns:
+            list[int]: number of cycles for each item
+        """
+        return [self.reach_cycles(dist, angle, speed, tolerance)
+                for dist, angle, speed, tolerance
+                in zip(*broadcast(dists, angle_diffs, speeds, tolerances))]
+
+    def can_reach_array(self, dists, angle_diffs, speeds, n_steps, tolerances=0.0) -> list[bool]:
+        """check if each target is reachable within n_steps cycles
+
+        Args:
+            dists: distances. number or 1-D sequence
+            angle_diffs: target directions relative to the body. number or 1-D sequence
+            speeds: current speeds. number or 1-D sequence
+            n_steps: available cycles. number or 1-D sequence
+            tolerances (optional): allowed direction errors. Defaults to 0.0.
+
+        Returns:
+            list[bool]: True if reachable
+        """
+        return [0 <= self.reach_cycles(dist, angle, speed, tolerance) <= n_step
+                for dist, angle, speed, n_step, tolerance
+                in zip(*broadcast(dists, angle_diffs, speeds, n_steps, tolerances))]
+
+    def __repr__(self) -> str:
+        """represent the table as a string
+
+        Returns:
+            str: contains the player type and the max step
+        """
+        return f"({self._type}, max_step: {self._max_step})"
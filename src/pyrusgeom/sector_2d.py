@@ -8,10 +8,13 @@ import math
 from typing import Union
 
 from pyrusgeom.region_2d import Region2D
-from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.vector_2d import Vector2D, to_coords
 from pyrusgeom.angle_deg import AngleDeg
 from pyrusgeom.math_values import EPSILON, PI
 
+# points closer than this (as a sine) to a boundary direction use contains()
+BOUNDARY_SIN = 1.0e-9
+
 
 class Sector2D(Region2D):
     """handling Sectors in SS2D
@@ -44,7 +47,7 @@ class Sector2D(Region2D):
         super().__init__()
 
         self._center = Vector2D(center)
-        self._min_r = min(0.0, min_r)
+        self._min_r = max(0.0, min_r)
         self._max_r = max(min_r, max_r)
         self._start = AngleDeg(start)
         self._end = AngleDeg(end)
@@ -62,7 +65,7 @@ class Sector2D(Region2D):
             end (Union[AngleDeg, float]): end angle(turn clockwise)
         """
         self._center = Vector2D(center)
-        self._min_r = min(0.0, min_r)
+        self._min_r = max(0.0, min_r)
         self._max_r = max(min_r, max_r)
         self._start = AngleDeg(start)
         self._end = AngleDeg(end)
@@ -157,6 +160,204 @@ class Sector2D(Region2D):
         return (self._min_r * self._min_r <= delta <= self._max_r * self._max_r and
                 rel.th().is_within(self._start, self._end))
 
+    def contains_points(self, points) -> list[bool]:
+        """check if each point is within this sector
+
+        angles are compared by cross products with the start and end
+        directions instead of atan2. points near a boundary direction or at
+        the center are checked by contains(), so the results are exactly
+        same as contains(). the values of batch_params() are calculated from
+        the current sector on each call.
+
+        Args:
+            points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+
+        Returns:
+            list[bool]: True for each contained point
+        """
+        params = self.batch_params()
+        return [self._contains_coord(params, p_x, p_y) for p_x, p_y in to_coords(points)]
+
+    def contains_coord(self, p_x: float, p_y: float) -> bool:
+        """check if the point (p_x, p_y) is within this sector without atan2
+
+        Args:
+            p_x (float): point x
+            p_y (float): point y
+
+        Returns:
+            bool: True if contains. else False.
+        """
+        return self._contains_coord(self.batch_params(), p_x, p_y)
+
+    def _contains_coord(self, params: tuple, p_x: float, p_y: float) -> bool:
+        """check if the point (p_x, p_y) is within this sector by batch_params()
+
+        Args:
+            params (tuple): values of batch_params()
+            p_x (float): point x
+            p_y (float): point y
+
+        Returns:
+            bool: True if contains. else False.
+        """
+        c_x, c_y, min_r2, max_r2, s_x, s_y, e_x, e_y, narrow = params
+        r_x = p_x - c_x
+        r_y = p_y - c_y
+        delta = r_x * r_x + r_y * r_y
+        if not min_r2 <= delta <= max_r2:
+            return False
+        cross_s = s_x * r_y - s_y * r_x
+        cross_e = r_x * e_y - r_y * e_x
+        band = BOUNDARY_SIN * BOUNDARY_SIN * delta
+        if (math.fabs(r_x) < EPSILON and math.fabs(r_y) < EPSILON) \
+                or cross_s * cross_s <= band or cross_e * cross_e <= band:
+            return self.contains(Vector2D(p_x, p_y))
+        if narrow:
+            return cross_s > 0.0 and cross_e > 0.0
+        return cross_s > 0.0 or cross_e > 0.0
+
+    def batch_params(self) -> tuple:
+        """get the values used by contains_coord()
+
+        Returns:
+            tuple: (center x, center y, min_r^2, max_r^2, start dir x, start dir y,
+                end dir x, end dir y, True if start is left or equal of end)
+        """
+        return (self._center.x(), self._center.y(),
+                self._min_r * self._min_r, self._max_r * self._max_r,
+                self._start.cos(), self._start.sin(), self._end.cos(), self._end.sin(),
+                self._start.is_left_equal_of(self._end))
+
+    @staticmethod
+    def contains_mask(sectors: list[Sector2D], points) -> list[list[bool]]:
+        """check every point against every sector
+
+        Args:
+            sectors (list[Sector2D]): checked sectors
+            points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+
+        Returns:
+            list[list[bool]]: mask[i][j] is True if sector j contains point i
+        """
+        coords = to_coords(points)
+        checks = [(sector._contains_coord, sector.batch_params()) for sector in sectors]
+        return [[check(params, p_x, p_y) for check, params in checks] for p_x, p_y in coords]
+
+    def get_visible_circles(self, centers,
+                            radii) -> list[tuple[int, list[tuple[AngleDeg, AngleDeg]]]]:
+        """find the circles seen from the center of this sector
+
+        each circle covers an angular interval from the center. the interval
+        ends are swept in angular order, and between two consecutive ends the
+        active circles are compared by the distance where the bisector ray of
+        that interval hits them, so circles of different radii are ordered
+        correctly. the ray is clipped by the sector radii: the part nearer
+        than the min radius does not hide anything, and a circle hit only
+        farther than the max radius is not seen. the angles where a circle
+        crosses the min or max radius also split the intervals, and the
+        nearest circle on the bisector ray is visible in the whole interval,
+        which is exact for circles that do not overlap each other.
+        the cost is O(n log n + n * m) where m is the max number of circles
+        covering the same direction.
+        circles that contain the center (e.g. the viewer itself) are ignored.
+
+        Args:
+            centers: circle centers. sequence of Vector2D, (x, y) pairs or (n, 2) array
+            radii (Union[float, list[float]]): radius of all circles or of each circle
+
+        Returns:
+            list[tuple[int, list[tuple[AngleDeg, AngleDeg]]]]: index of each visible circle
+                with its visible spans [(left angle, right angle), ...], sorted by index
+        """
+        coords = to_coords(centers)
+        if not isinstance(radii, (list, tuple)):
+            radii = [radii] * len(coords)
+        c_x = self._center.x()
+        c_y = self._center.y()
+        min_r = self._min_r
+        max_r = self._max_r
+        start = self._start.degree()
+        width = (self._end - self._start).degree_()
+        if width < 0.0:
+            width += 360.0
+
+        circles = {}  # circle index: (relative x, relative y, radius)
+        events = []  # (relative angle, 0: end, 1: begin or 2: split, piece id, circle index)
+        piece = 0
+        for i, ((p_x, p_y), radius) in enumerate(zip(coords, radii)):
+            r_x = p_x - c_x
+            r_y = p_y - c_y
+            dist = math.sqrt(r_x * r_x + r_y * r_y)
+            if dist <= radius or dist - radius > max_r or dist + radius < min_r:
+                continue
+            circles[i] = (r_x, r_y, radius)
+            half = AngleDeg.asin_deg(radius / dist)
+            rel = (AngleDeg.atan2_deg(r_y, r_x) - start) % 360.0
+            for shift in (-360.0, 0.0, 360.0):
+                low = max(0.0, rel - half + shift)
+                high = min(width, rel + half + shift)
+                if low < high:
+                    events.append((low, 1, piece, i))
+                    events.append((high, 0, piece, i))
+                    piece += 1
+            # split the interval where the circle crosses the min or max radius
+            for bound in (min_r, max_r):
+                if bound <= 0.0:
+                    continue
+                cos_value = (dist * dist + bound * bound - radius * radius) / (2.0 * dist * bound)
+                if -1.0 < cos_value < 1.0:
+                    phi = math.degrees(math.acos(cos_value))
+                    for cross in (rel - phi, rel + phi):
+                        cross %= 360.0
+                        if 0.0 < cross < width:
+                            events.append((cross, 2, -1, i))
+        events.sort()
+
+        spans: dict[int, list[list[float]]] = {}
+        active: dict[int, int] = {}  # piece id: circle index
+        k = 0
+        while k < len(events):
+            angle = events[k][0]
+            while k < len(events) and events[k][0] == angle:
+                _, kind, piece_id, index = events[k]
+                if kind == 1:
+                    active[piece_id] = index
+                elif kind == 0:
+                    del active[piece_id]
+                k += 1
+            if not active or k == len(events):
+                continue
+            next_angle = events[k][0]
+            mid = math.radians(start + (angle + next_angle) * 0.5)
+            u_x = math.cos(mid)
+            u_y = math.sin(mid)
+            index = -1
+            best = math.inf
+            for i in sorted(active.values()):
+                r_x, r_y, radius = circles[i]
+                proj = u_x * r_x + u_y * r_y
+                perp = u_x * r_y - u_y * r_x
+                half_chord = math.sqrt(max(0.0, radius * radius - perp * perp))
+                near = proj - half_chord
+                if proj + half_chord < min_r or near > max_r:
+                    continue
+                near = max(near, min_r)
+                if near < best:
+                    best = near
+                    index = i
+            if index == -1:
+                continue
+            index_spans = spans.setdefault(index, [])
+            if index_spans and index_spans[-1][1] == angle:
+                index_spans[-1][1] = next_angle
+            else:
+                index_spans.append([angle, next_angle])
+
+        return [(index, [(AngleDeg(start + low), AngleDeg(start + high))
+                         for low, high in spans[index]])
+                for index in sorted(spans)]
+
     def get_circumference_min(self) -> float:
         """get smaller side circumference
 
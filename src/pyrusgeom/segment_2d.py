@@ -550,3 +550,33 @@ class Segment2D:
         """
         ostr += f' (line {round(self.origin().x(), 3)} {round(self.origin().y(), 3)} \
             {round(self.terminal().x(), 3)} {round(self.terminal().y(), 3)})'
+
+
+def segment_dist2(p_x: float, p_y: float, a_x: float, a_y: float, b_x: float, b_y: float) -> float:
+    """get squared distance between point (p_x, p_y) and segment (a_x, a_y)-(b_x, b_y)
+
+    Args:
+        p_x (float): point x
+        p_y (float): point y
+        a_x (float): segment origin x
+        a_y (float): segment origin y
+        b_x (float): segment terminal x
+        b_y (float): segment terminal y
+
+    Returns:
+        float: squared distance value
+    """
+    d_x = b_x - a_x
+    d_y = b_y - a_y
+    rel_x = p_x - a_x
+    rel_y = p_y - a_y
+    len2 = d_x * d_x + d_y * d_y
+    if len2 > 0.0:
+        rate = (rel_x * d_x + rel_y * d_y) / len2
+        if rate >= 1.0:
+            rel_x = p_x - b_x
+            rel_y = p_y - b_y
+        elif rate > 0.0:
+            rel_x -= d_x * rate
+            rel_y -= d_y * rate
+    return rel_x * rel_x + rel_y * rel_y
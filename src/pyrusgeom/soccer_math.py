@@ -5,8 +5,12 @@
 from __future__ import annotations
 # from typing import Union
 import math
+import numbers
 
-from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.vector_2d import Vector2D, to_coords
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.decay_table import DecayTable
+from pyrusgeom.player_type import PlayerType
 
 EPS = 1.0e-8
 SERVER_EPS = 1.0e-10
@@ -99,7 +103,8 @@ def can_over_speed_max(dash_power: float, dash_power_rate: float, effort: float,
     return math.fabs(dash_power) * dash_power_rate * effort > speed_max * (1.0 - decay)
 
 
-def inertia_n_step_travel(initial_vel: Vector2D, n_step: int, decay: float) -> Vector2D:
+def inertia_n_step_travel(initial_vel: Vector2D, n_step: int, decay: float,
+                          table: DecayTable = None) -> Vector2D:
     """estimate future travel after n steps only by inertia.
 
     No additional acceleration.
@@ -108,16 +113,20 @@ def inertia_n_step_travel(initial_vel: Vector2D, n_step: int, decay: float) -> V
         initial_vel (Vector2D): object's first velocity
         n_step (int): number of total steps
         decay (float): object's decay parameter
+        table (DecayTable, optional): precomputed table of the decay. Defaults to None.
+            not used if its decay is not same as decay.
 
     Returns:
         Vector2D: vector of total travel
     """
+    if table is not None and table.decay() == decay:
+        return Vector2D(initial_vel.x(), initial_vel.y()) * table.sum(n_step)
     return (Vector2D(initial_vel.x(), initial_vel.y()) *
            ((1.0 - math.pow(decay, n_step)) / (1.0 - decay)))
 
 
-def inertia_n_step_point(initial_pos: Vector2D,
-                         initial_vel: Vector2D, n_step: int, decay: float) -> Vector2D:
+def inertia_n_step_point(initial_pos: Vector2D, initial_vel: Vector2D, n_step: int,
+                         decay: float, table: DecayTable = None) -> Vector2D:
     """estimate future point after n steps only by inertia.
 
     No additional acceleration.
@@ -127,15 +136,18 @@ def inertia_n_step_point(initial_pos: Vector2D,
         initial_vel (Vector2D): object's first velocity
         n_step (int): number of total steps
         decay (float): object's decay parameter
+        table (DecayTable, optional): precomputed table of the decay. Defaults to None.
+            not used if its decay is not same as decay.
 
     Returns:
         Vector2D: coordinate of the reached point
     """
     return (Vector2D(initial_pos.x(), initial_pos.y()) +
-            inertia_n_step_travel(initial_vel, n_step, decay))
+            inertia_n_step_travel(initial_vel, n_step, decay, table))
 
 
-def inertia_n_step_distance(initial_speed: float, n_step: int, decay: float) -> float:
+def inertia_n_step_distance(initial_speed: float, n_step: int, decay: float,
+                            table: DecayTable = None) -> float:
     """estimate travel distance only by inertia.
 
     No additional acceleration.
@@ -144,10 +156,14 @@ def inertia_n_step_distance(initial_speed: float, n_step: int, decay: float) ->
         initial_speed (float): object's first speed
         n_step (int): number of total steps
         decay (float): decay object's decay parameter
+        table (DecayTable, optional): precomputed table of the decay. Defaults to None.
+            not used if its decay is not same as decay.
 
     Returns:
         float: total travel distance
     """
+    if table is not None and table.decay() == decay:
+        return initial_speed * (1.0 - table.pow(n_step)) / (1.0 - decay)
     return initial_speed * (1.0 - math.pow(decay, n_step)) / (1.0 - decay)
 
 def inertia_final_travel(initial_vel: Vector2D, decay: float) -> Vector2D:
@@ -215,13 +231,16 @@ def r_int(floating_point: float) -> int:
     return fi_right
 
 
-def calc_length_geom_series(first_term: float, sum_all: float, ratio: float) -> float:
+def calc_length_geom_series(first_term: float, sum_all: float, ratio: float,
+                            table: DecayTable = None) -> float:
     """caluculate the length of a geometric series
 
     Args:
         first_term (float): value of the first term
         sum_all (float): sum of a geometric series
         ratio (float): multiplication ratio
+        table (DecayTable, optional): precomputed table of the ratio. Defaults to None.
+            not used if its decay is not same as ratio.
 
     Returns:
         float: a round number of the length of geometric series
@@ -233,6 +252,8 @@ def calc_length_geom_series(first_term: float, sum_all: float, ratio: float) ->
     tmp = 1.0 + sum_all * (ratio - 1.0) / first_term
     if tmp <= SERVER_EPS:
         return -1.0
+    if table is not None and table.decay() == ratio:
+        return math.log(tmp) / table.log_decay()
     return math.log(tmp) / math.log(ratio)
 
 def calc_first_term_geom_series(sums: float, ratio: float, length: int) -> float:
@@ -412,3 +433,409 @@ def unquantize_error(see_dist: float, qstep: float) -> float:
     max_dist = (math.exp(unquantize_max(
         math.log(unquantize_max(see_dist, 0.1)), qstep)) - SERVER_EPS)
     return math.fabs(max_dist - min_dist)
+
+# array versions
+# each argument is a number or a 1-D sequence (list, tuple or array). numbers and
+# sequences of size 1 are broadcast to the size of the other sequences.
+# the same expressions as the scalar functions are used, so each item is
+# exactly same as the scalar result.
+
+
+def broadcast(*args) -> list[list]:
+    """make all arguments lists of the same size
+
+    Args:
+        *args: numbers or 1-D sequences
+
+    Raises:
+        Exception: sizes of the sequences are not same
+
+    Returns:
+        list[list]: list of each argument
+    """
+    lists = []
+    size = 1
+    for arg in args:
+        if hasattr(arg, 'tolist'):
+            arg = arg.tolist()
+        if isinstance(arg, (list, tuple)):
+            if len(arg) != 1:
+                if size not in (1, len(arg)):
+                    raise Exception('soccer_math: sizes of the arrays must be same or 1')
+                size = len(arg)
+            lists.append(arg)
+        else:
+            lists.append([arg])
+    return [arg if len(arg) == size else list(arg) * size for arg in lists]
+
+
+def kick_rate_array(dist, dir_diff, kick_rate_power, ball_size, player_size,
+                    kickable_margin) -> list[float]:
+    """array version of kick_rate()
+
+    Returns:
+        list[float]: rate of the kick power effect
+    """
+    return [power * (1.0 - 0.25 * math.fabs(diff)
+                     / 180.0 - 0.25 * (d - b_size - p_size) / margin)
+            for d, diff, power, b_size, p_size, margin
+            in zip(*broadcast(dist, dir_diff, kick_rate_power, ball_size, player_size,
+                              kickable_margin))]
+
+
+def dir_rate_array(rel_dash_dir, back_dash_rate, side_dash_rate) -> list[float]:
+    """array version of dir_rate()
+
+    Returns:
+        list[float]: dash power rate
+    """
+    result = []
+    for rel_dir, back, side in zip(*broadcast(rel_dash_dir, back_dash_rate, side_dash_rate)):
+        if math.fabs(rel_dir) > 90.0:
+            result.append(back - ((back - side) * (1.0 - (math.fabs(rel_dir) - 90.0) / 90.0)))
+        else:
+            result.append(side + ((1.0 - side) * (1.0 - math.fabs(rel_dir) / 90.0)))
+    return result
+
+
+def effective_turn_array(turn_moment, speed, inertia_moment) -> list[float]:
+    """array version of effective_turn()
+
+    Returns:
+        list[float]: calculated actual turn angle
+    """
+    return [moment / (1.0 + inertia * spd)
+            for moment, spd, inertia in zip(*broadcast(turn_moment, speed, inertia_moment))]
+
+
+def final_speed_array(dash_power, player_dash_power_rate, effort, decay) -> list[float]:
+    """array version of final_speed()
+
+    Returns:
+        list[float]: final speed
+    """
+    return [(math.fabs(power) * rate * eff) / (1.0 - dec)
+            for power, rate, eff, dec
+            in zip(*broadcast(dash_power, player_dash_power_rate, effort, decay))]
+
+
+def can_over_speed_max_array(dash_power, dash_power_rate, effort, decay,
+                             speed_max) -> list[bool]:
+    """array version of can_over_speed_max()
+
+    Returns:
+        list[bool]: True if player can over player_speed_max. else False.
+    """
+    return [math.fabs(power) * rate * eff > s_max * (1.0 - dec)
+            for power, rate, eff, dec, s_max
+            in zip(*broadcast(dash_power, dash_power_rate, effort, decay, speed_max))]
+
+
+def inertia_n_step_distance_array(initial_speed, n_step, decay,
+                                  table: DecayTable = None) -> list[float]:
+    """array version of inertia_n_step_distance()
+
+    the table can be used only with a single decay value, and it is not used
+    if its decay is not same as decay.
+
+    Raises:
+        Exception: the table is given with a decay array
+
+    Returns:
+        list[float]: total travel distance
+    """
+    if table is not None:
+        if hasattr(decay, 'tolist') or isinstance(decay, (list, tuple)):
+            raise Exception('soccer_math: the table cannot be used with a decay array')
+        if table.decay() == decay:
+            return [speed * (1.0 - table.pow(step)) / (1.0 - decay)
+                    for speed, step in zip(*broadcast(initial_speed, n_step))]
+    return [speed * (1.0 - math.pow(dec, step)) / (1.0 - dec)
+            for speed, step, dec in zip(*broadcast(initial_speed, n_step, decay))]
+
+
+def inertia_final_distance_array(initial_speed, decay) -> list[float]:
+    """array version of inertia_final_distance()
+
+    Returns:
+        list[float]: distance value that the object reaches
+    """
+    return [speed / (1.0 - dec) for speed, dec in zip(*broadcast(initial_speed, decay))]
+
+
+def quantize_array(value, qstep) -> list[float]:
+    """array version of quantize()
+
+    Returns:
+        list[float]: rounded value
+    """
+    return [r_int(val / step) * step for val, step in zip(*broadcast(value, qstep))]
+
+
+def quantize_dist_array(unq_dist, qstep) -> list[float]:
+    """array version of quantize_dist()
+
+    Returns:
+        list[float]: quantized distance
+    """
+    return [quantize(math.exp(quantize(math.log(dist + SERVER_EPS), step)), 0.1)
+            for dist, step in zip(*broadcast(unq_dist, qstep))]
+
+
+def unquantize_min_array(dist, qstep) -> list[float]:
+    """array version of unquantize_min()
+
+    Returns:
+        list[float]: minimal distance within un quantized distance range
+    """
+    return [(r_int(d / step) - 0.5) * step for d, step in zip(*broadcast(dist, qstep))]
+
+
+def unquantize_max_array(dist, qstep) -> list[float]:
+    """array version of unquantize_max()
+
+    Returns:
+        list[float]: maximal distance within un quantized distance range
+    """
+    return [(r_int(d / step) + 0.5) * step for d, step in zip(*broadcast(dist, qstep))]
+
+
+def unquantize_error_array(see_dist, qstep) -> list[float]:
+    """array version of unquantize_error()
+
+    Returns:
+        list[float]: error value of inverse un quantized distance
+    """
+    return [unquantize_error(dist, step) for dist, step in zip(*broadcast(see_dist, qstep))]
+
+
+def inertia_trajectory_steps(initial_pos, initial_vel, n_step: int, decay: float,
+                             table: DecayTable = None):
+    """generate the points and speeds of many objects step by step only by inertia.
+
+    only one step of all objects is kept at a time, so the memory does not
+    depend on n_step. each point is same as inertia_n_step_point().
+
+    Args:
+        initial_pos: first position of each object. sequence of Vector2D, (x, y) pairs
+            or (n, 2) array. one position is used for all objects
+        initial_vel: first velocity of each object, same format as initial_pos
+        n_step (int): number of total steps
+        decay (float): object's decay parameter
+        table (DecayTable, optional): precomputed table of the decay.
+            Defaults to None (use DecayTable.instance(decay)).
+            DecayTable.instance(decay) is also used if its decay is not same as decay.
+
+    Yields:
+        tuple[int, list[tuple[float, float]], list[float]]: step (1 ... n_step),
+            (x, y) point of each object, and speed of each object after the step
+    """
+    positions = to_coords(initial_pos)
+    velocities = to_coords(initial_vel)
+    if len(positions) == 1 and len(velocities) != 1:
+        positions = positions * len(velocities)
+    if len(positions) != len(velocities):
+        raise Exception('soccer_math: sizes of the positions and velocities must be same')
+    if table is None or table.decay() != decay:
+        table = DecayTable.instance(decay)
+    table.extend(n_step)
+    pows = table.pows_()
+    sums = table.sums_()
+    speeds = [math.sqrt(v_x * v_x + v_y * v_y) for v_x, v_y in velocities]
+    for step in range(1, n_step + 1):
+        travel = sums[step]
+        decay_pow = pows[step]
+        yield (step,
+               [(p_x + v_x * travel, p_y + v_y * travel)
+                for (p_x, p_y), (v_x, v_y) in zip(positions, velocities)],
+               [speed * decay_pow for speed in speeds])
+
+
+def inertia_trajectories(initial_pos, initial_vel, n_step: int, decay: float,
+                         table: DecayTable = None) -> tuple[list[list[tuple[float, float]]],
+                                                            list[list[float]]]:
+    """predict the points and speeds of many objects for steps 1 ... n_step only by inertia.
+
+    e.g. the ball trajectory of each pass candidate.
+
+    Args:
+        initial_pos: first position of each object. sequence of Vector2D, (x, y) pairs
+            or (n, 2) array. one position is used for all objects
+        initial_vel: first velocity of each object, same format as initial_pos
+        n_step (int): number of total steps
+        decay (float): object's decay parameter
+        table (DecayTable, optional): precomputed table of the decay.
+            Defaults to None (use DecayTable.instance(decay)).
+            DecayTable.instance(decay) is also used if its decay is not same as decay.
+
+    Returns:
+        tuple[list[list[tuple[float, float]]], list[list[float]]]:
+            points[object][step - 1] = (x, y), speeds[object][step - 1]
+    """
+    positions = to_coords(initial_pos)
+    velocities = to_coords(initial_vel)
+    if len(positions) == 1 and len(velocities) != 1:
+        positions = positions * len(velocities)
+    if len(positions) != len(velocities):
+        raise Exception('soccer_math: sizes of the positions and velocities must be same')
+    if table is None or table.decay() != decay:
+        table = DecayTable.instance(decay)
+    table.extend(n_step)
+    pows = table.pows_()[1:n_step + 1]
+    sums = table.sums_()[1:n_step + 1]
+    points = []
+    speeds = []
+    for (p_x, p_y), (v_x, v_y) in zip(positions, velocities):
+        points.append([(p_x + v_x * travel, p_y + v_y * travel) for travel in sums])
+        speed = math.sqrt(v_x * v_x + v_y * v_y)
+        speeds.append([speed * decay_pow for decay_pow in pows])
+    return points, speeds
+
+# intercept
+
+
+def turn_cycles(angle_diff: float, speed: float, player_type: PlayerType) -> int:
+    """count turn commands to change the body direction by angle_diff.
+
+    the player slows down by player_decay every turn, and each turn moves
+    the body by effective_turn() of max_moment.
+
+    Args:
+        angle_diff (float): required angle change in degree. 0 or less needs no turn
+        speed (float): player's current speed
+        player_type (PlayerType): player's type
+
+    Returns:
+        int: number of turn cycles
+    """
+    angle_left = max(0.0, angle_diff)
+    if angle_left > 0.0 and player_type.max_moment() <= 0.0:
+        return -1
+    n_turn = 0
+    while angle_left > 0.0:
+        angle_left -= effective_turn(player_type.max_moment(), speed,
+                                     player_type.inertia_moment())
+        speed *= player_type.player_decay()
+        n_turn += 1
+    return n_turn
+
+
+def dash_distances(player_type: PlayerType, rate: float, n_step: int) -> list[float]:
+    """calculate the travel distance by full power dashes from zero speed
+
+    the speed after j dashes is min(final_speed * (1 - decay^j), player_speed_max).
+
+    Args:
+        player_type (PlayerType): player's type
+        rate (float): dash direction rate (dir_rate())
+        n_step (int): max number of dashes
+
+    Returns:
+        list[float]: travel distance after k dashes for k = 0 ... n_step
+    """
+    decay = player_type.player_decay()
+    converged = final_speed(player_type.max_dash_power(), player_type.dash_power_rate() * rate,
+                            player_type.effort_max(), decay)
+    speed_max = player_type.player_speed_max()
+    table = DecayTable.instance(decay)
+    distances = [0.0]
+    dist = 0.0
+    for step in range(1, n_step + 1):
+        dist += min(converged * (1.0 - table.pow(step)), speed_max)
+        distances.append(dist)
+    return distances
+
+
+def predict_intercepts(positions, velocities, bodies: list, player_types,
+                       ball_points, control_buffer: float = 0.0) -> tuple[list[int], list]:
+    """find the earliest cycle when each player can reach the ball
+
+    a player reaches the ball at cycle n if the ball point of cycle n is in
+    the kickable area after the inertia movement and either
+    turns to the ball (effective_turn()) then dashes forward, or
+    dashes toward the ball without turning with the dir_rate() of the
+    nearest dash direction.
+    the turn and dash cycles are looked up in the shared ReachTable of each
+    player type. all unresolved players are checked cycle by cycle, and the
+    search stops when all players are resolved.
+    this package does not depend on numpy, so this is a plain python loop
+    over players and cycles, not a vectorized kernel. the per-player values
+    (inertia travel, tables, kickable area) are prepared once, so each
+    check in the loop is O(1).
+
+    Args:
+        positions: player positions. sequence of Vector2D, (x, y) pairs or (n, 2) array
+        velocities: player velocities, same format as positions
+        bodies (list): body angle of each player. AngleDeg or degree, or 1-D array of degree
+        player_types (Union[PlayerType, list[PlayerType]]): type of all players or each player
+        ball_points: ball point of each cycle 1, 2, ... (e.g. from inertia_trajectories())
+        control_buffer (float, optional): margin subtracted from the kickable area.
+            Defaults to 0.0.
+
+    Raises:
+        ValueError: sizes of velocities, bodies or player_types are not same as positions
+
+    Returns:
+        tuple[list[int], list]: earliest cycle of each player (-1 if not reached),
+            and the ball point (x, y) at that cycle (None if not reached)
+    """
+    from pyrusgeom.reach_table import ReachTable  # reach_table imports this module
+
+    pos_list = to_coords(positions)
+    vel_list = to_coords(velocities)
+    if hasattr(bodies, 'tolist'):
+        bodies = bodies.tolist()
+    size = len(pos_list)
+    if not isinstance(player_types, (list, tuple)):
+        player_types = [player_types] * size
+    if len(vel_list) != size or len(bodies) != size or len(player_types) != size:
+        raise ValueError('soccer_math: sizes of velocities, bodies and player_types'
+                         ' must be same as positions')
+    balls = to_coords(ball_points)
+    n_max = len(balls)
+
+    players = []
+    for i in range(size):
+        player_type = player_types[i]
+        table = DecayTable.instance(player_type.player_decay())
+        table.extend(n_max)
+        body = bodies[i]
+        if not isinstance(body, numbers.Real):
+            body = body.degree()
+        v_x, v_y = vel_list[i]
+        players.append((pos_list[i], vel_list[i], body, math.sqrt(v_x * v_x + v_y * v_y),
+                        ReachTable.instance(player_type, n_max), table.sums_(),
+                        player_type.kickable_area() - control_buffer))
+
+    cycles = [-1] * size
+    points = [None] * size
+    active = list(range(size))
+    for step in range(1, n_max + 1):
+        b_x, b_y = balls[step - 1]
+        unresolved = []
+        for i in active:
+            (p_x, p_y), (v_x, v_y), body, speed, reach_table, sums, control = players[i]
+            d_x = b_x - (p_x + v_x * sums[step])
+            d_y = b_y - (p_y + v_y * sums[step])
+            dist = math.sqrt(d_x * d_x + d_y * d_y)
+            gap = dist - control
+            reach = gap <= 0.0
+            if not reach:
+                rel = AngleDeg.normalize_angle(math.degrees(math.atan2(d_y, d_x)) - body)
+                tolerance = math.degrees(math.asin(control / dist)) if control > 0.0 else 0.0
+                n_turn = reach_table.turn_cycles(math.fabs(rel) - tolerance, speed)
+                reach = 0 <= n_turn < step and reach_table.reach_distance(step, n_turn) >= gap
+                if not reach:
+                    dash_dirs = reach_table.dash_dirs_()
+                    dash_dir = dash_dirs[reach_table.dash_dir_index(rel)]
+                    if math.fabs(AngleDeg.normalize_angle(rel - dash_dir)) <= tolerance:
+                        reach = reach_table.dash_distance(step, dash_dir) >= gap
+            if reach:
+                cycles[i] = step
+                points[i] = (b_x, b_y)
+            else:
+                unresolved.append(i)
+        active = unresolved
+        if not active:
+            break
+    return cycles, points
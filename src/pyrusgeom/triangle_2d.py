@@ -12,7 +12,7 @@ import math
 # from pyrusgeom.segment_2d import Segment2D (removed most likely due to a circular import)
 from pyrusgeom.region_2d import Region2D
 from pyrusgeom.ray_2d import Ray2D
-from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.vector_2d import Vector2D, to_coords
 from pyrusgeom.angle_deg import AngleDeg
 from pyrusgeom.line_2d import Line2D
 from pyrusgeom.math_values import EPSILON
@@ -254,6 +254,17 @@ class Triangle2D(Region2D):
         """
         return Triangle2D.tri_orthocenter(self._a, self._b, self._c)
 
+    def barycentric(self, point: Vector2D) -> tuple[float, float, float]:
+        """get the barycentric coordinates of the point
+
+        Args:
+            point (Vector2D): considered point
+
+        Returns:
+            tuple[float, float, float]: weights of a, b and c
+        """
+        return Triangle2D.tri_barycentric(self._a, self._b, self._c, point)
+
     def intersection(self, other): # Union[Line2D, Ray2D, Segment2D]) -> list:
         """
         TODO: Need to rewrite. fixed TriBug
@@ -469,6 +480,37 @@ class Triangle2D(Region2D):
         perpend_b = Line2D(v_c, v_a).perpendicular(v_b)
         return perpend_a.intersection(perpend_b)
 
+    @staticmethod
+    def tri_barycentric(v_a: Vector2D, v_b: Vector2D, v_c: Vector2D,
+                        point: Vector2D) -> tuple[float, float, float]:
+        """get the barycentric coordinates of the input point
+
+        point = w_a * a + w_b * b + w_c * c, w_a + w_b + w_c = 1
+
+        Args:
+            v_a (Vector2D): triangle's 1st vertex point
+            v_b (Vector2D): triangle's 2nd vertex point
+            v_c (Vector2D): triangle's 3rd vertex point
+            point (Vector2D): considered point
+
+        Returns:
+            tuple[float, float, float]: (w_a, w_b, w_c). all weights are 1/3 if the area is 0
+        """
+        a_x = v_a.x()
+        a_y = v_a.y()
+        b_x = v_b.x() - a_x
+        b_y = v_b.y() - a_y
+        c_x = v_c.x() - a_x
+        c_y = v_c.y() - a_y
+        area = b_x * c_y - b_y * c_x
+        if math.fabs(area) < EPSILON * EPSILON:
+            return 1.0 / 3.0, 1.0 / 3.0, 1.0 / 3.0
+        p_x = point.x() - a_x
+        p_y = point.y() - a_y
+        w_b = (p_x * c_y - p_y * c_x) / area
+        w_c = (b_x * p_y - b_y * p_x) / area
+        return 1.0 - w_b - w_c, w_b, w_c
+
     @staticmethod
     def tri_contains(v_a: Vector2D, v_b: Vector2D, v_c: Vector2D, point: Vector2D) -> bool:
         """ check if triangle(a,b,c) contains the input point.
@@ -496,6 +538,231 @@ class Triangle2D(Region2D):
             return True
         return False
 
+    @staticmethod
+    def tri_barycentric_points(v_a: Vector2D, v_b: Vector2D, v_c: Vector2D,
+                               points) -> list[tuple[float, float, float]]:
+        """get the barycentric coordinates of many points in one pass
+
+        same values as tri_barycentric() for each point.
+
+        Args:
+            v_a (Vector2D): triangle's 1st vertex point
+            v_b (Vector2D): triangle's 2nd vertex point
+            v_c (Vector2D): triangle's 3rd vertex point
+            points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+
+        Returns:
+            list[tuple[float, float, float]]: (w_a, w_b, w_c) of each point
+        """
+        coords = to_coords(points)
+        a_x = v_a.x()
+        a_y = v_a.y()
+        b_x = v_b.x() - a_x
+        b_y = v_b.y() - a_y
+        c_x = v_c.x() - a_x
+        c_y = v_c.y() - a_y
+        area = b_x * c_y - b_y * c_x
+        if math.fabs(area) < EPSILON * EPSILON:
+            return [(1.0 / 3.0, 1.0 / 3.0, 1.0 / 3.0)] * len(coords)
+        result = []
+        for p_x, p_y in coords:
+            p_x -= a_x
+            p_y -= a_y
+            w_b = (p_x * c_y - p_y * c_x) / area
+            w_c = (b_x * p_y - b_y * p_x) / area
+            result.append((1.0 - w_b - w_c, w_b, w_c))
+        return result
+
+    @staticmethod
+    def tri_contains_points(v_a: Vector2D, v_b: Vector2D, v_c: Vector2D, points) -> list[bool]:
+        """check if triangle(a,b,c) contains each point in one pass
+
+        the same outer products as tri_contains() are used, so the results
+        are same on the edges too.
+
+        Args:
+            v_a (Vector2D): triangle's 1st vertex point
+            v_b (Vector2D): triangle's 2nd vertex point
+            v_c (Vector2D): triangle's 3rd vertex point
+            points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+
+        Returns:
+            list[bool]: True for each contained point
+        """
+        a_x = v_a.x()
+        a_y = v_a.y()
+        b_x = v_b.x()
+        b_y = v_b.y()
+        c_x = v_c.x()
+        c_y = v_c.y()
+        contains = Triangle2D.coords_contains
+        return [contains(a_x, a_y, b_x, b_y, c_x, c_y, p_x, p_y)
+                for p_x, p_y in to_coords(points)]
+
+    @staticmethod
+    def coords_contains(a_x: float, a_y: float, b_x: float, b_y: float,
+                        c_x: float, c_y: float, p_x: float, p_y: float) -> bool:
+        """check if triangle(a,b,c) contains the point, same as tri_contains() on coordinates
+
+        Args:
+            a_x (float): triangle's 1st vertex x
+            a_y (float): triangle's 1st vertex y
+            b_x (float): triangle's 2nd vertex x
+            b_y (float): triangle's 2nd vertex y
+            c_x (float): triangle's 3rd vertex x
+            c_y (float): triangle's 3rd vertex y
+            p_x (float): point x
+            p_y (float): point y
+
+        Returns:
+            bool: True if contains. else Fasle.
+        """
+        r1_x = a_x - p_x
+        r1_y = a_y - p_y
+        r2_x = b_x - p_x
+        r2_y = b_y - p_y
+        r3_x = c_x - p_x
+        r3_y = c_y - p_y
+        outer1 = r1_x * r2_y - r1_y * r2_x
+        outer2 = r2_x * r3_y - r2_y * r3_x
+        outer3 = r3_x * r1_y - r3_y * r1_x
+        return ((outer1 >= 0.0 and outer2 >= 0.0 and outer3 >= 0.0)
+                or (outer1 <= 0.0 and outer2 <= 0.0 and outer3 <= 0.0))
+
+    @staticmethod
+    def contains_mask(triangles: list, points) -> list[list[bool]]:
+        """check every point against every triangle
+
+        Args:
+            triangles (list): Triangle2D or (a, b, c) vertex tuples
+            points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+
+        Returns:
+            list[list[bool]]: mask[i][j] is True if triangle j contains point i
+        """
+        tri_coords = triangle_coords(triangles)
+        contains = Triangle2D.coords_contains
+        return [[contains(a_x, a_y, b_x, b_y, c_x, c_y, p_x, p_y)
+                 for a_x, a_y, b_x, b_y, c_x, c_y in tri_coords]
+                for p_x, p_y in to_coords(points)]
+
+    @staticmethod
+    def find_first_contains(triangles: list, points) -> list[int]:
+        """find the first triangle that contains each point
+
+        Args:
+            triangles (list): Triangle2D or (a, b, c) vertex tuples
+            points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+
+        Returns:
+            list[int]: triangle index for each point, -1 if no triangle contains it
+        """
+        tri_coords = triangle_coords(triangles)
+        # bounding boxes reject most triangles before the outer products
+        boxes = [(min(a_x, b_x, c_x), min(a_y, b_y, c_y), max(a_x, b_x, c_x), max(a_y, b_y, c_y))
+                 for a_x, a_y, b_x, b_y, c_x, c_y in tri_coords]
+        contains = Triangle2D.coords_contains
+        result = []
+        for p_x, p_y in to_coords(points):
+            found = -1
+            for j, (min_x, min_y, max_x, max_y) in enumerate(boxes):
+                if min_x <= p_x <= max_x and min_y <= p_y <= max_y \
+                        and contains(*tri_coords[j], p_x, p_y):
+                    found = j
+                    break
+            result.append(found)
+        return result
+
+    @staticmethod
+    def centroids(triangles: list) -> list[Vector2D]:
+        """get the centroid of each triangle
+
+        Args:
+            triangles (list): Triangle2D or (a, b, c) vertex tuples
+
+        Returns:
+            list[Vector2D]: centroid of each triangle
+        """
+        return [Vector2D((a_x + b_x + c_x) / 3.0, (a_y + b_y + c_y) / 3.0)
+                for a_x, a_y, b_x, b_y, c_x, c_y in triangle_coords(triangles)]
+
+    @staticmethod
+    def incenters(triangles: list) -> list[Vector2D]:
+        """get the incenter of each triangle
+
+        the incenter is the mean of the vertices weighted by the lengths of
+        the opposite edges.
+
+        Args:
+            triangles (list): Triangle2D or (a, b, c) vertex tuples
+
+        Returns:
+            list[Vector2D]: incenter of each triangle. invalid vector for a degenerate triangle
+        """
+        result = []
+        for a_x, a_y, b_x, b_y, c_x, c_y in triangle_coords(triangles):
+            len_a = math.sqrt((c_x - b_x) ** 2 + (c_y - b_y) ** 2)
+            len_b = math.sqrt((a_x - c_x) ** 2 + (a_y - c_y) ** 2)
+            len_c = math.sqrt((b_x - a_x) ** 2 + (b_y - a_y) ** 2)
+            total = len_a + len_b + len_c
+            if total < EPSILON or math.fabs((b_x - a_x) * (c_y - a_y)
+                                            - (b_y - a_y) * (c_x - a_x)) < 1.0e-10:
+                result.append(Vector2D.invalid())
+                continue
+            result.append(Vector2D((len_a * a_x + len_b * b_x + len_c * c_x) / total,
+                                   (len_a * a_y + len_b * b_y + len_c * c_y) / total))
+        return result
+
+    @staticmethod
+    def circumcenters(triangles: list) -> list[Vector2D]:
+        """get the circumcenter of each triangle
+
+        Args:
+            triangles (list): Triangle2D or (a, b, c) vertex tuples
+
+        Returns:
+            list[Vector2D]: circumcenter of each triangle. invalid vector for a degenerate triangle
+        """
+        result = []
+        for a_x, a_y, b_x, b_y, c_x, c_y in triangle_coords(triangles):
+            ab_x = b_x - a_x
+            ab_y = b_y - a_y
+            ca_x = c_x - a_x
+            ca_y = c_y - a_y
+            tmp = ab_x * ca_y - ab_y * ca_x
+            if math.fabs(tmp) < 1.0e-10:
+                result.append(Vector2D.invalid())
+                continue
+            inv = 0.5 / tmp
+            ab_len2 = ab_x * ab_x + ab_y * ab_y
+            ca_len2 = ca_x * ca_x + ca_y * ca_y
+            result.append(Vector2D(a_x + inv * (ab_len2 * ca_y - ca_len2 * ab_y),
+                                   a_y + inv * (ab_x * ca_len2 - ca_x * ab_len2)))
+        return result
+
+    @staticmethod
+    def orthocenters(triangles: list) -> list[Vector2D]:
+        """get the orthocenter of each triangle
+
+        orthocenter = a + b + c - 2 * circumcenter
+
+        Args:
+            triangles (list): Triangle2D or (a, b, c) vertex tuples
+
+        Returns:
+            list[Vector2D]: orthocenter of each triangle. invalid vector for a degenerate triangle
+        """
+        result = []
+        tri_coords = triangle_coords(triangles)
+        for (a_x, a_y, b_x, b_y, c_x, c_y), center in zip(tri_coords,
+                                                           Triangle2D.circumcenters(triangles)):
+            if not center.is_valid():
+                result.append(center)
+                continue
+            result.append(Vector2D(a_x + b_x + c_x - 2.0 * center.x(),
+                                   a_y + b_y + c_y - 2.0 * center.y()))
+        return result
+
     def __repr__(self) -> str:
         """represent Triangle2D as a string
 
@@ -512,3 +779,21 @@ class Triangle2D(Region2D):
         """
         ostr += f'(tri {round(self.a().x(), 3)} {round(self.a().y(), 3)} {round(self.b().x(), 3)} \
         {round(self.b().y(), 3)} {round(self.c().x(), 3)} {round(self.c().y(), 3)})'
+
+
+def triangle_coords(triangles: list) -> list[tuple]:
+    """get vertex coordinates of triangles
+
+    Args:
+        triangles (list): Triangle2D or (a, b, c) tuples of Vector2D or (x, y) pairs
+
+    Returns:
+        list[tuple]: (a_x, a_y, b_x, b_y, c_x, c_y) of each triangle
+    """
+    result = []
+    for triangle in triangles:
+        if isinstance(triangle, Triangle2D):
+            triangle = (triangle.a_(), triangle.b_(), triangle.c_())
+        (a_x, a_y), (b_x, b_y), (c_x, c_y) = to_coords(triangle)
+        result.append((a_x, a_y, b_x, b_y, c_x, c_y))
+    return result
@@ -647,3 +647,74 @@ class Vector2D:
             float: value of outer product
         """
         return vec_1.outer_product(vec_2)
+
+
+def to_coords(points) -> list[tuple]:
+    """get a list of (x, y) tuples from a point sequence
+
+    Vector2D objects, (x, y) pairs and arrays with a tolist() method
+    (e.g. numpy arrays of shape (n, 2)) are accepted.
+
+    Args:
+        points: sequence of Vector2D, sequence of (x, y) pairs or (n, 2) array
+
+    Returns:
+        list[tuple]: [(x0, y0), (x1, y1), ...]
+    """
+    if hasattr(points, 'tolist'):
+        points = points.tolist()
+    coords = []
+    for point in points:
+        if isinstance(point, Vector2D):
+            coords.append((point.x(), point.y()))
+        else:
+            coords.append((point[0], point[1]))
+    return coords
+
+
+def unique_points(points: list[Vector2D], tolerance: float = 0.0) -> list[Vector2D]:
+    """remove duplicated points in linear time keeping the first occurrence
+
+    with tolerance, points are snapped to a grid of that cell size and each
+    point is compared only with the kept points in the 3x3 neighbor cells.
+    two points are same if both |dx| and |dy| are less than tolerance,
+    same as Vector2D.equals_weakly() with EPSILON.
+
+    Args:
+        points (list[Vector2D]): input points
+        tolerance (float, optional): snapping distance. Defaults to 0.0 (exact equality).
+
+    Returns:
+        list[Vector2D]: kept point objects in the input order
+    """
+    result = []
+    if tolerance <= 0.0:
+        seen = set()
+        for point in points:
+            key = (point.x(), point.y())
+            if key not in seen:
+                seen.add(key)
+                result.append(point)
+        return result
+
+    cells = {}
+    for point in points:
+        p_x = point.x()
+        p_y = point.y()
+        c_x = math.floor(p_x / tolerance)
+        c_y = math.floor(p_y / tolerance)
+        duplicated = False
+        for n_x in (c_x - 1, c_x, c_x + 1):
+            for n_y in (c_y - 1, c_y, c_y + 1):
+                for k_x, k_y in cells.get((n_x, n_y), ()):
+                    if math.fabs(p_x - k_x) < tolerance and math.fabs(p_y - k_y) < tolerance:
+                        duplicated = True
+                        break
+                if duplicated:
+                    break
+            if duplicated:
+                break
+        if not duplicated:
+            cells.setdefault((c_x, c_y), []).append((p_x, p_y))
+            result.append(point)
+    return result
@@ -0,0 +1,294 @@
+""" voronoi_diagram.py file
+    VoronoiDiagram: class name
+    Voronoi cells of sites clipped by a rectangle
+"""
+from __future__ import annotations
+from enum import Enum, unique, auto
+import math
+
+from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.rect_2d import Rect2D
+from pyrusgeom.line_2d import Line2D
+from pyrusgeom.polygon_2d import Polygon2D
+from pyrusgeom.delaunay_triangulation import DelaunayTriangulation
+
+
+@unique
+class VoronoiType(Enum):
+    """ VoronoiType
+        Distance types:
+            ORDINARY: |p - site|
+            POWER: |p - site|^2 - weight
+            ADDITIVE: |p - site| - weight (Apollonius diagram)
+    """
+    ORDINARY = auto()
+    POWER = auto()
+    ADDITIVE = auto()
+
+
+class VoronoiDiagram:
+    """ handling a Voronoi diagram in SS2D
+
+    ORDINARY cells are the rectangle clipped by the perpendicular bisectors
+    between the site and its Delaunay neighbors, and the owner of a point is
+    found by a greedy walk on the Delaunay triangulation.
+    POWER cells are clipped by the radical axes with all other sites.
+    ADDITIVE cells are bounded by hyperbolic arcs, so they are approximated by
+    sampling ray_count rays from the site, then clipped by the rectangle.
+    POWER and ADDITIVE owners are found by checking all sites.
+
+    sites at the same point share one cell: it is given to the first of
+    them (for POWER and ADDITIVE, the one with the largest weight, then the
+    first), and the others get empty cells, so the cells still partition
+    the rectangle.
+
+    cells are calculated when they are requested first.
+
+    Attributes:
+        _sites: site points
+        _rect: clipping rectangle
+        _weights: weight of each site
+        _type: distance type
+        _ray_count: number of rays for ADDITIVE cells
+        _delaunay: triangulation of the sites for ORDINARY
+        _vertex_ids: triangulation vertex index of each site
+        _vertex_sites: first site index of each triangulation vertex
+        _cells: cached cell of each site or None
+    """
+
+    def __init__(self, sites: list[Vector2D], rect: Rect2D, weights: list[float] = None,
+                 v_type: VoronoiType = VoronoiType.ORDINARY, ray_count: int = 64):
+        """This is the class init function and creates the diagram.
+
+        Args:
+            sites (list[Vector2D]): site points, expected to be inside the rectangle
+            rect (Rect2D): clipping rectangle (e.g. the pitch)
+            weights (list[float], optional): weight of each site. Defaults to None (all 0).
+            v_type (VoronoiType, optional): distance type. Defaults to VoronoiType.ORDINARY.
+            ray_count (int, optional): number of rays for ADDITIVE cells. Defaults to 64.
+        """
+        self._sites = sites.copy()
+        self._rect = rect
+        self._weights = [0.0] * len(sites) if weights is None else list(weights)
+        if len(self._weights) != len(self._sites):
+            raise Exception("VoronoiDiagram: the number of weights must be"
+                            " same as the number of sites")
+        self._type = v_type
+        self._ray_count = max(3, ray_count)
+        self._delaunay = None
+        self._vertex_ids: list[int] = []
+        self._vertex_sites: list[int] = []
+        self._cells: list = [None] * len(sites)
+        if v_type == VoronoiType.ORDINARY:
+            self._delaunay = DelaunayTriangulation()
+            self._vertex_ids = self._delaunay.add_vertices(self._sites)
+            self._vertex_sites = [-1] * self._delaunay.vertex_size()
+            for i, vid in enumerate(self._vertex_ids):
+                if self._vertex_sites[vid] == -1:
+                    self._vertex_sites[vid] = i
+
+    def sites(self) -> list[Vector2D]:
+        """get a copy list of the sites
+
+        Returns:
+            list[Vector2D]: site points
+        """
+        return self._sites.copy()
+
+    def rect(self) -> Rect2D:
+        """get the clipping rectangle
+
+        Returns:
+            Rect2D: clipping rectangle
+        """
+        return self._rect
+
+    def weights(self) -> list[float]:
+        """get a copy list of the weights
+
+        Returns:
+            list[float]: weight of each site
+        """
+        return self._weights.copy()
+
+    def triangulation(self) -> DelaunayTriangulation:
+        """get the Delaunay triangulation of the sites
+
+        Returns:
+            DelaunayTriangulation: triangulation, None if the type is not ORDINARY
+        """
+        return self._delaunay
+
+    def distance(self, index: int, point: Vector2D) -> float:
+        """get the weighted distance from a site
+
+        Args:
+            index (int): site index
+            point (Vector2D): considered point
+
+        Returns:
+            float: distance value of the diagram type
+        """
+        d2 = self._sites[index].dist2(point)
+        if self._type == VoronoiType.POWER:
+            return d2 - self._weights[index]
+        if self._type == VoronoiType.ADDITIVE:
+            return math.sqrt(d2) - self._weights[index]
+        return math.sqrt(d2)
+
+    def find_cell(self, point: Vector2D) -> int:
+        """find the site whose cell contains the point
+
+        Args:
+            point (Vector2D): considered point
+
+        Returns:
+            int: site index, -1 if there is no site
+        """
+        if len(self._sites) == 0:
+            return -1
+        if self._type == VoronoiType.ORDINARY:
+            return self._vertex_sites[self._delaunay.find_nearest_vertex(point)]
+
+        p_x = point.x()
+        p_y = point.y()
+        best = -1
+        best_dist = math.inf
+        for i, site in enumerate(self._sites):
+            d2 = (site.x() - p_x) ** 2 + (site.y() - p_y) ** 2
+            dist = d2 - self._weights[i] if self._type == VoronoiType.POWER \
+                else math.sqrt(d2) - self._weights[i]
+            if dist < best_dist:
+                best = i
+                best_dist = dist
+        return best
+
+    def cell(self, index: int) -> Polygon2D:
+        """get the cell of a site
+
+        Args:
+            index (int): site index
+
+        Returns:
+            Polygon2D: cell polygon clipped by the rectangle. empty if the site owns no area
+        """
+        if self._cells[index] is None:
+            if self._type == VoronoiType.ADDITIVE:
+                self._cells[index] = self.additive_cell(index)
+            else:
+                self._cells[index] = self.half_planes_cell(index)
+        return self._cells[index]
+
+    def cells(self) -> list[Polygon2D]:
+        """get the cells of all sites
+
+        Returns:
+            list[Polygon2D]: cell polygon of each site
+        """
+        return [self.cell(i) for i in range(len(self._sites))]
+
+    def rect_polygon(self) -> Polygon2D:
+        """get the clipping rectangle as a polygon
+
+        Returns:
+            Polygon2D: rectangle polygon
+        """
+        rect = self._rect
+        return Polygon2D([rect.top_left(), rect.top_right(), rect.bottom_right(), rect.bottom_left()])
+
+    def half_planes_cell(self, index: int) -> Polygon2D:
+        """get an ORDINARY or POWER cell by clipping the rectangle with half-planes
+
+        Args:
+            index (int): site index
+
+        Returns:
+            Polygon2D: cell polygon
+        """
+        site = self._sites[index]
+        if self._type == VoronoiType.ORDINARY:
+            if self._vertex_sites[self._vertex_ids[index]] != index:
+                return Polygon2D([])  # an earlier site is at the same point
+            # Delaunay edges also connect collinear sites
+            others = [self._vertex_sites[v]
+                      for v in self._delaunay.neighbor_vertices(self._vertex_ids[index])]
+        else:
+            others = [i for i in range(len(self._sites)) if i != index]
+
+        s_x = site.x()
+        s_y = site.y()
+        s_w = self._weights[index] if self._type == VoronoiType.POWER else 0.0
+        half_planes = []
+        for i in others:
+            o_x = self._sites[i].x()
+            o_y = self._sites[i].y()
+            o_w = self._weights[i] if self._type == VoronoiType.POWER else 0.0
+            if o_x == s_x and o_y == s_y:
+                if o_w > s_w or (o_w == s_w and i < index):
+                    return Polygon2D([])  # the other site at the same point owns the cell
+                continue
+            # keep |p - s|^2 - s_w <= |p - o|^2 - o_w
+            half_planes.append(Line2D(-2.0 * (o_x - s_x), -2.0 * (o_y - s_y),
+                                      o_x * o_x + o_y * o_y - s_x * s_x - s_y * s_y - o_w + s_w))
+        return Polygon2D(Polygon2D.get_half_planes_clipped_polygon(self.rect_polygon().vertices_(),
+                                                                   half_planes))
+
+    def additive_cell(self, index: int) -> Polygon2D:
+        """get an ADDITIVE cell by sampling rays from the site
+
+        on the ray site + t * u, the boundary with another site o satisfies
+        t - w_s = |t * u - d| - w_o (d = o - site), so
+        t = (|d|^2 - k^2) / (2 * (u.d - k)) where k = w_s - w_o.
+
+        Args:
+            index (int): site index
+
+        Returns:
+            Polygon2D: approximated cell polygon
+        """
+        site = self._sites[index]
+        s_x = site.x()
+        s_y = site.y()
+        s_w = self._weights[index]
+
+        others = []
+        for i, other in enumerate(self._sites):
+            if i == index:
+                continue
+            d_x = other.x() - s_x
+            d_y = other.y() - s_y
+            k = s_w - self._weights[i]
+            d2 = d_x * d_x + d_y * d_y
+            if d2 <= k * k:
+                if k < 0.0 or (k == 0.0 and i < index):
+                    return Polygon2D([])  # this site is dominated
+                continue  # the other site is dominated
+            others.append((d_x, d_y, k, d2 - k * k))
+
+        rect = self._rect
+        max_t = 1.0
+        for corner in (rect.top_left(), rect.top_right(), rect.bottom_right(), rect.bottom_left()):
+            max_t = max(max_t, 2.0 * corner.dist(site))
+
+        points = []
+        for r in range(self._ray_count):
+            angle = 2.0 * math.pi * r / self._ray_count
+            u_x = math.cos(angle)
+            u_y = math.sin(angle)
+            t_min = max_t
+            for d_x, d_y, k, numerator in others:
+                denominator = 2.0 * (u_x * d_x + u_y * d_y - k)
+                if denominator > 0.0:
+                    t = numerator / denominator
+                    if t < t_min:
+                        t_min = t
+            points.append(Vector2D(s_x + u_x * t_min, s_y + u_y * t_min))
+        return Polygon2D(points).get_convex_clipped_polygon(self.rect_polygon())
+
+    def __repr__(self) -> str:
+        """represent the diagram as a string
+
+        Returns:
+            str: contains the sites and the type
+        """
+        return f"({self._sites} , {self._type.name})"
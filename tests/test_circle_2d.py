@@ -1,5 +1,5 @@
 from unittest import TestCase
-from pyrusgeom.circle_2d import Circle2D
+from pyrusgeom.circle_2d import Circle2D, in_circum_circle
 from pyrusgeom.vector_2d import Vector2D
 from pyrusgeom.line_2d import Line2D
 from pyrusgeom.ray_2d import Ray2D
@@ -128,3 +128,8 @@ class TestCircle2D(TestCase):
         v3 = Vector2D(0, 1)
         self.assertTrue(Circle2D.circum_circle_contains(Vector2D(0.5, 0.5), v1, v2, v3))
         self.assertFalse(Circle2D.circum_circle_contains(Vector2D(2, 2), v1, v2, v3))
+
+    def test_in_circum_circle(self):
+        self.assertGreater(in_circum_circle(0.5, 0.5, 0, 0, 1, 0, 0, 1), 0.0)
+        self.assertLess(in_circum_circle(2, 2, 0, 0, 1, 0, 0, 1), 0.0)
+        self.assertEqual(in_circum_circle(1, 1, 0, 0, 1, 0, 0, 1), 0.0)
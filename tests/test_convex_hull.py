@@ -2,10 +2,12 @@
     to test pyrusgeom ConvexHull class
 """
 from unittest import TestCase
-from pyrusgeom.convex_hull import ConvexHull, MethodType, Polygon2D , \
-    list2set, angle_sort_predicate, is_clockwise
+import math
+from pyrusgeom.convex_hull import ConvexHull, IncrementalConvexHull, MethodType, Polygon2D , \
+    list2set, angle_sort_predicate, is_clockwise, convex_hull_indices
 
 from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.segment_2d import Segment2D
 
 
 class TestConvexHull(TestCase):
@@ -75,6 +77,16 @@ class TestConvexHull(TestCase):
         list_test = [-1.5, 1, 2, 0, 0, 0, 2]
         set_test = [-1.5, 1, 2, 0]
         self.assertEqual(list2set(list_test), set_test)
+        self.assertEqual(list2set([[1], [2], [1]]), [[1], [2]])
+
+    def test_remove_duplicate_points(self):
+        points = self.input_points_0 + [Vector2D(7, 7), Vector2D(7.0001, 7.0)]
+        convex_hull_test = ConvexHull(points)
+        self.assertIs(convex_hull_test.remove_duplicate_points(), convex_hull_test)
+        self.assertEqual(len(convex_hull_test.input_points()), 9)
+        convex_hull_test.remove_duplicate_points(0.001)
+        self.assertEqual(convex_hull_test.input_points(), self.input_points_0)
+        self.assertEqual(len(points), 10)
 
     def test_angle_sort_predicate(self):
         alpha_point = Vector2D(20, 10)
@@ -125,11 +137,50 @@ class TestConvexHull(TestCase):
         self.assertCountEqual(convex_hull_test.vertices(),
                               self.convext_hull_points_01)
 
-        # convex_hull_test = ConvexHull(self.input_points_2)
-        # convex_hull_test.compute(MethodType.GRAHAN_SCAN)
+        convex_hull_test = ConvexHull(self.input_points_2)
+        convex_hull_test.compute(MethodType.GRAHAN_SCAN)
+
+        self.assertCountEqual(convex_hull_test.vertices(),
+                              self.convext_hull_points_2)
+
+    def test_convex_hull_keeps_input_order(self):
+        points = self.input_points_1.copy()
+        for m_type in (MethodType.WRAPPING_METHOD, MethodType.GRAHAN_SCAN,
+                       MethodType.MONOTONE_CHAIN, MethodType.AKL_TOUSSAINT):
+            convex_hull_test = ConvexHull(points)
+            convex_hull_test.compute(m_type)
+            self.assertEqual(points, self.input_points_1)
+            self.assertEqual([points[i] for i in convex_hull_test.vertex_indices()],
+                             convex_hull_test.vertices())
+            self.assertCountEqual(convex_hull_test.vertex_indices(), [0, 1, 2, 3, 4, 5, 6, 7])
+            convex_hull_test.clear_results()
+            self.assertEqual(points, self.input_points_1)
+
+    def test_convex_hull_indices(self):
+        coords = [(point.x(), point.y()) for point in self.input_points_1]
+        indices = convex_hull_indices(coords)
+        self.assertEqual(indices, [5, 2, 7, 1, 4, 0, 6, 3])
+        self.assertEqual(convex_hull_indices(coords, MethodType.GRAHAN_SCAN), indices)
+        self.assertEqual(convex_hull_indices(coords, MethodType.AKL_TOUSSAINT), indices)
+        self.assertEqual(convex_hull_indices(self.input_points_1), indices)
+        self.assertEqual(convex_hull_indices([(0, 0), (1, 1), (2, 2)]), [0, 2])
+        self.assertEqual(convex_hull_indices([(0, 0), (1, 1)]), [])
+        with self.assertRaises(Exception):
+            convex_hull_indices(coords, MethodType.WRAPPING_METHOD)
 
-        # self.assertCountEqual(convex_hull_test.vertices(),
-        #                       self.convext_hull_points_2)
+    def test_convex_hull_akl_toussaint(self):
+        for points in (self.input_points_0, self.input_points_1, self.input_points_2):
+            convex_hull_test = ConvexHull(points)
+            convex_hull_test.compute(MethodType.AKL_TOUSSAINT)
+            reference = ConvexHull(points)
+            reference.compute(MethodType.MONOTONE_CHAIN)
+            self.assertEqual(convex_hull_test.vertices(), reference.vertices())
+            self.assertEqual(convex_hull_test.edges(), reference.edges())
+
+        collinear = [Vector2D(0, 0), Vector2D(1, 1), Vector2D(2, 2), Vector2D(3, 3)]
+        convex_hull_test = ConvexHull(collinear)
+        convex_hull_test.compute(MethodType.AKL_TOUSSAINT)
+        self.assertEqual(convex_hull_test.vertices(), [Vector2D(0, 0), Vector2D(3, 3)])
 
     def test_to_polgon(self):
         convex_hull_test = ConvexHull(self.input_points_0)
@@ -137,4 +188,101 @@ class TestConvexHull(TestCase):
         plg_test = Polygon2D(self.convext_hull_points_01)
         plg = convex_hull_test.to_polygon()
         self.assertEqual(plg.vertices(),plg_test.vertices())
-            
\ No newline at end of file
+            
+    def test_convex_hull_monotone_chain(self):
+        convex_hull_test = ConvexHull(self.input_points_0)
+        convex_hull_test.compute(MethodType.MONOTONE_CHAIN)
+        self.assertEqual(convex_hull_test.vertices(), self.convext_hull_points_01)
+        self.assertEqual(len(convex_hull_test.edges()), 8)
+        self.assertEqual(convex_hull_test.edges()[0],
+                         Segment2D(Vector2D(-9, 0), Vector2D(-7, -7)))
+        self.assertEqual(convex_hull_test.edges()[-1],
+                         Segment2D(Vector2D(-7, 7), Vector2D(-9, 0)))
+
+        convex_hull_test = ConvexHull(self.input_points_1)
+        convex_hull_test.compute(MethodType.MONOTONE_CHAIN)
+        self.assertEqual(convex_hull_test.vertices(), self.convext_hull_points_01)
+
+        convex_hull_test = ConvexHull(self.input_points_2)
+        convex_hull_test.compute(MethodType.MONOTONE_CHAIN)
+        self.assertCountEqual(convex_hull_test.vertices(), self.convext_hull_points_2)
+        wrapping_test = ConvexHull(self.input_points_2)
+        wrapping_test.compute(MethodType.WRAPPING_METHOD)
+        self.assertEqual(convex_hull_test.vertices(), wrapping_test.vertices())
+        self.assertTrue(convex_hull_test.to_polygon().is_counter_clockwise())
+
+        collinear = [Vector2D(0, 0), Vector2D(1, 1), Vector2D(2, 2), Vector2D(3, 3)]
+        convex_hull_test = ConvexHull(collinear)
+        convex_hull_test.compute(MethodType.MONOTONE_CHAIN)
+        self.assertEqual(convex_hull_test.vertices(), [Vector2D(0, 0), Vector2D(3, 3)])
+
+    def test_incremental_convex_hull(self):
+        convex_hull_test = IncrementalConvexHull()
+        for point in self.input_points_1:
+            convex_hull_test.add_point(point)
+        self.assertEqual(convex_hull_test.vertices(), self.convext_hull_points_01)
+        self.assertEqual(convex_hull_test.point_size(), len(self.input_points_1))
+        self.assertEqual(len(convex_hull_test.edges()), 8)
+
+        self.assertFalse(convex_hull_test.add_point(Vector2D(0, 0)))
+        self.assertFalse(convex_hull_test.add_point(Vector2D(-9, 0)))
+        self.assertTrue(convex_hull_test.contains(Vector2D(0, 0)))
+        self.assertTrue(convex_hull_test.contains(Vector2D(-9, 0)))
+        self.assertFalse(convex_hull_test.contains(Vector2D(20, 0)))
+
+        self.assertTrue(convex_hull_test.add_point(Vector2D(20, 0)))
+        self.assertTrue(convex_hull_test.contains(Vector2D(15, 0)))
+        reference = ConvexHull(self.input_points_1 + [Vector2D(20, 0)])
+        reference.compute(MethodType.MONOTONE_CHAIN)
+        self.assertEqual(convex_hull_test.vertices(), reference.vertices())
+        self.assertTrue(convex_hull_test.to_polygon().is_counter_clockwise())
+
+        convex_hull_test = IncrementalConvexHull(self.input_points_2)
+        reference = ConvexHull(self.input_points_2)
+        reference.compute(MethodType.MONOTONE_CHAIN)
+        self.assertEqual(convex_hull_test.vertices(), reference.vertices())
+
+        collinear = [Vector2D(2, 2), Vector2D(0, 0), Vector2D(3, 3), Vector2D(1, 1)]
+        convex_hull_test = IncrementalConvexHull(collinear)
+        self.assertEqual(convex_hull_test.vertices(), [Vector2D(0, 0), Vector2D(3, 3)])
+
+    def test_rotating_calipers(self):
+        convex_hull_test = ConvexHull(self.input_points_1)
+        convex_hull_test.compute(MethodType.MONOTONE_CHAIN)
+
+        diameter = convex_hull_test.diameter()
+        self.assertAlmostEqual(diameter.length(), 14.0 * 2.0 ** 0.5)
+        self.assertEqual(diameter.origin().dist(diameter.terminal()), diameter.length())
+
+        width = convex_hull_test.min_width()
+        self.assertAlmostEqual(width.length(), 126.0 / 53.0 ** 0.5)
+
+        rect_points = [Vector2D(0, 0), Vector2D(4, 4), Vector2D(3, 5), Vector2D(-1, 1),
+                       Vector2D(1.5, 2.5), Vector2D(2, 2)]
+        convex_hull_test = ConvexHull(rect_points)
+        convex_hull_test.compute(MethodType.MONOTONE_CHAIN)
+
+        diameter = convex_hull_test.diameter()
+        self.assertAlmostEqual(diameter.length(), Vector2D(-1, 1).dist(Vector2D(4, 4)))
+        width = convex_hull_test.min_width()
+        self.assertAlmostEqual(width.length(), 2.0 ** 0.5)
+        self.assertIn(width.terminal(), [Vector2D(-1, 1), Vector2D(3, 5)])
+
+        center, size, angle = convex_hull_test.min_area_rect()
+        self.assertAlmostEqual(center.x(), 1.5)
+        self.assertAlmostEqual(center.y(), 2.5)
+        self.assertAlmostEqual(size.length() * size.width(), 8.0)
+        self.assertAlmostEqual(math.fabs(math.sin(angle.radian() * 2.0)), 1.0)
+
+        center, size, angle = convex_hull_test.min_perimeter_rect()
+        self.assertAlmostEqual(center.x(), 1.5)
+        self.assertAlmostEqual(center.y(), 2.5)
+        self.assertAlmostEqual(max(size.length(), size.width()), 4.0 * 2.0 ** 0.5)
+        self.assertAlmostEqual(min(size.length(), size.width()), 2.0 ** 0.5)
+        self.assertAlmostEqual(math.fabs(math.sin(angle.radian() * 2.0)), 1.0)
+
+        convex_hull_test = ConvexHull([])
+        convex_hull_test.compute(MethodType.MONOTONE_CHAIN)
+        self.assertFalse(convex_hull_test.diameter().is_valid())
+        self.assertFalse(convex_hull_test.min_width().is_valid())
+        self.assertFalse(convex_hull_test.min_area_rect()[0].is_valid())
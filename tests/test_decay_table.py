@@ -0,0 +1,50 @@
+""" test_decay_table.py file
+    to test pyrusgeom DecayTable class
+"""
+import math
+from unittest import TestCase
+from pyrusgeom.decay_table import DecayTable
+
+
+class TestDecayTable(TestCase):
+    """TestDecayTable class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+
+    def test_values(self):
+        table = DecayTable(0.94, 10)
+        self.assertEqual(table.decay(), 0.94)
+        self.assertEqual(table.max_step(), 10)
+        self.assertEqual(table.pow(0), 1.0)
+        self.assertEqual(table.sum(0), 0.0)
+        self.assertEqual(table.sum(1), 1.0)
+        for n_step in range(30):
+            self.assertEqual(table.pow(n_step), math.pow(0.94, n_step))
+            self.assertEqual(table.sum(n_step), (1.0 - math.pow(0.94, n_step)) / (1.0 - 0.94))
+        self.assertEqual(table.max_step(), 29)
+        self.assertEqual(len(table.pows_()), 30)
+        self.assertEqual(table.pow(2.5), math.pow(0.94, 2.5))
+        self.assertEqual(table.log_decay(), math.log(0.94))
+
+    def test_no_decay(self):
+        table = DecayTable(1.0, 5)
+        for n_step in range(10):
+            self.assertEqual(table.pow(n_step), 1.0)
+            self.assertEqual(table.sum(n_step), n_step)
+        self.assertEqual(table.sum(2.5), 2.5)
+        self.assertEqual(table.log_decay(), 0.0)
+
+    def test_invalid_decay(self):
+        self.assertRaises(ValueError, DecayTable, 0.0)
+        self.assertRaises(ValueError, DecayTable, -0.5)
+        self.assertRaises(ValueError, DecayTable.instance, 0.0)
+
+    def test_instance(self):
+        DecayTable.clear_instances()
+        ball = DecayTable.instance(0.94)
+        self.assertIs(DecayTable.instance(0.94), ball)
+        self.assertIsNot(DecayTable.instance(0.4), ball)
+        DecayTable.clear_instances()
+        self.assertIsNot(DecayTable.instance(0.94), ball)
@@ -0,0 +1,80 @@
+""" test_delaunay_triangulation.py file
+    to test pyrusgeom DelaunayTriangulation class
+"""
+import random
+from unittest import TestCase
+from pyrusgeom.delaunay_triangulation import DelaunayTriangulation
+from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.circle_2d import Circle2D
+
+
+class TestDelaunayTriangulation(TestCase):
+    """TestDelaunayTriangulation class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+    square_points = [Vector2D(0, 0), Vector2D(10, 0), Vector2D(10, 10), Vector2D(0, 10),
+                     Vector2D(5, 4)]
+
+    def test_triangles(self):
+        delaunay = DelaunayTriangulation(self.square_points)
+        self.assertEqual(delaunay.vertex_size(), 5)
+        triangles = delaunay.triangles()
+        self.assertEqual(len(triangles), 4)
+        self.assertCountEqual([sorted(tri) for tri in triangles],
+                              [[0, 1, 4], [1, 2, 4], [2, 3, 4], [0, 3, 4]])
+        for tri in triangles:
+            v_a, v_b, v_c = (self.square_points[i] for i in tri)
+            self.assertGreater((v_b - v_a).outer_product(v_c - v_a), 0.0)
+        self.assertEqual(len(delaunay.edges()), 8)
+        self.assertCountEqual(delaunay.neighbor_vertices(4), [0, 1, 2, 3])
+        self.assertCountEqual(delaunay.neighbor_vertices(0), [1, 3, 4])
+
+    def test_empty_circle(self):
+        rng = random.Random(7)
+        points = [Vector2D(rng.uniform(-52.5, 52.5), rng.uniform(-34.0, 34.0)) for _ in range(200)]
+        delaunay = DelaunayTriangulation(points)
+        # triangles = 2n - 2 - (hull size), edges = 3n - 3 - (hull size)
+        hull_size = 3 * len(points) - 3 - len(delaunay.edges())
+        self.assertEqual(len(delaunay.triangles()), 2 * len(points) - 2 - hull_size)
+        for tri in delaunay.triangles():
+            v_a, v_b, v_c = (points[i] for i in tri)
+            for i, point in enumerate(points):
+                if i not in tri:
+                    self.assertFalse(Circle2D.circum_circle_contains(point, v_a, v_b, v_c))
+
+    def test_incremental(self):
+        rng = random.Random(3)
+        points = [Vector2D(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(50)]
+        delaunay = DelaunayTriangulation()
+        for i, point in enumerate(points):
+            self.assertEqual(delaunay.add_vertex(point), i)
+        self.assertEqual(delaunay.add_vertex(points[5].copy()), 5)
+        self.assertEqual(delaunay.add_vertices([Vector2D(100, 100), points[0]]), [50, 0])
+        batch = DelaunayTriangulation(points + [Vector2D(100, 100)])
+        self.assertCountEqual([sorted(tri) for tri in delaunay.triangles()],
+                              [sorted(tri) for tri in batch.triangles()])
+
+        delaunay.clear()
+        self.assertEqual(delaunay.vertex_size(), 0)
+        self.assertEqual(delaunay.triangles(), [])
+        self.assertEqual(delaunay.find_nearest_vertex(Vector2D(0, 0)), -1)
+
+    def test_find_triangle_contains(self):
+        delaunay = DelaunayTriangulation(self.square_points)
+        self.assertCountEqual(delaunay.find_triangle_contains(Vector2D(5, 1)), [0, 1, 4])
+        self.assertCountEqual(delaunay.find_triangle_contains(Vector2D(9, 5)), [1, 2, 4])
+        self.assertIsNone(delaunay.find_triangle_contains(Vector2D(11, 5)))
+        tri_id = delaunay.locate(Vector2D(1, 5))
+        self.assertCountEqual(delaunay.triangle(tri_id), [0, 3, 4])
+        self.assertLess(min(delaunay.triangle(delaunay.locate(Vector2D(-1, 5)))), 0)
+
+    def test_find_nearest_vertex(self):
+        rng = random.Random(5)
+        points = [Vector2D(rng.uniform(-52.5, 52.5), rng.uniform(-34.0, 34.0)) for _ in range(300)]
+        delaunay = DelaunayTriangulation(points)
+        for _ in range(100):
+            target = Vector2D(rng.uniform(-60.0, 60.0), rng.uniform(-40.0, 40.0))
+            nearest = min(range(len(points)), key=lambda i: points[i].dist2(target))
+            self.assertEqual(delaunay.find_nearest_vertex(target), nearest)
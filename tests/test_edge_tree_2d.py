@@ -0,0 +1,80 @@
+""" test_edge_tree_2d.py file
+    to test pyrusgeom EdgeTree2D class
+"""
+import math
+import random
+from unittest import TestCase
+from pyrusgeom.edge_tree_2d import EdgeTree2D
+from pyrusgeom.polygon_2d import Polygon2D
+from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.ray_2d import Ray2D
+
+
+class TestEdgeTree2D(TestCase):
+    """TestEdgeTree2D class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+    input_points_2 = [Vector2D(10, 10), Vector2D(0, 15), Vector2D(-10, 10),
+                      Vector2D(-10, -10), Vector2D(10, -10)]
+    star_points = [Vector2D.from_polar(20.0 if i % 2 == 0 else 8.0, i * 360.0 / 400)
+                   for i in range(400)]
+
+    def test_lazy_build(self):
+        plg_0 = Polygon2D(self.star_points)
+        tree = plg_0.edge_tree()
+        self.assertFalse(tree.is_built())
+        self.assertEqual(tree.size(), 400)
+        tree.dist(Vector2D(0, 0))
+        self.assertTrue(tree.is_built())
+        self.assertIs(plg_0.edge_tree(), tree)
+        plg_0.add_vertex(Vector2D(0, 0))
+        self.assertIsNot(plg_0.edge_tree(), tree)
+
+    def test_dist(self):
+        plg_0 = Polygon2D(self.input_points_2)
+        tree = plg_0.edge_tree()
+        self.assertAlmostEqual(tree.dist(Vector2D(0, -15)), 5)
+        self.assertEqual(tree.dist(Vector2D(0, 0)), 0)
+        self.assertAlmostEqual(tree.dist(Vector2D(0, 0), False), 10)
+        self.assertAlmostEqual(tree.dist(Vector2D(-11, 11)), math.sqrt(2))
+        self.assertAlmostEqual(tree.dist(Vector2D(10, 15)), 50 / math.sqrt(125))
+
+        random.seed(0)
+        plg_1 = Polygon2D(self.star_points)
+        for _ in range(200):
+            point = Vector2D(random.uniform(-25, 25), random.uniform(-25, 25))
+            self.assertAlmostEqual(plg_1.edge_tree().dist(point), plg_1.dist(point))
+            self.assertAlmostEqual(plg_1.edge_tree().dist(point, False),
+                                   plg_1.dist(point, False))
+
+    def test_nearest(self):
+        tree = EdgeTree2D(self.input_points_2)
+        self.assertEqual(tree.nearest_edge(Vector2D(0, -15)), 3)
+        self.assertEqual(tree.nearest_point(Vector2D(0, -15)), Vector2D(0, -10))
+        self.assertEqual(tree.nearest_point(Vector2D(12, 0)), Vector2D(10, 0))
+        self.assertEqual(EdgeTree2D([]).nearest_edge(Vector2D()), -1)
+        self.assertFalse(EdgeTree2D([]).nearest_point(Vector2D()).is_valid())
+        self.assertEqual(EdgeTree2D([Vector2D(3, 4)]).dist(Vector2D()), 5)
+
+    def test_ray_intersection(self):
+        tree = EdgeTree2D(self.input_points_2)
+        self.assertTrue(tree.ray_intersection(Ray2D(Vector2D(0, 0), 0.0))
+                        .equals_weakly(Vector2D(10, 0)))
+        self.assertTrue(tree.ray_intersection(Ray2D(Vector2D(-20, 0), 0.0))
+                        .equals_weakly(Vector2D(-10, 0)))
+        self.assertFalse(tree.ray_intersection(Ray2D(Vector2D(-20, 0), 180.0)).is_valid())
+        self.assertTrue(tree.ray_intersection(Ray2D(Vector2D(0, 0), 90.0))
+                        .equals_weakly(Vector2D(0, 15)))
+        index, dist = tree.ray_intersection_edge(Ray2D(Vector2D(0, 0), -90.0))
+        self.assertEqual(index, 3)
+        self.assertAlmostEqual(dist, 10)
+
+    def test_contains(self):
+        random.seed(1)
+        plg_1 = Polygon2D(self.star_points)
+        tree = plg_1.edge_tree()
+        for _ in range(300):
+            point = Vector2D(random.uniform(-25, 25), random.uniform(-25, 25))
+            self.assertEqual(tree.contains(point), plg_1.contains(point))
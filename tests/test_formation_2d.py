@@ -0,0 +1,63 @@
+""" test_formation_2d.py file
+    to test pyrusgeom Formation2D class
+"""
+from unittest import TestCase
+from pyrusgeom.formation_2d import Formation2D
+from pyrusgeom.triangle_2d import Triangle2D
+from pyrusgeom.vector_2d import Vector2D
+
+
+def linear_players(ball: Vector2D) -> list:
+    return [Vector2D(ball.x() * 0.5 + i, ball.y() * 0.25 - i) for i in range(11)]
+
+
+class TestFormation2D(TestCase):
+    """TestFormation2D class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+    balls = [Vector2D(-50, -30), Vector2D(50, -30), Vector2D(50, 30), Vector2D(-50, 30),
+             Vector2D(0, 0), Vector2D(-20, 10), Vector2D(25, -15)]
+
+    def test_barycentric(self):
+        weights = Triangle2D.tri_barycentric(Vector2D(0, 0), Vector2D(4, 0), Vector2D(0, 4),
+                                             Vector2D(1, 2))
+        self.assertAlmostEqual(weights[0], 0.25)
+        self.assertAlmostEqual(weights[1], 0.25)
+        self.assertAlmostEqual(weights[2], 0.5)
+        triangle = Triangle2D(Vector2D(0, 0), Vector2D(4, 0), Vector2D(0, 4))
+        self.assertEqual(triangle.barycentric(Vector2D(0, 0)), (1.0, 0.0, 0.0))
+
+    def test_interpolation(self):
+        formation = Formation2D([(ball, linear_players(ball)) for ball in self.balls])
+        self.assertEqual(formation.sample_size(), 7)
+        self.assertEqual(formation.player_size(), 11)
+        for ball in (Vector2D(0, 0), Vector2D(10, 5), Vector2D(-49, 29), Vector2D(30, -20)):
+            positions = formation.get_positions(ball)
+            self.assertEqual(len(positions), 11)
+            for position, expected in zip(positions, linear_players(ball)):
+                self.assertAlmostEqual(position.x(), expected.x())
+                self.assertAlmostEqual(position.y(), expected.y())
+        self.assertAlmostEqual(formation.get_position(Vector2D(10, 5), 3).x(), 8.0)
+
+    def test_outside(self):
+        formation = Formation2D([(ball, linear_players(ball)) for ball in self.balls])
+        self.assertEqual(formation.get_positions(Vector2D(60, 40)),
+                         linear_players(Vector2D(50, 30)))
+        self.assertEqual(formation.get_positions(Vector2D(-55, 28)),
+                         linear_players(Vector2D(-50, 30)))
+
+    def test_update(self):
+        formation = Formation2D()
+        self.assertEqual(formation.get_positions(Vector2D(0, 0)), [])
+        self.assertFalse(formation.get_position(Vector2D(0, 0), 0).is_valid())
+        formation.add_sample(Vector2D(0, 0), linear_players(Vector2D(0, 0)))
+        self.assertEqual(formation.get_positions(Vector2D(5, 5)), linear_players(Vector2D(0, 0)))
+        for ball in self.balls[:4]:
+            formation.add_sample(ball, linear_players(ball))
+        self.assertEqual(formation.add_sample(Vector2D(0, 0), linear_players(Vector2D(2, 2))), 0)
+        self.assertEqual(formation.sample_size(), 5)
+        self.assertEqual(formation.players(0), linear_players(Vector2D(2, 2)))
+        with self.assertRaises(Exception):
+            formation.add_sample(Vector2D(1, 1), [Vector2D(0, 0)])
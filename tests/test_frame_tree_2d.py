@@ -0,0 +1,67 @@
+""" test_frame_tree_2d.py file
+    to test pyrusgeom FrameTree2D class
+"""
+from unittest import TestCase
+from pyrusgeom.frame_tree_2d import FrameTree2D
+from pyrusgeom.vector_2d import Vector2D
+
+
+class TestFrameTree2D(TestCase):
+    """TestFrameTree2D class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+
+    def assert_vector(self, vec_1: Vector2D, vec_2: Vector2D):
+        self.assertAlmostEqual(vec_1.x(), vec_2.x())
+        self.assertAlmostEqual(vec_1.y(), vec_2.y())
+
+    def test_convert(self):
+        tree = FrameTree2D()
+        tree.add_frame("self", position=Vector2D(10, 5), angle=90)
+        tree.add_frame("hand", "self", Vector2D(2, 0), -90)
+        tree.add_frame("ball", position=Vector2D(-3, 4))
+
+        # (1, 0) in self is (10, 6) in the world
+        self.assert_vector(tree.convert(Vector2D(1, 0), "self", FrameTree2D.ROOT),
+                           Vector2D(10, 6))
+        self.assert_vector(tree.convert(Vector2D(10, 6), FrameTree2D.ROOT, "self"),
+                           Vector2D(1, 0))
+        # hand is at (10, 7) in the world with the angle 0
+        self.assert_vector(tree.convert(Vector2D(1, 1), "hand", FrameTree2D.ROOT),
+                           Vector2D(11, 8))
+        self.assert_vector(tree.convert(Vector2D(0, 0), "ball", "hand"), Vector2D(-13, -3))
+        self.assert_vector(tree.convert(Vector2D(3, 3), "self", "self"), Vector2D(3, 3))
+
+        points = [Vector2D(0, 0), Vector2D(1, 2), Vector2D(-4, 3)]
+        converted = tree.convert_points(points, "hand", "ball")
+        for point, result in zip(points, converted):
+            self.assert_vector(result, tree.convert(point, "hand", "ball"))
+        coords = tree.convert_coords([0, 0, 1, 2, -4, 3], "hand", "ball")
+        for i, result in enumerate(converted):
+            self.assertAlmostEqual(coords[2 * i], result.x())
+            self.assertAlmostEqual(coords[2 * i + 1], result.y())
+
+    def test_set_pose(self):
+        tree = FrameTree2D()
+        tree.add_frame("self", position=Vector2D(10, 5), angle=90)
+        tree.add_frame("hand", "self", Vector2D(2, 0), -90)
+        matrix = tree.world_matrix_("hand")
+        self.assertIs(tree.world_matrix_("hand"), matrix)
+
+        tree.set_pose("self", Vector2D(0, 0), 0)
+        self.assertIsNot(tree.world_matrix_("hand"), matrix)
+        self.assert_vector(tree.convert(Vector2D(1, 1), "hand", FrameTree2D.ROOT),
+                           Vector2D(3, -1))
+        self.assert_vector(tree.convert(Vector2D(3, -1), FrameTree2D.ROOT, "hand"),
+                           Vector2D(1, 1))
+        self.assertEqual(tree.parent("hand"), "self")
+        self.assertEqual(tree.position("hand"), Vector2D(2, 0))
+        self.assertEqual(tree.angle("hand").degree(), -90)
+
+        tree.remove_frame("self")
+        self.assertFalse(tree.has_frame("hand"))
+        self.assertRaises(Exception, tree.convert, Vector2D(), "hand", FrameTree2D.ROOT)
+        self.assertRaises(Exception, tree.add_frame, "foot", "self")
+        self.assertRaises(Exception, tree.set_pose, FrameTree2D.ROOT, Vector2D(), 0)
@@ -2,8 +2,15 @@
     to test pyrusgeom Matrix2D class
 """
 from unittest import TestCase
-from pyrusgeom.matrix_2d import Matrix2D
+from pyrusgeom.matrix_2d import Matrix2D, Matrix2DArray
 from pyrusgeom.matrix_2d import Vector2D
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.segment_2d import Segment2D
+from pyrusgeom.triangle_2d import Triangle2D
+from pyrusgeom.circle_2d import Circle2D
+from pyrusgeom.rect_2d import Rect2D
+from pyrusgeom.size_2d import Size2D
+from pyrusgeom.polygon_2d import Polygon2D
 
 
 class TestMatrix2D(TestCase):
@@ -48,8 +55,98 @@ class TestMatrix2D(TestCase):
         self.assertEqual(mat_0.transform(vec_1),vec_1)
         self.assertEqual(mat_1.transform(vec_1),Vector2D(22,41))
 
+    def test_transform_points(self):
+        mat_1 = Matrix2D(2.0, 0.0, 2.0, 2.0, 2.0, 1.0)
+        points = [Vector2D(10, 10), Vector2D(-1, 3), Vector2D(0, 0)]
+        expected = [mat_1.transform(p) for p in points]
+        self.assertEqual(mat_1.transform_points(points), expected)
+        self.assertEqual(mat_1.transform_points([(10, 10), (-1, 3), (0, 0)]), expected)
+        self.assertEqual(points[0], Vector2D(10, 10))
+
+        coords = [10, 10, -1, 3, 0, 0]
+        self.assertEqual(mat_1.transform_coords(coords), [22, 41, 0, 5, 2, 1])
+        self.assertEqual(coords, [10, 10, -1, 3, 0, 0])
+        out = [0.0] * 6
+        self.assertIs(mat_1.transform_coords(coords, out), out)
+        mat_1.transform_coords(coords, coords)
+        self.assertEqual(coords, out)
+
+        self.assertIs(mat_1.transform_vecs(points), points)
+        self.assertEqual(points, expected)
+
+    def test_transform_shapes(self):
+        mat = Matrix2D.make_rotation(AngleDeg(90))
+        mat.translate(1, 2)
+        segment = mat.transform_segment(Segment2D(Vector2D(0, 0), Vector2D(2, 0)))
+        self.assertTrue(segment.origin().equals_weakly(Vector2D(1, 2)))
+        self.assertTrue(segment.terminal().equals_weakly(Vector2D(1, 4)))
+
+        triangle = mat.transform_triangle(Triangle2D(Vector2D(0, 0), Vector2D(2, 0),
+                                                     Vector2D(0, 1)))
+        self.assertTrue(triangle.c().equals_weakly(Vector2D(0, 2)))
+        self.assertAlmostEqual(triangle.area(), 1.0)
+
+        circle = Matrix2D(2, 0, 0, 2, 1, 1).transform_circle(Circle2D(Vector2D(1, 1), 3))
+        self.assertEqual(circle.center(), Vector2D(3, 3))
+        self.assertEqual(circle.radius(), 6)
+
+        rect = Rect2D(Vector2D(0, 0), Size2D(4, 2))
+        polygon = mat.transform_rect(rect)
+        self.assertIsInstance(polygon, Polygon2D)
+        self.assertAlmostEqual(polygon.area(), 8.0)
+        box = mat.transform_rect(rect, aabb=True)
+        self.assertAlmostEqual(box.left(), -1.0)
+        self.assertAlmostEqual(box.top(), 2.0)
+        self.assertAlmostEqual(box.size().length(), 2.0)
+        self.assertAlmostEqual(box.size().width(), 4.0)
+        self.assertAlmostEqual(mat.transform_polygon(polygon).area(), 8.0)
+
     def test_mul(self):
         mat_0 = Matrix2D()
         mat_1 = mat_0 * mat_0
         # mat_1 = Matrix2D(2.0, 0.0, 2.0, 2.0, 2.0, 1.0)
         self.assertEqual(mat_1, Matrix2D())
+
+    def test_matrix_array(self):
+        matrices = [Matrix2D(), Matrix2D(2.0, 0.0, 2.0, 2.0, 2.0, 1.0),
+                    Matrix2D(5, 4, 5, 4, 0, 0), Matrix2D(0, -1, 1, 0, 3, -2)]
+        array = Matrix2DArray(matrices)
+        self.assertEqual(len(array), 4)
+        self.assertEqual(array.det(), [m.det() for m in matrices])
+        inverted = array.inverted()
+        for i, matrix in enumerate(matrices):
+            self.assertEqual(repr(inverted.matrix(i)), repr(matrix.inverted()))
+
+        # elementwise product, same as Matrix2D *= Matrix2D
+        rhs = Matrix2DArray.make_poses([(1, 2), (3, 4), (5, 6), (7, 8)], [0, 90, 180, -45])
+        product = array * rhs
+        for i, matrix in enumerate(matrices):
+            expected = Matrix2D(matrix.m11(), matrix.m12(), matrix.m21(), matrix.m22(),
+                                matrix.dxtf(), matrix.dytf())
+            expected *= rhs.matrix(i)
+            self.assertEqual(repr(product.matrix(i)), repr(expected))
+        self.assertEqual(repr(array.matrix(1)), repr(matrices[1]))
+
+        broadcast = array * Matrix2D.make_translation(1, 1)
+        self.assertEqual(broadcast.transform_point(Vector2D(0, 0)),
+                         [m.transform(Vector2D(1, 1)) for m in matrices])
+        left = Matrix2DArray([Matrix2D.make_scaling(2, 2)]) * array
+        self.assertEqual(left.transform_points([(1, 0)] * 4),
+                         [m.transform(Vector2D(1, 0)) * 2 for m in matrices])
+        self.assertRaises(Exception, array.__mul__, Matrix2DArray.make_identities(3))
+
+    def test_matrix_array_transform(self):
+        array = Matrix2DArray.make_rotations([0, 90, 180])
+        points = array.transform_point(Vector2D(1, 0))
+        self.assertTrue(points[0].equals_weakly(Vector2D(1, 0)))
+        self.assertTrue(points[1].equals_weakly(Vector2D(0, 1)))
+        self.assertTrue(points[2].equals_weakly(Vector2D(-1, 0)))
+
+        array = Matrix2DArray.make_translations([Vector2D(1, 1), Vector2D(2, 0)])
+        self.assertEqual(array.transform_points([(0, 0), (1, 1)]),
+                         [Vector2D(1, 1), Vector2D(3, 1)])
+        coords = [0, 0, 1, 1]
+        array.transform_coords(coords, coords)
+        self.assertEqual(coords, [1, 1, 3, 1])
+        self.assertRaises(Exception, array.transform_points, [(0, 0)])
+        self.assertEqual(len(Matrix2DArray.make_identities(5).inverted()), 5)
@@ -2,10 +2,12 @@
     to test pyrusgeom Polygon2D class
 """
 from cmath import sqrt
+import math
 from unittest import TestCase
-from pyrusgeom.polygon_2d import Polygon2D
+from pyrusgeom.polygon_2d import Polygon2D, SimplifyType, JoinType
 from pyrusgeom.vector_2d import Vector2D
 from pyrusgeom.rect_2d import Rect2D
+from pyrusgeom.line_2d import Line2D
 
 class TestPolygon2D(TestCase):
     """Polygon2D class
@@ -34,6 +36,14 @@ class TestPolygon2D(TestCase):
         plg_1.add_vertex(Vector2D(0,15))
         self.assertCountEqual(plg_1.vertices(),self.input_points_2)
 
+    def test_remove_duplicate_vertices(self):
+        plg = Polygon2D([Vector2D(0, 0), Vector2D(1, 0), Vector2D(1, 0), Vector2D(1, 1),
+                         Vector2D(0.0001, 0.0)])
+        self.assertIs(plg.remove_duplicate_vertices(), plg)
+        self.assertEqual(len(plg.vertices()), 4)
+        plg.remove_duplicate_vertices(0.001)
+        self.assertEqual(plg.vertices(), [Vector2D(0, 0), Vector2D(1, 0), Vector2D(1, 1)])
+
     def test_get_bounding_box(self):
         plg_0 = Polygon2D(self.input_points_0)
         rect_0 = plg_0.get_bounding_box()
@@ -91,3 +101,98 @@ class TestPolygon2D(TestCase):
         rect = Rect2D(Vector2D(-10, -20), 20, 20)
         plg_5 = plg_3.get_rectangle_clipped_polygon(rect)
         self.assertEqual(plg_5.vertices(),ans_plg)
+
+    def test_get_convex_clipped_polygon(self):
+        plg_3 = Polygon2D(self.input_points_3)
+        diamond = Polygon2D([Vector2D(0, -15), Vector2D(15, 0), Vector2D(0, 15), Vector2D(-15, 0)])
+        clipped = plg_3.get_convex_clipped_polygon(diamond)
+        self.assertEqual(len(clipped.vertices()), 8)
+        self.assertAlmostEqual(clipped.area(), 400 - 4 * 12.5)
+        clipped_cw = plg_3.get_convex_clipped_polygon(
+            Polygon2D(list(reversed(diamond.vertices()))))
+        self.assertAlmostEqual(clipped_cw.area(), clipped.area())
+
+        rect = Rect2D(Vector2D(-10, -20), 20, 20)
+        rect_plg = Polygon2D([rect.top_left(), rect.top_right(),
+                              rect.bottom_right(), rect.bottom_left()])
+        plg_5 = Polygon2D(self.input_points_2).get_convex_clipped_polygon(rect_plg)
+        self.assertCountEqual(plg_5.vertices(), [Vector2D(10, -10), Vector2D(10.0, 0.0),
+                                                 Vector2D(-10.0, 0.0), Vector2D(-10, -10)])
+
+    def test_get_half_planes_clipped_polygon(self):
+        half_planes = [Line2D(Vector2D(0, 0), Vector2D(1, 1))]
+        points = Polygon2D.get_half_planes_clipped_polygon(self.input_points_3, half_planes)
+        self.assertAlmostEqual(Polygon2D(points).area(), 200)
+        for point in points:
+            self.assertGreaterEqual(point.y() - point.x(), -1.0e-9)
+        half_planes.append(Line2D(Vector2D(0, 0), Vector2D(-1, -1)))
+        points = Polygon2D.get_half_planes_clipped_polygon(self.input_points_3, half_planes)
+        self.assertAlmostEqual(Polygon2D(points).area(), 0)
+        far_plane = [Line2D(Vector2D(0, 20), Vector2D(1, 20))]
+        self.assertEqual(Polygon2D.get_half_planes_clipped_polygon(self.input_points_3,
+                                                                   far_plane), [])
+
+    def test_simplified(self):
+        circle_points = [Vector2D.from_polar(10.0 + 0.01 * (i % 2), i * 0.5) for i in range(720)]
+        plg_0 = Polygon2D(circle_points)
+        for m_type in (SimplifyType.DOUGLAS_PEUCKER, SimplifyType.VISVALINGAM_WHYATT):
+            simple = plg_0.simplified(0.1, m_type)
+            self.assertLess(len(simple.vertices()), len(circle_points) // 10)
+            self.assertGreaterEqual(len(simple.vertices()), 3)
+            for point in circle_points:
+                self.assertLessEqual(simple.dist(point, False), 0.1 + 1.0e-9)
+            self.assertAlmostEqual(simple.area(), plg_0.area(), delta=0.1 * 2 * math.pi * 10)
+
+        square = Polygon2D([Vector2D(0, 0), Vector2D(5, 0), Vector2D(10, 0), Vector2D(10, 10),
+                            Vector2D(5, 10), Vector2D(0, 10)])
+        for m_type in (SimplifyType.DOUGLAS_PEUCKER, SimplifyType.VISVALINGAM_WHYATT):
+            self.assertCountEqual(square.simplified(0.0, m_type).vertices(),
+                                  [Vector2D(0, 0), Vector2D(10, 0),
+                                   Vector2D(10, 10), Vector2D(0, 10)])
+        triangle = Polygon2D(self.input_points_1)
+        self.assertEqual(triangle.simplified(100.0).vertices(), self.input_points_1)
+        # a large tolerance still leaves a triangle
+        for m_type in (SimplifyType.DOUGLAS_PEUCKER, SimplifyType.VISVALINGAM_WHYATT):
+            simple = plg_0.simplified(100.0, m_type)
+            self.assertEqual(len(simple.vertices()), 3)
+            self.assertGreater(simple.area(), 0.0)
+            self.assertTrue(simple.contains(Vector2D(0, 0)))
+
+        # a long nearly collinear run is merged into one edge
+        run = [Vector2D(i * 0.01, 1.0e-4 * (i % 3)) for i in range(2000)]
+        plg_1 = Polygon2D(run + [Vector2D(20, 10), Vector2D(0, 10)])
+        simple = plg_1.simplified(0.01, SimplifyType.VISVALINGAM_WHYATT)
+        self.assertLessEqual(len(simple.vertices()), 6)
+        for point in run:
+            self.assertLessEqual(simple.dist(point, False), 0.01 + 1.0e-9)
+
+    def test_minkowski_sum(self):
+        plg_4 = Polygon2D(self.input_points_3)
+        plg_2 = Polygon2D(self.input_points_1)
+        plg_sum = plg_4.minkowski_sum(plg_2)
+        self.assertEqual(plg_sum.vertices(), [Vector2D(-10, -10), Vector2D(14, -10),
+                                              Vector2D(14, 10), Vector2D(10, 13),
+                                              Vector2D(-10, 13)])
+        self.assertTrue(plg_sum.is_counter_clockwise())
+        plg_point = Polygon2D([Vector2D(1, 2)])
+        self.assertEqual(plg_4.minkowski_sum(plg_point).area(), plg_4.area())
+
+    def test_offset(self):
+        plg_4 = Polygon2D(self.input_points_3)
+        miter = plg_4.offset(1.0, JoinType.MITER)
+        self.assertCountEqual(miter.vertices(), [Vector2D(11, 11), Vector2D(-11, 11),
+                                                 Vector2D(-11, -11), Vector2D(11, -11)])
+        rounded = plg_4.offset(1.0, JoinType.ROUND, 32)
+        exact_area = 400 + 4 * 20 + math.pi
+        self.assertGreaterEqual(rounded.area(), exact_area)
+        self.assertLess(rounded.area(), exact_area + 0.1)
+        for point in (Vector2D(10.7, 10.7), Vector2D(0, -10.99), Vector2D(-10.5, 3)):
+            self.assertTrue(rounded.contains(point))
+        self.assertFalse(rounded.contains(Vector2D(10.8, 10.8)))
+        shrunk = plg_4.offset(-2.0)
+        self.assertCountEqual(shrunk.vertices(), [Vector2D(8, 8), Vector2D(-8, 8),
+                                                  Vector2D(-8, -8), Vector2D(8, -8)])
+        self.assertEqual(plg_4.offset(-20.0).vertices(), [])
+        circle = Polygon2D([Vector2D(1, 1)]).offset(2.0, JoinType.ROUND, 16)
+        self.assertEqual(len(circle.vertices()), 16)
+        self.assertAlmostEqual(circle.dist(Vector2D(1, 1), False), 2.0)
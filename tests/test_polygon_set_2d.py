@@ -0,0 +1,59 @@
+""" test_polygon_set_2d.py file
+    to test pyrusgeom PolygonSet2D class
+"""
+from unittest import TestCase
+from pyrusgeom.polygon_set_2d import PolygonSet2D
+from pyrusgeom.polygon_2d import Polygon2D
+from pyrusgeom.vector_2d import Vector2D
+
+
+class TestPolygonSet2D(TestCase):
+    """TestPolygonSet2D class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+    input_points_0 = [Vector2D(7, 7), Vector2D(7, -7), Vector2D(-7, -7), Vector2D(-7, 7),
+                      Vector2D(9, 0), Vector2D(-9, 0), Vector2D(0, 9), Vector2D(0, -9)]
+    input_points_1 = [Vector2D(0, 0), Vector2D(0, 3), Vector2D(4, 0)]
+    input_points_2 = [Vector2D(10, 10), Vector2D(0, 15), Vector2D(-10, 10),
+                      Vector2D(-10, -10), Vector2D(10, -10)]
+    input_points_3 = [Vector2D(10, 10), Vector2D(-10, 10), Vector2D(-10, -10), Vector2D(10, -10)]
+
+    def test_areas(self):
+        plg_set = PolygonSet2D([self.input_points_0, Polygon2D(self.input_points_1),
+                                self.input_points_2, self.input_points_3, [Vector2D(1, 1)]])
+        self.assertEqual(len(plg_set), 5)
+        self.assertEqual(plg_set.double_signed_areas(), [-375, -12, 900, 800, 0])
+        self.assertEqual(plg_set.areas(), [187.5, 6, 450, 400, 0])
+        self.assertEqual(plg_set.orientations(), [-1, -1, 1, 1, 0])
+        self.assertTrue(plg_set.is_clockwise(1))
+        self.assertTrue(plg_set.is_counter_clockwise(3))
+        for i, points in enumerate([self.input_points_0, self.input_points_1,
+                                    self.input_points_2, self.input_points_3]):
+            self.assertEqual(plg_set.double_signed_areas()[i],
+                             Polygon2D(points).double_signed_area())
+            self.assertEqual(plg_set.polygon(i).vertices(), points)
+
+    def test_centroids_bounding_boxes(self):
+        plg_set = PolygonSet2D([self.input_points_1, self.input_points_3, [Vector2D(1, 2)]])
+        centroids = plg_set.centroids()
+        self.assertTrue(centroids[0].equals_weakly(Vector2D(4 / 3, 1)))
+        self.assertTrue(centroids[1].equals_weakly(Vector2D(0, 0)))
+        self.assertEqual(centroids[2], Vector2D(1, 2))
+        boxes = plg_set.bounding_boxes()
+        self.assertEqual(boxes[0].top_left(), Vector2D(0, 0))
+        self.assertEqual(boxes[0].bottom_right(), Vector2D(4, 3))
+        self.assertEqual(boxes[1].top_left(), Vector2D(-10, -10))
+        self.assertEqual(boxes[1].bottom_right(), Vector2D(10, 10))
+
+    def test_set_polygon(self):
+        plg_set = PolygonSet2D([self.input_points_1, self.input_points_3, self.input_points_1])
+        self.assertEqual(plg_set.double_signed_areas(), [-12, 800, -12])
+        plg_set.set_polygon(1, self.input_points_2)
+        self.assertEqual(plg_set.double_signed_areas(), [-12, 900, -12])
+        self.assertEqual(plg_set.polygon(2).vertices(), self.input_points_1)
+        plg_set.set_polygon(0, list(reversed(self.input_points_1)))
+        self.assertEqual(plg_set.orientations(), [1, 1, -1])
+        self.assertEqual(plg_set.double_signed_areas(), [12, 900, -12])
+        self.assertEqual(plg_set.offsets_(), [0, 3, 8, 11])
@@ -0,0 +1,95 @@
+""" test_reach_table.py file
+    to test pyrusgeom ReachTable class
+"""
+import random
+from unittest import TestCase
+from pyrusgeom.reach_table import ReachTable
+from pyrusgeom.player_type import PlayerType
+from pyrusgeom import soccer_math as sm
+
+class TestReachTable(TestCase):
+    """TestReachTable class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+    player_type = PlayerType()
+
+    def test_dash(self):
+        table = ReachTable(self.player_type, 30)
+        self.assertEqual(table.max_step(), 30)
+        self.assertEqual(table.dash_dirs(), [0, 45, 90, 135, 180, -135, -90, -45])
+        forward = sm.dash_distances(self.player_type, 1.0, 30)
+        back = sm.dash_distances(self.player_type, 0.7, 30)
+        for n_step in range(31):
+            self.assertEqual(table.dash_distance(n_step), forward[n_step])
+            self.assertEqual(table.dash_distance(n_step, 170), back[n_step])
+            self.assertEqual(table.dash_distance(n_step, -180), back[n_step])
+        self.assertEqual(table.reach_distance(10, 3), forward[7])
+        self.assertEqual(table.reach_distance(3, 3), 0.0)
+
+        rng = random.Random(50)
+        for dist in [rng.uniform(0, forward[-1]) for _ in range(300)] + forward[1:]:
+            expected = next(n for n, d in enumerate(forward) if d >= dist)
+            self.assertEqual(table.dash_cycles(dist), expected)
+        self.assertEqual(table.dash_cycles(-1.0), 0)
+        self.assertEqual(table.dash_cycles(forward[-1] + 0.1), -1)
+        self.assertEqual(table.dash_cycles_array([1.0, 0.6, 100.0]), [2, 1, -1])
+
+    def test_turn(self):
+        table = ReachTable(self.player_type)
+        self.assertEqual(table.turn_cycles(-5.0, 0.0), 0)
+        self.assertEqual(table.turn_cycles(90.0, 0.0), 1)
+        self.assertEqual(table.turn_cycles(170.0, 1.0), 3)
+        # off-grid speeds give the same counts as the direct computation
+        rng = random.Random(5)
+        for _ in range(3000):
+            angle = rng.uniform(0.0, 200.0)
+            speed = rng.uniform(0.0, 1.2)
+            self.assertEqual(table.turn_cycles(angle, speed),
+                             sm.turn_cycles(angle, speed, self.player_type))
+        for speed in (0.0005, 0.2345678, 0.9999):
+            for angle in range(0, 181, 5):
+                self.assertEqual(table.turn_cycles(angle, speed),
+                                 sm.turn_cycles(angle, speed, self.player_type))
+        self.assertEqual(table.turn_cycles(170.0, 5.0),
+                         sm.turn_cycles(170.0, 5.0, self.player_type))
+
+    def test_reach_cycles(self):
+        table = ReachTable(self.player_type)
+        # forward, 1 turn then forward, back dash without turn
+        self.assertEqual(table.reach_cycles(8.915, 0.0, 0.0), 10)
+        self.assertEqual(table.reach_cycles(8.915, 90.0, 0.0), 11)
+        self.assertEqual(table.reach_cycles(3.0, 180.0, 0.0, 5.0),
+                         table.dash_cycles(3.0, 180.0))
+        self.assertEqual(table.reach_cycles(0.0, 90.0, 0.0), 0)
+        self.assertEqual(table.reach_cycles(1000.0, 0.0, 0.0), -1)
+        self.assertEqual(table.reach_cycles_array([8.915, 8.915], [0.0, 90.0], 0.0), [10, 11])
+        self.assertEqual(table.can_reach_array([8.915, 8.915, 1000.0], [0.0, 90.0, 0.0], 0.0, 10),
+                         [True, False, False])
+
+    def test_instance(self):
+        ReachTable.clear_instances()
+        table = ReachTable.instance(self.player_type)
+        self.assertIs(ReachTable.instance(self.player_type, 20), table)
+        # same parameters share a table
+        self.assertIs(ReachTable.instance(PlayerType()), table)
+        self.assertIsNot(ReachTable.instance(PlayerType(player_speed_max=0.9)), table)
+        longer = ReachTable.instance(self.player_type, 80)
+        self.assertIsNot(longer, table)
+        self.assertEqual(longer.max_step(), 80)
+
+        coarse = ReachTable.instance(self.player_type, 20, 0.5, 0.01)
+        self.assertIsNot(coarse, longer)
+        self.assertEqual(coarse.dist_resolution(), 0.5)
+        rebuilt = ReachTable.instance(self.player_type, 100, 0.5, 0.01)
+        self.assertIsNot(rebuilt, coarse)
+        self.assertEqual(rebuilt.max_step(), 100)
+        self.assertEqual(rebuilt.dist_resolution(), 0.5)
+        self.assertEqual(rebuilt.speed_resolution(), 0.01)
+        self.assertIs(ReachTable.instance(self.player_type, 80), longer)
+
+    def test_player_type_equality(self):
+        self.assertEqual(PlayerType(), PlayerType())
+        self.assertEqual(hash(PlayerType()), hash(PlayerType()))
+        self.assertNotEqual(PlayerType(), PlayerType(player_decay=0.5))
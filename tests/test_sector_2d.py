@@ -0,0 +1,126 @@
+""" test_sector_2d.py file
+    to test pyrusgeom Sector2D class
+"""
+import math
+import random
+from unittest import TestCase
+from pyrusgeom.sector_2d import Sector2D
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.vector_2d import Vector2D
+
+
+class TestSector2D(TestCase):
+    """TestSector2D class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+
+    def test_contains_points(self):
+        sector = Sector2D(Vector2D(1, 2), 0, 10, -30, 60)
+        points = [(1, 2), (6, 2), (1, 12), (5, 1), (1, -3),
+                  (12, 2), (-4, 2), (6, 7)]
+        self.assertEqual(sector.contains_points(points),
+                         [True, True, False, True, False, False, False, True])
+        self.assertEqual(sector.contains_points([Vector2D(p[0], p[1]) for p in points]),
+                         [sector.contains(Vector2D(p[0], p[1])) for p in points])
+
+    def test_contains_points_parity(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            center = Vector2D(rng.uniform(-10, 10), rng.uniform(-10, 10))
+            start = rng.choice([0, 45, 90, -90, 180, rng.uniform(-180, 180)])
+            end = rng.choice([0, 45, 90, 180, start, start + 180, rng.uniform(-180, 180)])
+            sector = Sector2D(center, 0, rng.choice([3, 5, 10]), start, end)
+            points = [Vector2D(center.x() + rng.uniform(-12, 12),
+                               center.y() + rng.uniform(-12, 12)) for _ in range(50)]
+            for angle in (start, end, 0, 45, 90, 180):
+                for r in (0, 1, 3, 5, 10):
+                    points.append(Vector2D(center.x() + r * math.cos(math.radians(angle)),
+                                           center.y() + r * math.sin(math.radians(angle))))
+                    points.append(Vector2D(center.x() + r, center.y() + r))
+            self.assertEqual(sector.contains_points(points),
+                             [sector.contains(p) for p in points])
+
+    def test_contains_mask(self):
+        sectors = [Sector2D(Vector2D(0, 0), 0, 10, -45, 45),
+                   Sector2D(Vector2D(0, 0), 0, 10, 135, -135),
+                   Sector2D(Vector2D(5, 5), 0, 3, 0, 180)]
+        points = [(5, 0), (-5, 0), (5, 7), (0, 5), (5, 3)]
+        self.assertEqual(Sector2D.contains_mask(sectors, points),
+                         [[True, False, False],
+                          [False, True, False],
+                          [False, False, True],
+                          [False, False, False],
+                          [True, False, False]])
+        sectors[0].assign(Vector2D(0, 0), 0, 10, 45, 135)
+        self.assertEqual(sectors[0].contains_points(points),
+                         [False, False, True, True, False])
+
+    def test_contains_points_after_change(self):
+        sector = Sector2D(Vector2D(0, 0), 0, 10, -45, 45)
+        self.assertEqual(sector.contains_points([Vector2D(5, 0)]), [True])
+        sector.center_().assign(100, 0)
+        self.assertEqual(sector.contains_points([Vector2D(5, 0)]), [False])
+        self.assertFalse(sector.contains_coord(5, 0))
+        self.assertEqual(Sector2D.contains_mask([sector], [(105, 0)]), [[True]])
+        sector.angle_left_start_().set_degree(90)
+        self.assertEqual(sector.contains_points([(105, 0), (100, 5)]),
+                         [sector.contains(Vector2D(105, 0)), sector.contains(Vector2D(100, 5))])
+
+    def test_get_visible_circles(self):
+        sector = Sector2D(Vector2D(0, 0), 0, 20, -45, 45)
+        centers = [Vector2D(0, 0), Vector2D(5, 0), Vector2D(10, 0), Vector2D(10, 4),
+                   Vector2D(0, 10), Vector2D(30, 0), Vector2D(10, -1.5)]
+        visible = sector.get_visible_circles(centers, 1.0)
+        self.assertEqual([index for index, _ in visible], [1, 3, 6])
+
+        spans = dict(visible)
+        half = math.degrees(math.asin(1.0 / 5.0))
+        self.assertEqual(len(spans[1]), 1)
+        self.assertAlmostEqual(spans[1][0][0].degree(), -half)
+        self.assertAlmostEqual(spans[1][0][1].degree(), half)
+        self.assertEqual(len(spans[3]), 1)
+        self.assertAlmostEqual(spans[3][0][1].degree(),
+                               math.degrees(math.atan2(4, 10)
+                                            + math.asin(1.0 / math.hypot(10, 4))))
+        self.assertAlmostEqual(spans[6][0][0].degree(),
+                               math.degrees(math.atan2(-1.5, 10)
+                                            - math.asin(1.0 / math.hypot(10, 1.5))))
+        self.assertAlmostEqual(spans[6][0][1].degree(), -half)
+
+        # the span of a circle is split by a nearer one
+        visible = dict(sector.get_visible_circles([(10, 0), (5, 0)], [3.0, 0.5]))
+        self.assertEqual(len(visible[0]), 2)
+        self.assertEqual(len(visible[1]), 1)
+        self.assertEqual(sector.get_visible_circles([], 1.0), [])
+
+    def test_get_visible_circles_mixed_radii(self):
+        sector = Sector2D(Vector2D(0, 0), 0, 20, AngleDeg(-90), AngleDeg(90))
+        small = Vector2D.polar2vector(3, 50)
+        visible = dict(sector.get_visible_circles([Vector2D(12, 0), small], [10, 0.1]))
+        self.assertEqual(sorted(visible), [0, 1])
+        half = math.degrees(math.asin(0.1 / 3))
+        self.assertEqual(len(visible[1]), 1)
+        self.assertAlmostEqual(visible[1][0][0].degree(), 50 - half)
+        self.assertAlmostEqual(visible[1][0][1].degree(), 50 + half)
+        # the large circle is split by the small one in front of it
+        self.assertEqual(len(visible[0]), 2)
+
+        # a small circle behind a large one is hidden
+        visible = dict(sector.get_visible_circles([(4, 0), (9, 0.5)], [2, 0.3]))
+        self.assertEqual(sorted(visible), [0])
+
+    def test_get_visible_circles_min_radius(self):
+        sector = Sector2D(Vector2D(0, 0), 5, 20, -45, 45)
+        self.assertEqual(sector.radius_min(), 5)
+        # the circle inside the min radius does not hide the farther one
+        visible = dict(sector.get_visible_circles([(3, 0), (10, 0)], 1.0))
+        self.assertEqual(sorted(visible), [1])
+        self.assertEqual(sorted(dict(Sector2D(Vector2D(0, 0), 0, 20, -45, 45)
+                                     .get_visible_circles([(3, 0), (10, 0)], 1.0))), [0])
+
+        # a circle crossing the min radius hides the farther one only where it reaches it
+        visible = dict(sector.get_visible_circles([(5, 0), (10, 0)], [1.0, 3.0]))
+        self.assertEqual(sorted(visible), [0, 1])
+        self.assertEqual(len(visible[1]), 2)
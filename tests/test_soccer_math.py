@@ -0,0 +1,240 @@
+""" test_soccer_math.py file
+    to test pyrusgeom soccer_math functions
+"""
+import math
+import random
+from fractions import Fraction
+from unittest import TestCase
+from pyrusgeom import soccer_math as sm
+from pyrusgeom.soccer_math import predict_intercepts
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.decay_table import DecayTable
+from pyrusgeom.player_type import PlayerType
+from pyrusgeom.vector_2d import Vector2D
+
+RNG = random.Random(46)
+SIZE = 200
+
+
+def intercept_cycle(pos, vel, body, player_type, ball_points):
+    """find the intercept cycle of one player by a plain per-cycle loop
+    """
+    n_max = len(ball_points)
+    control = player_type.kickable_area()
+    forward = sm.dash_distances(player_type, 1.0, n_max)
+    for step in range(1, n_max + 1):
+        self_pos = sm.inertia_n_step_point(pos, vel, step, player_type.player_decay())
+        ball = Vector2D(ball_points[step - 1][0], ball_points[step - 1][1])
+        dist = self_pos.dist(ball)
+        gap = dist - control
+        if gap <= 0.0:
+            return step
+        rel = AngleDeg.normalize_angle((ball - self_pos).th().degree() - body)
+        tolerance = math.degrees(math.asin(control / dist))
+        n_turn = sm.turn_cycles(math.fabs(rel) - tolerance, vel.r(), player_type)
+        if n_turn < step and forward[step - n_turn] >= gap:
+            return step
+        angle_step = player_type.dash_angle_step()
+        dash_dir = AngleDeg.normalize_angle(round(rel / angle_step) * angle_step)
+        if math.fabs(AngleDeg.normalize_angle(rel - dash_dir)) <= tolerance:
+            rate = sm.dir_rate(dash_dir, player_type.back_dash_rate(),
+                               player_type.side_dash_rate())
+            if sm.dash_distances(player_type, rate, n_max)[step] >= gap:
+                return step
+    return -1
+
+
+class TestSoccerMath(TestCase):
+    """TestSoccerMath class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+    size = SIZE
+    dists = [RNG.uniform(0.0, 60.0) for _ in range(SIZE)]
+    dirs = [RNG.uniform(-180.0, 180.0) for _ in range(SIZE)] + [-180, -90, 0, 90, 180]
+    powers = [RNG.uniform(-100.0, 100.0) for _ in range(SIZE)]
+    speeds = [RNG.uniform(0.0, 3.0) for _ in range(SIZE)]
+    steps = [RNG.randint(0, 50) for _ in range(SIZE)]
+
+    def test_broadcast(self):
+        self.assertEqual(sm.broadcast(1, [2, 3], (4,)), [[1, 1], [2, 3], [4, 4]])
+        self.assertEqual(sm.broadcast(1, 2), [[1], [2]])
+        self.assertRaises(Exception, sm.broadcast, [1, 2], [1, 2, 3])
+
+    def test_kick_rate_array(self):
+        self.assertEqual(sm.kick_rate_array(self.dists, self.dirs[:self.size], 0.027,
+                                            0.042, 0.3, [0.7] * self.size),
+                         [sm.kick_rate(d, a, 0.027, 0.042, 0.3, 0.7)
+                          for d, a in zip(self.dists, self.dirs)])
+
+    def test_dir_rate_array(self):
+        self.assertEqual(sm.dir_rate_array(self.dirs, 0.7, 0.4),
+                         [sm.dir_rate(d, 0.7, 0.4) for d in self.dirs])
+
+    def test_effective_turn_array(self):
+        self.assertEqual(sm.effective_turn_array(self.dirs[:self.size], self.speeds, 5.0),
+                         [sm.effective_turn(d, s, 5.0) for d, s in zip(self.dirs, self.speeds)])
+
+    def test_speed_arrays(self):
+        self.assertEqual(sm.final_speed_array(self.powers, 0.006, 0.8, 0.4),
+                         [sm.final_speed(p, 0.006, 0.8, 0.4) for p in self.powers])
+        self.assertEqual(sm.can_over_speed_max_array(self.powers, 0.006, 0.8, 0.4, 0.5),
+                         [sm.can_over_speed_max(p, 0.006, 0.8, 0.4, 0.5) for p in self.powers])
+
+    def test_inertia_arrays(self):
+        self.assertEqual(sm.inertia_n_step_distance_array(self.speeds, self.steps, 0.94),
+                         [sm.inertia_n_step_distance(s, n, 0.94)
+                          for s, n in zip(self.speeds, self.steps)])
+        self.assertEqual(sm.inertia_final_distance_array(self.speeds, [0.94, 0.4] * 100),
+                         [sm.inertia_final_distance(s, d)
+                          for s, d in zip(self.speeds, [0.94, 0.4] * 100)])
+
+    def test_decay_table(self):
+        table = DecayTable.instance(0.94)
+        vel = Vector2D(2.1, -0.7)
+        pos = Vector2D(3, 4)
+        for n_step in range(60):
+            self.assertEqual(sm.inertia_n_step_travel(vel, n_step, 0.94, table),
+                             sm.inertia_n_step_travel(vel, n_step, 0.94))
+            self.assertEqual(sm.inertia_n_step_point(pos, vel, n_step, 0.94, table),
+                             sm.inertia_n_step_point(pos, vel, n_step, 0.94))
+            self.assertEqual(sm.inertia_n_step_distance(2.3, n_step, 0.94, table),
+                             sm.inertia_n_step_distance(2.3, n_step, 0.94))
+        for sum_all in (-1.0, 0.0, 1.0, 5.5, 20.0, 40.0):
+            self.assertEqual(sm.calc_length_geom_series(2.0, sum_all, 0.94, table),
+                             sm.calc_length_geom_series(2.0, sum_all, 0.94))
+        self.assertEqual(sm.inertia_n_step_distance_array(self.speeds, self.steps, 0.94, table),
+                         sm.inertia_n_step_distance_array(self.speeds, self.steps, 0.94))
+
+    def test_decay_table_mismatch(self):
+        table = DecayTable.instance(0.94)
+        vel = Vector2D(1.0, 0.0)
+        self.assertEqual(sm.inertia_n_step_travel(vel, 10, 0.4, table),
+                         sm.inertia_n_step_travel(vel, 10, 0.4))
+        self.assertEqual(sm.inertia_n_step_point(Vector2D(1, 2), vel, 10, 0.4, table),
+                         sm.inertia_n_step_point(Vector2D(1, 2), vel, 10, 0.4))
+        self.assertEqual(sm.inertia_n_step_distance(1.0, 10, 0.4, table),
+                         sm.inertia_n_step_distance(1.0, 10, 0.4))
+        self.assertEqual(sm.calc_length_geom_series(2.0, 3.0, 0.4, table),
+                         sm.calc_length_geom_series(2.0, 3.0, 0.4))
+        self.assertEqual(sm.inertia_n_step_distance_array(self.speeds, self.steps, 0.4, table),
+                         sm.inertia_n_step_distance_array(self.speeds, self.steps, 0.4))
+        self.assertRaises(Exception, sm.inertia_n_step_distance_array, self.speeds,
+                          self.steps, [0.94, 0.4] * 100, table)
+
+    def test_inertia_trajectories(self):
+        positions = [Vector2D(RNG.uniform(-50, 50), RNG.uniform(-30, 30)) for _ in range(20)]
+        velocities = [Vector2D(RNG.uniform(-2, 2), RNG.uniform(-2, 2)) for _ in range(20)]
+        points, speeds = sm.inertia_trajectories(positions, velocities, 30, 0.94)
+        self.assertEqual(len(points), 20)
+        self.assertEqual(len(points[0]), 30)
+        for pos, vel, trajectory, speed in zip(positions, velocities, points, speeds):
+            for step in range(1, 31):
+                point = sm.inertia_n_step_point(pos, vel, step, 0.94)
+                self.assertEqual(trajectory[step - 1], (point.x(), point.y()))
+                self.assertAlmostEqual(speed[step - 1], vel.r() * 0.94 ** step)
+
+        steps = list(sm.inertia_trajectory_steps(positions, velocities, 30, 0.94))
+        self.assertEqual([step for step, _, _ in steps], list(range(1, 31)))
+        for step, step_points, step_speeds in steps:
+            self.assertEqual(step_points, [trajectory[step - 1] for trajectory in points])
+            self.assertEqual(step_speeds, [speed[step - 1] for speed in speeds])
+
+        self.assertEqual(sm.inertia_trajectories(positions, velocities, 30, 0.4,
+                                                 DecayTable.instance(0.94)),
+                         sm.inertia_trajectories(positions, velocities, 30, 0.4))
+        self.assertEqual(list(sm.inertia_trajectory_steps(positions, velocities, 30, 0.4,
+                                                          DecayTable.instance(0.94))),
+                         list(sm.inertia_trajectory_steps(positions, velocities, 30, 0.4)))
+
+        points, _ = sm.inertia_trajectories([(0, 0)], [(1, 0), (0, 2)], 2, 0.5)
+        self.assertEqual(points, [[(1.0, 0.0), (1.5, 0.0)], [(0.0, 2.0), (0.0, 3.0)]])
+        self.assertRaises(Exception, sm.inertia_trajectories, [(0, 0), (1, 1)],
+                          [(1, 0), (0, 2), (1, 1)], 2, 0.5)
+
+    def test_turn_dash_model(self):
+        player_type = PlayerType()
+        self.assertAlmostEqual(player_type.kickable_area(), 1.085)
+        self.assertEqual(sm.turn_cycles(-5.0, 0.0, player_type), 0)
+        self.assertEqual(sm.turn_cycles(90.0, 0.0, player_type), 1)
+        # 30 + 60 + 100 degrees with the speed 1.0, 0.4, 0.16
+        self.assertEqual(sm.turn_cycles(170.0, 1.0, player_type), 3)
+
+        # same as accelerating, moving and decaying step by step
+        distances = sm.dash_distances(player_type, 1.0, 20)
+        speed = 0.0
+        dist = 0.0
+        for step in range(1, 21):
+            speed = min(speed + 0.6, 1.05)
+            dist += speed
+            speed *= 0.4
+            self.assertAlmostEqual(distances[step], dist)
+
+    def test_predict_intercepts(self):
+        player_type = PlayerType()
+        cycles, points = sm.predict_intercepts([(0, 0), (0, 0), (0, 0), (20, 0), (9.5, 0)],
+                                               [(0, 0)] * 5, [0, 180, 90, 0, 0], player_type,
+                                               [(10, 0)] * 20)
+        # 10 dashes, 1 turn + 10 dashes, 1 turn + 10 dashes, back dashes, already kickable
+        self.assertEqual(cycles, [10, 11, 11, 11, 1])
+        self.assertEqual(points[0], (10, 0))
+
+        cycles, points = sm.predict_intercepts([(0, 0)], [(0, 0)], [0], player_type,
+                                               [(50, 0)] * 10)
+        self.assertEqual(cycles, [-1])
+        self.assertEqual(points, [None])
+
+        # faster players reach earlier
+        slow = PlayerType(player_speed_max=0.8)
+        ball, _ = sm.inertia_trajectories([(0, 0)], [(2.0, 0.0)], 50, 0.94)
+        cycles, _ = sm.predict_intercepts([(30, 20), (30, 20)], [(0, 0), (0, 0)], [-90, -90],
+                                          [player_type, slow], ball[0])
+        self.assertGreater(cycles[0], 0)
+        self.assertGreater(cycles[1], cycles[0])
+        self.assertRaises(ValueError, sm.predict_intercepts, [(0, 0)], [], [0],
+                          player_type, ball[0])
+        self.assertRaises(ValueError, sm.predict_intercepts, [(0, 0)], [(0, 0)], [0, 0],
+                          player_type, ball[0])
+        self.assertRaises(ValueError, sm.predict_intercepts, [(0, 0), (1, 1)],
+                          [(0, 0), (0, 0)], [0, 0], [player_type], ball[0])
+
+        # any real number or AngleDeg is accepted as a body angle
+        cycles, _ = sm.predict_intercepts([(0, 0)] * 3, [(0, 0)] * 3,
+                                          [Fraction(180), AngleDeg(180), 180.0],
+                                          player_type, [(10, 0)] * 20)
+        self.assertEqual(cycles, [11, 11, 11])
+
+    def test_predict_intercepts_random(self):
+        rng = random.Random(49)
+        player_types = [PlayerType(),
+                        PlayerType(player_speed_max=0.9, player_decay=0.5, inertia_moment=7.0)]
+        for _ in range(30):
+            ball, _ = sm.inertia_trajectories([(rng.uniform(-20, 20), rng.uniform(-20, 20))],
+                                              [(rng.uniform(-2.5, 2.5), rng.uniform(-2.5, 2.5))],
+                                              40, 0.94)
+            positions = [Vector2D(rng.uniform(-30, 30), rng.uniform(-30, 30)) for _ in range(10)]
+            velocities = [Vector2D(rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5))
+                          for _ in range(10)]
+            bodies = [rng.uniform(-180, 180) for _ in range(10)]
+            types = [rng.choice(player_types) for _ in range(10)]
+            cycles, points = predict_intercepts(positions, velocities, bodies, types, ball[0])
+            self.assertEqual(cycles, [intercept_cycle(pos, vel, body, player_type, ball[0])
+                                      for pos, vel, body, player_type
+                                      in zip(positions, velocities, bodies, types)])
+            self.assertEqual(points, [ball[0][cycle - 1] if cycle > 0 else None
+                                      for cycle in cycles])
+
+    def test_quantize_arrays(self):
+        values = self.dists + [0.05, 0.15, 2.5, -2.5]
+        self.assertEqual(sm.quantize_array(values, 0.1),
+                         [sm.quantize(v, 0.1) for v in values])
+        self.assertEqual(sm.quantize_dist_array(values[:self.size], 0.1),
+                         [sm.quantize_dist(v, 0.1) for v in values[:self.size]])
+        self.assertEqual(sm.unquantize_min_array(values, 0.1),
+                         [sm.unquantize_min(v, 0.1) for v in values])
+        self.assertEqual(sm.unquantize_max_array(values, 0.1),
+                         [sm.unquantize_max(v, 0.1) for v in values])
+        seen = [sm.quantize_dist(v, 0.1) for v in self.dists if v > 0.5]
+        self.assertEqual(sm.unquantize_error_array(seen, 0.1),
+                         [sm.unquantize_error(v, 0.1) for v in seen])
@@ -0,0 +1,82 @@
+""" test_triangle_2d.py file
+    to test pyrusgeom Triangle2D class
+"""
+import random
+from unittest import TestCase
+from pyrusgeom.triangle_2d import Triangle2D, triangle_coords
+from pyrusgeom.vector_2d import Vector2D
+
+
+class TestTriangle2D(TestCase):
+    """TestTriangle2D class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+    triangles = [Triangle2D(Vector2D(0, 0), Vector2D(4, 0), Vector2D(0, 3)),
+                 (Vector2D(4, 0), Vector2D(4, 3), Vector2D(0, 3)),
+                 ((10, 10), (12, 10), (11, 14)),
+                 ((-5, -5), (-1, -5), (-3, 0))]
+
+    def test_triangle_coords(self):
+        self.assertEqual(triangle_coords(self.triangles[:3]),
+                         [(0, 0, 4, 0, 0, 3), (4, 0, 4, 3, 0, 3), (10, 10, 12, 10, 11, 14)])
+
+    def test_contains_points(self):
+        rng = random.Random(7)
+        points = [Vector2D(rng.uniform(-1, 5), rng.uniform(-1, 4)) for _ in range(200)]
+        points += [Vector2D(2, 0), Vector2D(2, 1.5), Vector2D(0, 3), Vector2D(4, 3)]
+        v_a = Vector2D(0, 0)
+        v_b = Vector2D(4, 0)
+        v_c = Vector2D(0, 3)
+        self.assertEqual(Triangle2D.tri_contains_points(v_a, v_b, v_c, points),
+                         [Triangle2D.tri_contains(v_a, v_b, v_c, p) for p in points])
+        self.assertEqual(Triangle2D.tri_contains_points(v_c, v_b, v_a, [(2, 1.5), (4, 3)]),
+                         [True, False])
+
+        weights = Triangle2D.tri_barycentric_points(v_a, v_b, v_c, points)
+        for p, weight in zip(points, weights):
+            expected = Triangle2D.tri_barycentric(v_a, v_b, v_c, p)
+            for w_1, w_2 in zip(weight, expected):
+                self.assertAlmostEqual(w_1, w_2)
+        self.assertEqual(Triangle2D.tri_barycentric_points(v_a, v_a, v_a, [(1, 1)]),
+                         [(1.0 / 3.0, 1.0 / 3.0, 1.0 / 3.0)])
+
+    def test_contains_mask(self):
+        points = [(1, 1), (3, 2), (11, 12), (2, 1.5), (-3, -2), (20, 20)]
+        mask = Triangle2D.contains_mask(self.triangles, points)
+        self.assertEqual(mask, [[True, False, False, False],
+                                [False, True, False, False],
+                                [False, False, True, False],
+                                [True, True, False, False],
+                                [False, False, False, True],
+                                [False, False, False, False]])
+        self.assertEqual(Triangle2D.find_first_contains(self.triangles, points),
+                         [0, 1, 2, 0, 3, -1])
+        self.assertEqual(Triangle2D.find_first_contains([], points), [-1] * len(points))
+
+    def test_centers(self):
+        rng = random.Random(3)
+        triangles = [Triangle2D(Vector2D(rng.uniform(-50, 50), rng.uniform(-30, 30)),
+                                Vector2D(rng.uniform(-50, 50), rng.uniform(-30, 30)),
+                                Vector2D(rng.uniform(-50, 50), rng.uniform(-30, 30)))
+                     for _ in range(50)]
+        for center, triangle in zip(Triangle2D.centroids(triangles), triangles):
+            self.assertAlmostEqual(center.x(), (triangle.a().x() + triangle.b().x()
+                                                + triangle.c().x()) / 3.0)
+            self.assertAlmostEqual(center.y(), (triangle.a().y() + triangle.b().y()
+                                                + triangle.c().y()) / 3.0)
+        for centers, method in ((Triangle2D.incenters(triangles), Triangle2D.incenter),
+                                (Triangle2D.circumcenters(triangles),
+                                 Triangle2D.circumcenter),
+                                (Triangle2D.orthocenters(triangles), Triangle2D.orthocenter)):
+            for center, triangle in zip(centers, triangles):
+                expected = method(triangle)
+                self.assertAlmostEqual(center.x(), expected.x(), places=6)
+                self.assertAlmostEqual(center.y(), expected.y(), places=6)
+
+        degenerate = [((0, 0), (1, 1), (2, 2))]
+        self.assertFalse(Triangle2D.circumcenters(degenerate)[0].is_valid())
+        self.assertFalse(Triangle2D.orthocenters(degenerate)[0].is_valid())
+        self.assertFalse(Triangle2D.incenters(degenerate)[0].is_valid())
+        self.assertEqual(Triangle2D.centroids(degenerate)[0], Vector2D(1, 1))
@@ -1,5 +1,5 @@
 import unittest
-from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.vector_2d import Vector2D, unique_points, to_coords
 from pyrusgeom.angle_deg import AngleDeg
 
 
@@ -169,6 +169,22 @@ class Vector2DTest(unittest.TestCase):
         a = Vector2D(r=10, a=45)
         self.assertEqual(a.th(), 45)
         self.assertEqual(a.r(), 10)
+    def test_unique_points(self):
+        points = [Vector2D(1, 2), Vector2D(3, 4), Vector2D(1, 2), Vector2D(1.0005, 2.0005),
+                  Vector2D(-1, -1), Vector2D(3, 4)]
+        self.assertEqual(unique_points(points),
+                         [Vector2D(1, 2), Vector2D(3, 4), Vector2D(1.0005, 2.0005), Vector2D(-1, -1)])
+        self.assertIs(unique_points(points)[0], points[0])
+        self.assertEqual(unique_points(points, 0.001),
+                         [Vector2D(1, 2), Vector2D(3, 4), Vector2D(-1, -1)])
+        self.assertEqual(unique_points([Vector2D(0.0009, 0), Vector2D(-0.0009, 0)], 0.001),
+                         [Vector2D(0.0009, 0), Vector2D(-0.0009, 0)])
+        self.assertEqual(unique_points([Vector2D(0.0004, 0), Vector2D(-0.0004, 0)], 0.001),
+                         [Vector2D(0.0004, 0)])
+        self.assertEqual(unique_points([]), [])
+
+    def test_to_coords(self):
+        self.assertEqual(to_coords([Vector2D(1, 2), (3, 4), [5, 6]]), [(1, 2), (3, 4), (5, 6)])
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,87 @@
+""" test_voronoi_diagram.py file
+    to test pyrusgeom VoronoiDiagram class
+"""
+import random
+from unittest import TestCase
+from pyrusgeom.voronoi_diagram import VoronoiDiagram, VoronoiType
+from pyrusgeom.vector_2d import Vector2D
+from pyrusgeom.rect_2d import Rect2D
+
+
+class TestVoronoiDiagram(TestCase):
+    """TestVoronoiDiagram class
+
+    Args:
+        TestCase (UnitTest): fail if any of tests falis
+    """
+    pitch = Rect2D(-52.5, -34.0, 105.0, 68.0)
+
+    def test_ordinary(self):
+        sites = [Vector2D(-20, 0), Vector2D(20, 0)]
+        diagram = VoronoiDiagram(sites, self.pitch)
+        self.assertAlmostEqual(diagram.cell(0).area(), 52.5 * 68.0)
+        self.assertAlmostEqual(diagram.cell(1).area(), 52.5 * 68.0)
+        self.assertTrue(diagram.cell(0).contains(Vector2D(-1, 30)))
+        self.assertFalse(diagram.cell(0).contains(Vector2D(1, 30)))
+        self.assertEqual(diagram.find_cell(Vector2D(-1, 30)), 0)
+        self.assertEqual(diagram.find_cell(Vector2D(1, -30)), 1)
+
+        rng = random.Random(11)
+        sites = [Vector2D(rng.uniform(-50, 50), rng.uniform(-30, 30)) for _ in range(22)]
+        diagram = VoronoiDiagram(sites, self.pitch)
+        cells = diagram.cells()
+        self.assertAlmostEqual(sum(cell.area() for cell in cells), self.pitch.area())
+        for _ in range(200):
+            point = Vector2D(rng.uniform(-52.5, 52.5), rng.uniform(-34, 34))
+            nearest = min(range(len(sites)), key=lambda i: sites[i].dist2(point))
+            self.assertEqual(diagram.find_cell(point), nearest)
+            self.assertTrue(cells[nearest].contains(point))
+
+    def test_power(self):
+        sites = [Vector2D(-20, 0), Vector2D(20, 0)]
+        diagram = VoronoiDiagram(sites, self.pitch, [400.0, 0.0], VoronoiType.POWER)
+        # |p - s0|^2 - 400 = |p - s1|^2 -> x = 5
+        self.assertAlmostEqual(diagram.cell(0).area(), 57.5 * 68.0)
+        self.assertAlmostEqual(diagram.cell(1).area(), 47.5 * 68.0)
+        self.assertEqual(diagram.find_cell(Vector2D(4, 0)), 0)
+        self.assertEqual(diagram.find_cell(Vector2D(6, 0)), 1)
+
+        diagram = VoronoiDiagram(sites + [Vector2D(-19, 0)], self.pitch,
+                                 [0.0, 0.0, -1000.0], VoronoiType.POWER)
+        self.assertEqual(diagram.cell(2).vertices(), [])
+
+    def test_additive(self):
+        sites = [Vector2D(-20, 0), Vector2D(20, 0)]
+        diagram = VoronoiDiagram(sites, self.pitch, [0.0, 0.0], VoronoiType.ADDITIVE, 256)
+        self.assertAlmostEqual(diagram.cell(0).area(), 52.5 * 68.0, delta=20.0)
+
+        diagram = VoronoiDiagram(sites, self.pitch, [10.0, 0.0], VoronoiType.ADDITIVE, 256)
+        # |p - s0| - 10 = |p - s1| -> the hyperbola branch crosses the x axis at x = 5
+        self.assertEqual(diagram.find_cell(Vector2D(4, 0)), 0)
+        self.assertEqual(diagram.find_cell(Vector2D(6, 0)), 1)
+        self.assertGreater(diagram.cell(0).area(), diagram.cell(1).area())
+        self.assertTrue(diagram.cell(0).contains(Vector2D(4, 0)))
+        self.assertTrue(diagram.cell(1).contains(Vector2D(6, 0)))
+
+        diagram = VoronoiDiagram(sites, self.pitch, [50.0, 0.0], VoronoiType.ADDITIVE)
+        self.assertEqual(diagram.cell(1).vertices(), [])
+        self.assertAlmostEqual(diagram.cell(0).area(), self.pitch.area())
+
+    def test_duplicated_sites(self):
+        rect = Rect2D(-10.0, -10.0, 20.0, 20.0)
+        sites = [Vector2D(0, 0), Vector2D(0, 0), Vector2D(5, 0)]
+        for v_type, weights in ((VoronoiType.ORDINARY, None),
+                                (VoronoiType.POWER, None),
+                                (VoronoiType.ADDITIVE, None),
+                                (VoronoiType.POWER, [0.0, 4.0, 0.0]),
+                                (VoronoiType.ADDITIVE, [0.0, 1.0, 0.0])):
+            diagram = VoronoiDiagram(sites, rect, weights, v_type)
+            cells = diagram.cells()
+            owner = 0 if weights is None else 1
+            self.assertEqual(cells[1 - owner].vertices(), [])
+            self.assertGreater(cells[owner].area(), 0.0)
+            self.assertAlmostEqual(sum(cell.area() for cell in cells), rect.area(), delta=1.0)
+            self.assertEqual(diagram.find_cell(Vector2D(-5, 0)), owner)
+        diagram = VoronoiDiagram(sites, rect)
+        self.assertAlmostEqual(diagram.cell(0).area(), 250.0)
+        self.assertAlmostEqual(diagram.cell(2).area(), 150.0)